@@ -1,14 +1,51 @@
 from .base import BaseAgent
+from .browser_pool import BrowserPool, get_browser_pool, close_browser_pools
+from .shared_browser import SharedBrowser
+from .instrumentation import AgentHook, add_agent_hook, remove_agent_hook, summarize_timeline
+from .rate_limit import TokenBucket, ErrorKind, classify_error, get_agent_rate_limiter
+from .replay import (
+    Recording,
+    RecordBackend,
+    ReplayBackend,
+    ReplayLatency,
+    get_stagehand_backend,
+    set_stagehand_backend,
+    synthesize_recording,
+)
+from .extractors import SiteExtractor, get_extractor
 from .research import ResearchAgent
 from .site_search import SiteSearchAgent, create_site_agent
 from .venue_intel import VenueIntelAgent
 from .value_analyzer import ValueAnalyzerAgent
+from .incremental_ranker import IncrementalRanker
 
 __all__ = [
     "BaseAgent",
+    "BrowserPool",
+    "get_browser_pool",
+    "close_browser_pools",
+    "SharedBrowser",
+    "AgentHook",
+    "add_agent_hook",
+    "remove_agent_hook",
+    "summarize_timeline",
+    "TokenBucket",
+    "ErrorKind",
+    "classify_error",
+    "get_agent_rate_limiter",
+    "Recording",
+    "RecordBackend",
+    "ReplayBackend",
+    "ReplayLatency",
+    "get_stagehand_backend",
+    "set_stagehand_backend",
+    "synthesize_recording",
+    "SiteExtractor",
+    "get_extractor",
     "ResearchAgent",
     "SiteSearchAgent",
     "create_site_agent",
     "VenueIntelAgent",
     "ValueAnalyzerAgent",
+    "IncrementalRanker",
 ]
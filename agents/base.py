@@ -2,14 +2,28 @@
 Base agent class with Stagehand initialization and common utilities.
 """
 
+import asyncio
 import os
+import sys
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
 from dotenv import load_dotenv
-from stagehand import Stagehand, StagehandConfig
-
-from models import AgentStatus
+from stagehand import Stagehand
+
+from models import AgentStatus, AgentStep
+from .browser_pool import POOL_ENABLED, get_browser_pool, launch_stagehand
+from .instrumentation import count_screenshot_bytes, instrument, record_agent_result
+from .rate_limit import (
+    QUOTA_PAUSE,
+    ErrorKind,
+    backoff_delay,
+    classify_error,
+    get_agent_rate_limiter,
+    parse_retry_after,
+)
+from .replay import get_stagehand_backend
+from .shared_browser import SharedBrowser
 
 load_dotenv()
 
@@ -23,33 +37,67 @@ class BaseAgent(ABC):
         max_steps: int = 20,
         headless: bool = False,
         verbose: int = 1,
+        use_pool: Optional[bool] = None,
+        shared_browser: Optional[SharedBrowser] = None,
     ):
         self.name = name
         self.max_steps = max_steps
         self.headless = headless
         self.verbose = verbose
+        self.use_pool = POOL_ENABLED if use_pool is None else use_pool
+        self.shared_browser = shared_browser
         self.stagehand: Optional[Stagehand] = None
         self.status = AgentStatus.PENDING
         self.screenshots: list[str] = []
+        self.timeline: list[AgentStep] = []
+        self._run_step = None
+
+    def instrument(self, kind: str, **attributes: Any):
+        """Time a block of this agent's work as a step on its timeline."""
+        return instrument(self.timeline, self.name, kind, **attributes)
 
     async def initialize(self) -> None:
-        """Initialize Stagehand browser session."""
-        config = StagehandConfig(
-            env="LOCAL",
-            model_api_key=os.environ.get("GEMINI_API_KEY"),
-            headless=self.headless,
-            verbose=self.verbose,
-        )
-        self.stagehand = Stagehand(config)
-        await self.stagehand.init()
+        """Initialize Stagehand browser session (borrowed from the pool when enabled)."""
+        backend = get_stagehand_backend()
+        if backend:
+            with self.instrument("launch", source=backend.name):
+                self.stagehand = await backend.open(self)
+            print(f"[{self.name}] Session opened ({backend.name})")
+        elif self.shared_browser:
+            with self.instrument("launch", source="shared"):
+                self.stagehand = await self.shared_browser.new_session(self.verbose)
+            print(f"[{self.name}] Attached to shared browser (isolated context)")
+        elif self.use_pool:
+            pool = get_browser_pool(self.headless, self.verbose)
+            with self.instrument("launch", source="pool"):
+                self.stagehand = await pool.acquire()
+            print(f"[{self.name}] Browser checked out from pool")
+        else:
+            with self.instrument("launch", source="new"):
+                self.stagehand = await launch_stagehand(self.headless, self.verbose)
+            print(f"[{self.name}] Browser initialized")
         self.status = AgentStatus.RUNNING
-        print(f"[{self.name}] Browser initialized")
 
-    async def close(self) -> None:
-        """Close the browser session."""
-        if self.stagehand:
-            await self.stagehand.close()
-            print(f"[{self.name}] Browser closed")
+    async def close(self, reusable: bool = True) -> None:
+        """Close the browser session, or hand it back to the pool."""
+        if not self.stagehand:
+            return
+
+        stagehand, self.stagehand = self.stagehand, None
+        backend = get_stagehand_backend()
+        with self.instrument("close", reusable=reusable):
+            if backend:
+                await backend.release(self, stagehand, reusable=reusable)
+            elif self.shared_browser:
+                await self.shared_browser.release(stagehand)
+                print(f"[{self.name}] Browser context closed")
+            elif self.use_pool:
+                pool = get_browser_pool(self.headless, self.verbose)
+                await pool.release(stagehand, reusable=reusable)
+                print(f"[{self.name}] Browser returned to pool")
+            else:
+                await stagehand.close()
+                print(f"[{self.name}] Browser closed")
 
     def create_agent(self, instructions: str) -> Any:
         """Create a Gemini Computer Use agent with custom instructions."""
@@ -73,30 +121,51 @@ If blocked on one site, try alternative approaches.""",
         if not self.stagehand:
             raise RuntimeError("Stagehand not initialized")
 
-        await self.stagehand.page.goto(
-            url,
-            wait_until="domcontentloaded",
-            timeout=timeout,
-        )
+        with self.instrument("navigate", url=url):
+            await self.stagehand.page.goto(
+                url,
+                wait_until="domcontentloaded",
+                timeout=timeout,
+            )
         print(f"[{self.name}] Navigated to {url}")
 
-    async def execute_agent(self, instruction: str, max_retries: int = 2) -> dict:
-        """Execute an instruction with the Gemini agent with retry logic."""
-        import asyncio
-        
+    async def execute_agent(
+        self,
+        instruction: str,
+        max_retries: int = 2,
+        max_steps: Optional[int] = None,
+    ) -> dict:
+        """
+        Execute an instruction with the Gemini agent with retry logic.
+
+        Each attempt takes a token from the process-wide rate limiter. Quota
+        errors pause the limiter for every agent, transient errors retry with
+        jittered exponential backoff, and fatal errors are not retried.
+        """
+        limiter = get_agent_rate_limiter()
         last_error = None
         
         for attempt in range(max_retries + 1):
             try:
-                agent = self.create_agent(self.get_system_instructions())
-
-                print(f"[{self.name}] Executing (attempt {attempt + 1}/{max_retries + 1}): {instruction[:100]}...")
-
-                result = await agent.execute(
-                    instruction=instruction,
-                    max_steps=self.max_steps,
-                    auto_screenshot=True,
-                )
+                with self.instrument(
+                    "execute", attempt=attempt + 1, max_steps=max_steps or self.max_steps
+                ) as step:
+                    waited = await limiter.acquire()
+                    step.attributes["rate_limit_wait"] = waited
+                    if waited >= 1:
+                        print(f"[{self.name}] Rate limited - waited {waited:.1f}s for a model slot")
+
+                    agent = self.create_agent(self.get_system_instructions())
+                    count_screenshot_bytes(agent, step)
+
+                    print(f"[{self.name}] Executing (attempt {attempt + 1}/{max_retries + 1}): {instruction[:100]}...")
+
+                    result = await agent.execute(
+                        instruction=instruction,
+                        max_steps=max_steps or self.max_steps,
+                        auto_screenshot=True,
+                    )
+                    record_agent_result(step, result)
 
                 # Check if we got a valid result
                 if result is not None:
@@ -114,21 +183,24 @@ If blocked on one site, try alternative approaches.""",
             except Exception as e:
                 last_error = e
                 error_str = str(e)
+                kind = classify_error(e)
                 
-                # Check if it's a retryable error
-                retryable = any(x in error_str for x in ['500', 'INTERNAL', 'No candidates', 'NoneType'])
-                
-                if retryable and attempt < max_retries:
-                    wait_time = (attempt + 1) * 2  # 2s, 4s backoff
-                    print(f"[{self.name}] Retryable error: {error_str[:100]}... Waiting {wait_time}s before retry")
-                    await asyncio.sleep(wait_time)
-                else:
+                if kind == ErrorKind.FATAL or attempt >= max_retries:
                     print(f"[{self.name}] Non-retryable error or max retries reached: {error_str[:200]}")
                     break
+                
+                wait_time = backoff_delay(attempt)
+                if kind == ErrorKind.QUOTA:
+                    # Back everyone off, not just this agent
+                    wait_time = max(wait_time, parse_retry_after(e) or QUOTA_PAUSE)
+                    limiter.pause(wait_time)
+                print(f"[{self.name}] {kind.value.title()} error: {error_str[:100]}... Waiting {wait_time:.1f}s before retry")
+                with self.instrument("backoff", error_kind=kind.value, attempt=attempt + 1):
+                    await asyncio.sleep(wait_time)
         
         # All retries exhausted
         self.status = AgentStatus.PARTIAL
-        print(f"[{self.name}] Task completed with issues after {max_retries + 1} attempts")
+        print(f"[{self.name}] Task completed with issues after {attempt + 1} attempts")
         return {
             "success": False,
             "result": None,
@@ -146,10 +218,25 @@ If blocked on one site, try alternative approaches.""",
         pass
 
     async def __aenter__(self):
-        """Async context manager entry."""
-        await self.initialize()
+        """Async context manager entry (times the whole session as a run step)."""
+        self._run_step = self.instrument("run")
+        self._run_step.__enter__()
+        try:
+            await self.initialize()
+        except BaseException:
+            self._end_run_step(*sys.exc_info())
+            raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.close()
+        try:
+            # Don't hand a browser that blew up mid-task to the next agent
+            await self.close(reusable=exc_type is None)
+        finally:
+            self._end_run_step(exc_type, exc_val, exc_tb)
+
+    def _end_run_step(self, exc_type, exc_val, exc_tb) -> None:
+        if self._run_step is not None:
+            run_step, self._run_step = self._run_step, None
+            run_step.__exit__(exc_type, exc_val, exc_tb)
@@ -0,0 +1,301 @@
+"""
+Browser pool: keeps warm Stagehand sessions alive between agent runs.
+Agents borrow a session in initialize() and hand it back in close(), so a
+search reuses running browsers instead of launching Chromium from cold.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from dotenv import load_dotenv
+from stagehand import Stagehand, StagehandConfig
+
+load_dotenv()
+
+
+# Set BROWSER_POOL_ENABLED=false to give every agent its own browser again
+POOL_ENABLED = os.environ.get("BROWSER_POOL_ENABLED", "true").lower() == "true"
+
+# Browsers kept warm even when idle
+POOL_MIN_SIZE = int(os.environ.get("BROWSER_POOL_MIN_SIZE", "0"))
+
+# Hard cap on browsers checked out + idle (acquire waits beyond this)
+POOL_MAX_SIZE = int(os.environ.get("BROWSER_POOL_MAX_SIZE", "6"))
+
+# Idle browsers older than this (seconds) are closed
+POOL_IDLE_TIMEOUT = float(os.environ.get("BROWSER_POOL_IDLE_TIMEOUT", "300"))
+
+# Recycle a browser after this many checkouts (keeps memory leaks in check)
+POOL_MAX_USES = int(os.environ.get("BROWSER_POOL_MAX_USES", "20"))
+
+# Health check / reset timeout (seconds)
+HEALTH_CHECK_TIMEOUT = 5.0
+
+
+async def launch_stagehand(headless: bool = False, verbose: int = 1) -> Stagehand:
+    """Launch and initialize a fresh local Stagehand browser session."""
+    config = StagehandConfig(
+        env="LOCAL",
+        model_api_key=os.environ.get("GEMINI_API_KEY"),
+        headless=headless,
+        verbose=verbose,
+    )
+    stagehand = Stagehand(config)
+    await stagehand.init()
+    return stagehand
+
+
+@dataclass
+class PooledBrowser:
+    """A Stagehand session owned by the pool."""
+    stagehand: Stagehand
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    uses: int = 0
+
+
+class BrowserPool:
+    """
+    Process-wide pool of warm Stagehand browsers.
+
+    - acquire() hands out an idle browser (health-checked) or launches one
+    - release() clears cookies, storage, permissions and tabs, then returns
+      the browser to the pool (browsers that cannot be cleared are closed)
+    - Browsers are recycled after max_uses checkouts or idle_timeout seconds
+    """
+
+    def __init__(
+        self,
+        headless: bool = False,
+        verbose: int = 1,
+        min_size: int = POOL_MIN_SIZE,
+        max_size: int = POOL_MAX_SIZE,
+        idle_timeout: float = POOL_IDLE_TIMEOUT,
+        max_uses: int = POOL_MAX_USES,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if min_size > max_size:
+            raise ValueError("min_size cannot be greater than max_size")
+
+        self.headless = headless
+        self.verbose = verbose
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_uses = max_uses
+
+        self._idle: list[PooledBrowser] = []  # Most recently used last
+        self._in_use: dict[int, PooledBrowser] = {}  # id(stagehand) -> entry
+        self._slots = asyncio.Semaphore(max_size)
+        self._reaper: Optional[asyncio.Task] = None
+        self._closed = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # Set on first use
+
+    async def acquire(self) -> Stagehand:
+        """Check out a healthy browser, launching one if none are idle."""
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+        self._check_loop()
+
+        await self._slots.acquire()
+        try:
+            entry = None
+            while self._idle:
+                candidate = self._idle.pop()
+                if self._is_expired(candidate) or not await self._is_healthy(candidate):
+                    await self._discard(candidate)
+                    continue
+                entry = candidate
+                break
+
+            if entry is None:
+                entry = PooledBrowser(
+                    stagehand=await launch_stagehand(self.headless, self.verbose)
+                )
+        except BaseException:
+            self._slots.release()
+            raise
+
+        entry.uses += 1
+        entry.last_used = time.monotonic()
+        self._in_use[id(entry.stagehand)] = entry
+        self._ensure_reaper()
+        return entry.stagehand
+
+    async def release(self, stagehand: Stagehand, reusable: bool = True) -> None:
+        """Return a browser to the pool (or close it if it should not be reused)."""
+        self._check_loop()
+        entry = self._in_use.pop(id(stagehand), None)
+        if entry is None:
+            # Not one of ours - just close it
+            await stagehand.close()
+            return
+
+        try:
+            keep = (
+                reusable
+                and not self._closed
+                and entry.uses < self.max_uses
+                and await self._reset(entry)
+            )
+            if keep:
+                entry.last_used = time.monotonic()
+                self._idle.append(entry)
+            else:
+                await self._discard(entry)
+        finally:
+            self._slots.release()
+
+    async def warm_up(self) -> None:
+        """Launch browsers until min_size are idle."""
+        while not self._closed and len(self._idle) + len(self._in_use) < self.min_size:
+            self._idle.append(
+                PooledBrowser(stagehand=await launch_stagehand(self.headless, self.verbose))
+            )
+        self._ensure_reaper()
+
+    async def close(self) -> None:
+        """Close all idle browsers; checked-out browsers close on release."""
+        self._closed = True
+        if self._reaper:
+            self._reaper.cancel()
+            self._reaper = None
+        idle, self._idle = self._idle, []
+        for entry in idle:
+            await self._discard(entry)
+
+    def stats(self) -> dict:
+        """Snapshot of pool occupancy."""
+        return {
+            "idle": len(self._idle),
+            "in_use": len(self._in_use),
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+        }
+
+    def _check_loop(self) -> None:
+        """Bind the pool to the running loop; its semaphore and reaper only work there."""
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif loop is not self._loop:
+            raise RuntimeError("BrowserPool used from a different event loop - use get_browser_pool() in each loop")
+
+    def _is_expired(self, entry: PooledBrowser) -> bool:
+        """Whether an idle browser should be recycled instead of reused."""
+        idle_for = time.monotonic() - entry.last_used
+        return entry.uses >= self.max_uses or idle_for > self.idle_timeout
+
+    async def _is_healthy(self, entry: PooledBrowser) -> bool:
+        """Check the browser still responds before handing it out."""
+        try:
+            page = entry.stagehand.page
+            if page is None:
+                return False
+            await asyncio.wait_for(page.evaluate("1"), timeout=HEALTH_CHECK_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+    async def _reset(self, entry: PooledBrowser) -> bool:
+        """Wipe what the last borrower left behind so the next one starts clean."""
+        try:
+            await asyncio.wait_for(self._clear_state(entry.stagehand), timeout=HEALTH_CHECK_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    async def _clear_state(stagehand: Stagehand) -> None:
+        """
+        Clear cookies, permissions and site storage, and swap every tab for one
+        fresh blank tab (which also drops sessionStorage and leftover popups).
+        """
+        context = stagehand.context
+        state = await context.storage_state()
+        origins = {origin["origin"] for origin in state.get("origins", [])}
+        origins.update(
+            f"{scheme}://{cookie['domain'].lstrip('.')}"
+            for cookie in state.get("cookies", [])
+            for scheme in ("https", "http")
+        )
+
+        stale_pages = await context.pages()
+        page = await context.new_page()  # Also becomes stagehand.page
+        for stale in stale_pages:
+            await stale.close()
+
+        await context.clear_cookies()
+        await context.clear_permissions()
+        for origin in origins:
+            await page.send_cdp("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+
+    async def _discard(self, entry: PooledBrowser) -> None:
+        """Close a browser that is leaving the pool."""
+        try:
+            await entry.stagehand.close()
+        except Exception as e:
+            print(f"[BrowserPool] Error closing browser: {e}")
+
+    def _ensure_reaper(self) -> None:
+        """Start the idle reaper if it is not running."""
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_idle())
+
+    async def _reap_idle(self) -> None:
+        """Periodically close browsers idle past idle_timeout (keeping min_size)."""
+        while not self._closed:
+            await asyncio.sleep(max(1.0, self.idle_timeout / 2))
+            now = time.monotonic()
+            keep, stale = [], []
+            for entry in self._idle:
+                if now - entry.last_used > self.idle_timeout:
+                    stale.append(entry)
+                else:
+                    keep.append(entry)
+
+            # Honour min_size: keep the freshest stale browsers if needed
+            total = len(keep) + len(self._in_use)
+            while stale and total < self.min_size:
+                keep.insert(0, stale.pop())
+                total += 1
+
+            self._idle = keep
+            for entry in stale:
+                await self._discard(entry)
+
+            if not self._idle and not self._in_use:
+                break
+
+
+# Process-wide pools, one per event loop and browser configuration
+_pools: dict[tuple[asyncio.AbstractEventLoop, bool, int], BrowserPool] = {}
+
+
+def get_browser_pool(headless: bool = False, verbose: int = 1) -> BrowserPool:
+    """Get (or create) the running loop's pool for a browser configuration."""
+    loop = asyncio.get_running_loop()
+    # Pools of finished loops can never be used (or closed) again
+    for key in [key for key in _pools if key[0].is_closed()]:
+        del _pools[key]
+
+    key = (loop, headless, verbose)
+    pool = _pools.get(key)
+    if pool is None or pool._closed:
+        pool = BrowserPool(headless=headless, verbose=verbose)
+        _pools[key] = pool
+    return pool
+
+
+async def close_browser_pools() -> None:
+    """Close the running loop's pools - call once at shutdown (per loop)."""
+    loop = asyncio.get_running_loop()
+    keys = [key for key in _pools if key[0] is loop or key[0].is_closed()]
+    pools = [_pools.pop(key) for key in keys]
+    for pool in pools:
+        if not pool._loop or pool._loop is loop:
+            await pool.close()
@@ -0,0 +1,184 @@
+"""
+DOM extractors: read ticket listings straight from a site's listing page.
+SiteSearchAgent tries these before asking the Gemini agent to read the page,
+which saves an LLM round trip + screenshot per scroll.
+
+Only extractors whose selectors have been checked against a live listing
+page (selectors_verified) are used - a miss costs an extra agent session,
+and loose selectors can return junk rows instead of missing. Others can be
+tried with DOM_EXTRACTION_SITES=tickpick,stubhub.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from models import TicketListing
+
+
+# Cap on rows read per page (the agent never reports more than this anyway)
+MAX_DOM_LISTINGS = 200
+
+# Sites to use the DOM fast path for even though their selectors are unverified
+DOM_EXTRACTION_SITES = {
+    site.strip() for site in os.environ.get("DOM_EXTRACTION_SITES", "").lower().split(",") if site.strip()
+}
+
+# Single round trip: collect section/row/price/quantity text for every listing node
+EXTRACT_SCRIPT = """
+(sel) => Array.from(document.querySelectorAll(sel.listing))
+    // Skip listing nodes nested inside another match (wrappers and inner parts)
+    .filter((el) => !(el.parentElement && el.parentElement.closest(sel.listing)))
+    .slice(0, sel.limit)
+    .map((el) => {
+        const text = (s) => {
+            if (!s) return "";
+            const node = el.querySelector(s);
+            return node ? node.textContent.trim() : "";
+        };
+        const link = el.querySelector("a[href]");
+        return {
+            section: text(sel.section),
+            row: text(sel.row),
+            price: text(sel.price),
+            quantity: text(sel.quantity),
+            url: link ? link.href : "",
+        };
+    })
+"""
+
+PRICE_RE = re.compile(r'\$?\s*(\d[\d,]*(?:\.\d{1,2})?)')
+INT_RE = re.compile(r'\d+')
+LABEL_RE = re.compile(r'^(?:section|sec\.?|row)\s*[:\-]?\s*', re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class SiteExtractor:
+    """CSS selectors for one site's ticket listing page."""
+    site_name: str
+    listing_url_pattern: str  # Regex matched against page.url
+    listing_selector: str  # One node per listing
+    section_selector: str
+    row_selector: str
+    price_selector: str
+    quantity_selector: str = ""
+    is_verified: bool = False  # Site only sells verified tickets
+    selectors_verified: bool = False  # Checked against a live listing page
+
+    def is_listing_page(self, url: str) -> bool:
+        """Whether the page looks like this site's ticket listing page."""
+        return re.search(self.listing_url_pattern, url or "") is not None
+
+    async def extract(self, page: Any) -> list[TicketListing]:
+        """
+        Read listings from the current page.
+
+        Returns an empty list when the page is not a listing page or the
+        selectors do not match - callers then fall back to the agent.
+        """
+        if not self.is_listing_page(page.url):
+            return []
+
+        try:
+            rows = await page.evaluate(EXTRACT_SCRIPT, {
+                "listing": self.listing_selector,
+                "section": self.section_selector,
+                "row": self.row_selector,
+                "price": self.price_selector,
+                "quantity": self.quantity_selector,
+                "limit": MAX_DOM_LISTINGS,
+            })
+        except Exception as e:
+            print(f"[{self.site_name}Extractor] DOM extraction failed: {e}")
+            return []
+
+        listings = []
+        for row in rows or []:
+            listing = self._to_listing(row)
+            if listing:
+                listings.append(listing)
+        return listings
+
+    def _to_listing(self, row: dict) -> Optional[TicketListing]:
+        """Convert one raw DOM row to a TicketListing (None if incomplete)."""
+        section = LABEL_RE.sub("", row.get("section") or "").strip()
+        price_match = PRICE_RE.search(row.get("price") or "")
+        if not section or not price_match:
+            return None
+
+        price = float(price_match.group(1).replace(",", ""))
+        if price <= 0:
+            return None
+
+        quantity_match = INT_RE.search(row.get("quantity") or "")
+        return TicketListing(
+            source=self.site_name,
+            section=section,
+            row=LABEL_RE.sub("", row.get("row") or "").strip(),
+            quantity=int(quantity_match.group()) if quantity_match else 2,
+            price_per_ticket=price,
+            total_price=price,
+            url=row.get("url") or "",
+            is_verified=self.is_verified,
+        )
+
+
+# Selectors per site (keys match SITE_CONFIGS). Sites change markup often -
+# when these stop matching, SiteSearchAgent falls back to the agent. Set
+# selectors_verified only once a page saved from the live site is in
+# backend/tests/fixtures/listing_pages/ and test_extractors reads it.
+SITE_EXTRACTORS = {
+    "ticketmaster": SiteExtractor(
+        site_name="ticketmaster",
+        listing_url_pattern=r'ticketmaster\.com/.+/event/',
+        listing_selector='[data-bdd="quick-picks-list-item"], li[data-index] [role="button"]',
+        section_selector='[data-bdd="quick-pick-item-desc"]',
+        row_selector='[data-bdd="quick-pick-item-row"]',
+        price_selector='[data-bdd="quick-pick-price-button"]',
+    ),
+    "stubhub": SiteExtractor(
+        site_name="stubhub",
+        listing_url_pattern=r'stubhub\.com/.+/event/\d+',
+        listing_selector='[data-listing-id]',
+        section_selector='[data-testid="listing-section"], [class*="SectionName"]',
+        row_selector='[data-testid="listing-row"], [class*="RowName"]',
+        price_selector='[data-testid="listing-price"], [class*="Price"]',
+        quantity_selector='[data-testid="listing-quantity"]',
+    ),
+    "seatgeek": SiteExtractor(
+        site_name="seatgeek",
+        listing_url_pattern=r'seatgeek\.com/.+-tickets/.+/\d+',
+        listing_selector='[data-testid="listing-item"]',
+        section_selector='[data-testid="listing-section"]',
+        row_selector='[data-testid="listing-row"]',
+        price_selector='[data-testid="listing-price"]',
+        quantity_selector='[data-testid="listing-quantity"]',
+    ),
+    "tickpick": SiteExtractor(
+        site_name="tickpick",
+        listing_url_pattern=r'tickpick\.com/buy-.+-tickets-',
+        listing_selector='.listing, [data-listing-id]',
+        section_selector='.sectionName',
+        row_selector='.rowName',
+        price_selector='.price',
+        quantity_selector='.qty',
+    ),
+    "vividseats": SiteExtractor(
+        site_name="vividseats",
+        listing_url_pattern=r'vividseats\.com/.+/production/\d+',
+        listing_selector='[data-testid="listing-row-container"]',
+        section_selector='[data-testid="section-name"]',
+        row_selector='[data-testid="row-name"]',
+        price_selector='[data-testid="listing-price"]',
+        quantity_selector='[data-testid="ticket-quantity"]',
+    ),
+}
+
+
+def get_extractor(site_name: str) -> Optional[SiteExtractor]:
+    """Get the DOM extractor for a site (None if it has none, or none verified or enabled)."""
+    extractor = SITE_EXTRACTORS.get(site_name)
+    if extractor and (extractor.selectors_verified or site_name in DOM_EXTRACTION_SITES):
+        return extractor
+    return None
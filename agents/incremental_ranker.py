@@ -0,0 +1,252 @@
+"""
+IncrementalRanker: Ranks listings as each site's results arrive, so a
+"best value so far" ranking is available before the slowest site finishes.
+
+Scores use ValueAnalyzerAgent's formula, merge rules and quality lookups,
+so the final analyze() ranking differs only where ties fall. Two things make
+it incremental:
+
+- A bounded heap of the top_k seats keyed on quality x verified bonus /
+  price. For a fixed median that orders seats the same way as aiValueScore,
+  so the heap stays valid as the median moves.
+- A running median of the seats' prices (two heaps with lazy removal, since
+  a cheaper duplicate from another site replaces a seat's price).
+
+snapshot() scores just the heap's seats against the current median.
+"""
+
+import heapq
+from collections import Counter
+from typing import Optional
+
+import numpy as np
+
+from models import Seat, SiteSearchResult, TicketListing, VenueIntel, canonical_section
+from .value_analyzer import ValueAnalyzerAgent, merge_key, merge_price, value_scores
+
+
+class RunningMedian:
+    """Median of a multiset of numbers, with insert and remove in O(log n)."""
+
+    def __init__(self):
+        self._low: list[float] = []  # Max-heap (negated) of the lower half
+        self._high: list[float] = []  # Min-heap of the upper half
+        self._low_size = 0
+        self._high_size = 0
+        self._removed: Counter = Counter()  # Values removed but still in a heap
+
+    def __len__(self) -> int:
+        return self._low_size + self._high_size
+
+    def add(self, value: float) -> None:
+        if not self._low or value <= -self._low[0]:
+            heapq.heappush(self._low, -value)
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, value)
+            self._high_size += 1
+        self._rebalance()
+
+    def remove(self, value: float) -> None:
+        """Remove one occurrence of a value that was added."""
+        self._removed[value] += 1
+        if value <= -self._low[0]:
+            self._low_size -= 1
+            if value == -self._low[0]:
+                self._prune(self._low, negated=True)
+        else:
+            self._high_size -= 1
+            if self._high and value == self._high[0]:
+                self._prune(self._high, negated=False)
+        self._rebalance()
+
+    def median(self) -> Optional[float]:
+        """Same value as statistics.median, or None when empty."""
+        if not len(self):
+            return None
+        if self._low_size > self._high_size:
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+
+    def _rebalance(self) -> None:
+        if self._low_size > self._high_size + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+            self._low_size -= 1
+            self._high_size += 1
+            self._prune(self._low, negated=True)
+        elif self._low_size < self._high_size:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+            self._high_size -= 1
+            self._low_size += 1
+            self._prune(self._high, negated=False)
+
+    def _prune(self, heap: list[float], negated: bool) -> None:
+        """Drop removed values from the top of a heap."""
+        while heap:
+            value = -heap[0] if negated else heap[0]
+            if not self._removed[value]:
+                return
+            self._removed[value] -= 1
+            if not self._removed[value]:
+                del self._removed[value]
+            heapq.heappop(heap)
+
+
+class IncrementalRanker:
+    """
+    Best-value seats so far, updated per SiteSearchResult.
+
+    Usage:
+        ranker = IncrementalRanker(top_k=20)
+        ranker.add(site_result)          # As each site finishes
+        ranker.set_venue_intel(intel)    # When venue intel lands (rescores)
+        seats = ranker.snapshot()        # Any time
+    """
+
+    def __init__(self, top_k: int = 20, venue_intel: Optional[VenueIntel] = None):
+        self.top_k = max(top_k, 0)
+        self.venue_intel = venue_intel
+        self.listing_count = 0
+        self._analyzer = ValueAnalyzerAgent()
+
+        # Merge groups, as in ValueAnalyzerAgent._merge_listings
+        self._groups: list[list[TicketListing]] = []
+        self._primary: list[TicketListing] = []  # Cheapest listing per group
+        self._first_group: dict[tuple, int] = {}
+        self._more_groups: dict[tuple, list[int]] = {}
+
+        self._median = RunningMedian()
+        self._qualities: dict[str, float] = {}
+
+        # Min-heap of (density, -position, position, listing): the root is the worst kept seat.
+        # Entries whose group got a cheaper listing are stale; each one extends the bound by one
+        self._heap: list[tuple[float, int, int, TicketListing]] = []
+        self._in_heap: set[int] = set()  # Positions with a live heap entry
+        self._stale = 0
+        self._unpriced: list[int] = []  # Unknown-price seats always score 50 - kept in arrival order
+
+    def __len__(self) -> int:
+        """Physical seats seen so far."""
+        return len(self._groups)
+
+    def add(self, result: SiteSearchResult) -> None:
+        """Add one site's listings."""
+        for listing in result.listings:
+            self.add_listing(listing)
+
+    def add_listing(self, listing: TicketListing) -> None:
+        self.listing_count += 1
+        key = merge_key(listing)
+        if key is None:
+            self._new_group(listing)
+            return
+        position = self._first_group.get(key)
+        if position is None:
+            self._first_group[key] = self._new_group(listing)
+            return
+
+        for position in (position, *self._more_groups.get(key, ())):
+            group = self._groups[position]
+            if all(other.source != listing.source for other in group):
+                group.append(listing)
+                if merge_price(listing) < merge_price(self._primary[position]):
+                    self._replace_primary(position, listing)
+                return
+        self._more_groups.setdefault(key, []).append(self._new_group(listing))
+
+    def set_venue_intel(self, venue_intel: Optional[VenueIntel]) -> None:
+        """Use venue section ratings from now on, rescoring every seat."""
+        self.venue_intel = venue_intel
+        self._qualities.clear()
+        self._heap = []
+        self._in_heap.clear()
+        self._stale = 0
+        for position in range(len(self._primary)):
+            if merge_price(self._primary[position]) != float("inf"):
+                self._push(position)
+
+    def median_price(self) -> float:
+        """Median price the scores are relative to (100.0 before any price is known)."""
+        median = self._median.median()
+        return 100.0 if median is None else median
+
+    def snapshot(self, top_k: Optional[int] = None) -> list[Seat]:
+        """The best seats so far, highest aiValueScore first."""
+        limit = self.top_k if top_k is None else min(max(top_k, 0), self.top_k)
+        median_price = self.median_price()
+
+        candidates = [position for _, _, position, listing in self._heap if listing is self._primary[position]]
+        candidates += [
+            position for position in self._unpriced if merge_price(self._primary[position]) == float("inf")
+        ][:limit]
+
+        listings = [self._primary[position] for position in candidates]
+        scores = value_scores(
+            np.array([listing.total_price or listing.price_per_ticket for listing in listings], dtype=np.float64),
+            np.array([self._quality(listing.section) for listing in listings], dtype=np.float64),
+            np.array([listing.is_verified for listing in listings], dtype=bool),
+            median_price,
+        )
+        scored = sorted((-int(score), position, int(score)) for position, score in zip(candidates, scores))
+
+        seats = []
+        for _, position, score in scored[:limit]:
+            listing = self._primary[position]
+            alternates = sorted((l for l in self._groups[position] if l is not listing), key=merge_price)
+            seats.append(self._analyzer._seat_from_listing(listing, score, alternates))
+        return seats
+
+    def _new_group(self, listing: TicketListing) -> int:
+        position = len(self._groups)
+        self._groups.append([listing])
+        self._primary.append(listing)
+        if listing.total_price > 0:
+            self._median.add(listing.total_price)
+        if merge_price(listing) == float("inf"):
+            self._unpriced.append(position)
+        else:
+            self._push(position)
+        return position
+
+    def _replace_primary(self, position: int, listing: TicketListing) -> None:
+        previous = self._primary[position]
+        if previous.total_price > 0:
+            self._median.remove(previous.total_price)
+        if listing.total_price > 0:
+            self._median.add(listing.total_price)
+        if position in self._in_heap:
+            self._in_heap.discard(position)
+            self._stale += 1
+        self._primary[position] = listing
+        self._push(position)
+
+    def _push(self, position: int) -> None:
+        listing = self._primary[position]
+        price = listing.total_price or listing.price_per_ticket
+        density = self._quality(listing.section) * 10 / price
+        if listing.is_verified:
+            density *= 1.10
+        entry = (density, -position, position, listing)
+
+        if len(self._heap) < self.top_k + self._stale:
+            heapq.heappush(self._heap, entry)
+        elif self._heap and entry > self._heap[0]:
+            evicted = heapq.heapreplace(self._heap, entry)
+            if evicted[3] is self._primary[evicted[2]]:
+                self._in_heap.discard(evicted[2])
+            else:
+                self._stale -= 1
+        else:
+            return
+        self._in_heap.add(position)
+
+    def _quality(self, section_name: str) -> float:
+        section = canonical_section(section_name)
+        quality = self._qualities.get(section)
+        if quality is None:
+            if self.venue_intel:
+                quality = self.venue_intel.get_section_quality(section)
+            else:
+                quality = self._analyzer._estimate_section_quality(section)
+            self._qualities[section] = quality
+        return quality
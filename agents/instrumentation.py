@@ -0,0 +1,156 @@
+"""
+Agent instrumentation: Timed steps, hooks and timeline summaries.
+
+Agents wrap their work (launch, navigate, execute, parse, ...) in
+instrument() blocks. Each block becomes an AgentStep on the agent's
+timeline - duration, retries, model actions by type, screenshot bytes - and
+is passed to every registered AgentHook, so metrics and tracing can observe
+agents without touching agent code.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from models import AgentStep
+
+
+class AgentHook:
+    """Receives every instrumented agent step. Override what you need."""
+
+    def on_step_start(self, step: AgentStep) -> None:
+        """Called when a step begins (duration is still 0)."""
+
+    def on_step_end(self, step: AgentStep) -> None:
+        """Called when a step ends, successfully or not."""
+
+
+_hooks: list[AgentHook] = []
+
+
+def add_agent_hook(hook: AgentHook) -> None:
+    """Register a hook for every agent step in the process."""
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_agent_hook(hook: AgentHook) -> None:
+    """Unregister a hook."""
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def _emit(method: str, step: AgentStep) -> None:
+    """Call a hook method on every hook - a broken hook never breaks an agent."""
+    for hook in list(_hooks):
+        try:
+            getattr(hook, method)(step)
+        except Exception as e:
+            print(f"[instrumentation] {type(hook).__name__}.{method} failed: {e}")
+
+
+@contextmanager
+def instrument(
+    timeline: list[AgentStep], agent: str, kind: str, **attributes: Any
+) -> Iterator[AgentStep]:
+    """
+    Time a block as an AgentStep appended to timeline.
+
+    Usage:
+        with instrument(self.timeline, self.name, "navigate", url=url) as step:
+            ...
+            step.attributes["status"] = 200
+    """
+    step = AgentStep(agent=agent, kind=kind, started_at=time.time(), attributes=dict(attributes))
+    _emit("on_step_start", step)
+    started = time.perf_counter()
+    try:
+        yield step
+    except asyncio.CancelledError:
+        step.attributes["error"] = "cancelled"
+        raise
+    except Exception as e:
+        step.attributes["error"] = f"{type(e).__name__}: {e}"[:200]
+        raise
+    finally:
+        step.duration = time.perf_counter() - started
+        timeline.append(step)
+        _emit("on_step_end", step)
+
+
+def record_agent_result(step: AgentStep, result: Any) -> None:
+    """Add model step count, action types and token usage from an AgentResult."""
+    actions = getattr(result, "actions", None) or []
+    action_types = Counter(_action_type(action) for action in actions)
+    step.attributes["agent_steps"] = len(actions)
+    step.attributes["actions"] = dict(action_types)
+    step.attributes["completed"] = getattr(result, "completed", None)
+
+    usage = getattr(result, "usage", None)
+    if usage is not None:
+        step.attributes["input_tokens"] = getattr(usage, "input_tokens", 0)
+        step.attributes["output_tokens"] = getattr(usage, "output_tokens", 0)
+        step.attributes["inference_seconds"] = getattr(usage, "inference_time_ms", 0) / 1000
+
+
+def _action_type(action: Any) -> str:
+    if isinstance(action, dict):
+        return str(action.get("type", "unknown"))
+    return str(getattr(action, "type", None) or getattr(action, "action_type", "unknown"))
+
+
+def count_screenshot_bytes(agent: Any, step: AgentStep) -> None:
+    """
+    Count screenshot bytes an agent captures into step.attributes.
+
+    Wraps the agent's CUA handler (the only place Stagehand agents take
+    screenshots); agents without one are left untouched.
+    """
+    handler = getattr(agent, "cua_handler", None)
+    capture = getattr(handler, "get_screenshot_base64", None)
+    if capture is None:
+        return
+
+    step.attributes.setdefault("screenshots", 0)
+    step.attributes.setdefault("screenshot_bytes", 0)
+
+    async def counted_capture(*args, **kwargs):
+        encoded = await capture(*args, **kwargs)
+        step.attributes["screenshots"] += 1
+        step.attributes["screenshot_bytes"] += len(encoded or "") * 3 // 4  # base64 -> bytes
+        return encoded
+
+    handler.get_screenshot_base64 = counted_capture
+
+
+# Step attributes that are summed per kind in summarize_timeline
+SUMMED_ATTRIBUTES = (
+    "agent_steps",
+    "screenshots",
+    "screenshot_bytes",
+    "input_tokens",
+    "output_tokens",
+    "inference_seconds",
+    "rate_limit_wait",
+)
+
+
+def summarize_timeline(timeline: list[AgentStep]) -> dict[str, dict[str, float]]:
+    """Per step kind: count, total and max seconds, errors and summed counters."""
+    summary: dict[str, dict[str, float]] = {}
+    for step in timeline:
+        entry = summary.setdefault(
+            step.kind, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0, "errors": 0}
+        )
+        entry["count"] += 1
+        entry["total_seconds"] += step.duration
+        entry["max_seconds"] = max(entry["max_seconds"], step.duration)
+        if "error" in step.attributes:
+            entry["errors"] += 1
+        for name in SUMMED_ATTRIBUTES:
+            value = step.attributes.get(name)
+            if isinstance(value, (int, float)):
+                entry[name] = entry.get(name, 0) + value
+    return summary
@@ -0,0 +1,276 @@
+"""
+Listing parser: Turns a site agent's free-text answer into TicketListings.
+
+The agent's result is reduced to its distinct text once, then scanned with
+three precompiled patterns, one findall per listing format:
+
+    Section: X, Row: Y, Price: $Z            (the format agents are asked for)
+    Sec OR • Row M, Standard Admission, $99  (Ticketmaster style)
+    **Section:** X, **Row:** Y ... $Z        (TickPick/markdown style)
+
+The agent format is scanned first; the Ticketmaster and TickPick scans then
+only add seats it did not cover. Each format gets its own scan because a
+looser format's match can run past the end of its line and would swallow
+agent-format lines that follow. Prices may use thousands separators
+("$1,250.00").
+
+Duplicates are dropped with hash sets as listings are built, keyed on
+canonical section/row names (models.seat_key) so "Sec 101" and
+"Section: 101" count as the same seats. Each scan is linear in the size of
+the transcript. Looser price/section matching only runs when none of the
+three formats appear.
+
+Agents asked for structured output (STRUCTURED_LISTINGS) answer with a JSON
+array of listings instead; parse_json_listings validates that payload and
+returns None when there is none, so callers can fall back to the patterns.
+"""
+
+import json
+import re
+from typing import Any, Optional
+
+from models import TicketListing, seat_key
+
+
+# Result attributes that may carry the agent's answer, in priority order
+TEXT_ATTRIBUTES = ("message", "text", "content", "output", "reasoning", "thoughts")
+
+# Dict/__dict__ strings shorter than this are ids, flags, etc. - not answers
+MIN_TEXT_LENGTH = 11
+
+# A dollar amount after the "$": digits with optional thousands separators and cents
+PRICE = r"(\d{1,3}(?:,\d{3})+(?:\.\d{2})?|\d+(?:\.\d{2})?)"
+
+# Section: X, Row: Y, Price: $Z
+STRUCTURED_RE = re.compile(
+    r"Section:\s*([^,\n]+)(?:,\s*Row:\s*([^,\n]+))?,.*?Price:\s*\$" + PRICE,
+    re.IGNORECASE,
+)
+
+# Sec OR • Row M ... $99.75
+TICKETMASTER_RE = re.compile(
+    r"Sec\s+([A-Z0-9]+)\s*[•·]\s*Row\s+([A-Z0-9]+)[^$]*\$" + PRICE,
+    re.IGNORECASE,
+)
+
+# **Section:** X, **Row:** Y ... $Z
+TICKPICK_RE = re.compile(
+    r"\*\*(?:Section|Sec)[:\s]*\*\*\s*([^,*]+),?\s*\*\*Row[:\s]*\*\*\s*([^,*]+).*?\$" + PRICE,
+    re.IGNORECASE,
+)
+
+# Fallback: loose prices, sections and rows, paired up by position
+PRICE_RE = re.compile(r"\$" + PRICE)
+SECTION_RES = [
+    re.compile(r"Section:\s*([A-Za-z0-9\s]+?)(?:,|\n|Row)", re.IGNORECASE),
+    re.compile(r"(?:Section|Sec\.?)\s*([A-Za-z0-9\s]+)", re.IGNORECASE),
+    re.compile(r"([A-Z][a-z]+\s+Balc(?:ony)?\s+(?:Center|Left|Right|Centre))", re.IGNORECASE),
+    re.compile(r"([A-Z][a-z]+\s+(?:Floor|Orchestra|Mezzanine|Balcony))", re.IGNORECASE),
+]
+ROW_RE = re.compile(r"Row:\s*([A-Za-z0-9]+)", re.IGNORECASE)
+MAX_FALLBACK_LISTINGS = 10
+
+# Structured payload: a fenced ```json block, else the first JSON array/object in the text
+JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+_decoder = json.JSONDecoder()
+
+
+def extract_text(result: Any) -> str:
+    """
+    All distinct answer text in an agent result, joined once.
+
+    Reads the known text attributes, then string values of a dict result
+    and of the object's __dict__. str(result) is only used when none of
+    those exist - for a pydantic AgentResult it just repeats the message
+    with escaped newlines.
+    """
+    texts: list[str] = []
+    seen: set[str] = set()
+
+    def add(text: str) -> None:
+        if text not in seen:
+            seen.add(text)
+            texts.append(text)
+
+    for attr in TEXT_ATTRIBUTES:
+        value = getattr(result, attr, None)
+        if value:
+            add(str(value))
+
+    for values in (result if isinstance(result, dict) else None, getattr(result, "__dict__", None)):
+        if not values:
+            continue
+        for value in values.values():
+            if isinstance(value, str) and len(value) >= MIN_TEXT_LENGTH:
+                add(value)
+
+    if not texts and result is not None:
+        add(str(result))
+    return "\n".join(texts)
+
+
+def _price(text: str) -> float:
+    return float(text.replace(",", ""))
+
+
+def _listing(source: str, section: str, row: str, price: str) -> TicketListing:
+    return TicketListing(
+        source=source,
+        section=section,
+        row=row,
+        price_per_ticket=_price(price),
+        total_price=_price(price),  # Agent should report with fees
+        quantity=2,  # Default assumption
+    )
+
+
+def parse_listings(text: str, source: str) -> list[TicketListing]:
+    """
+    Parse every listing in an agent transcript, without duplicates.
+
+    Agent-format listings come first, then Ticketmaster- and TickPick-style
+    ones whose seats were not already seen. Listings with the same
+    canonical section, row and price are kept once.
+    """
+    listings: list[TicketListing] = []
+    seen_seats: set[tuple[str, str]] = set()
+    seen_listings: set[tuple[tuple[str, str], float]] = set()
+
+    def add(seat: tuple[str, str], section: str, row: str, price: str) -> None:
+        key = (seat, _price(price))
+        if key not in seen_listings:
+            seen_listings.add(key)
+            listings.append(_listing(source, section, row, price))
+
+    for section, row, price in STRUCTURED_RE.findall(text):
+        section, row = section.strip(), row.strip()
+        seat = seat_key(section, row)
+        seen_seats.add(seat)
+        add(seat, section, row, price)
+
+    # Other formats only fill in seats the agent-format lines did not cover
+    for pattern in (TICKETMASTER_RE, TICKPICK_RE):
+        for section, row, price in pattern.findall(text):
+            section, row = section.strip(), row.strip()
+            seat = seat_key(section, row)
+            if seat not in seen_seats:
+                seen_seats.add(seat)
+                add(seat, section, row, price)
+
+    if not listings:
+        listings = _parse_loose(text, source)
+    return listings
+
+
+def _parse_loose(text: str, source: str) -> list[TicketListing]:
+    """Pair loose prices with loose section/row mentions (first few only)."""
+    prices = PRICE_RE.findall(text)
+    if not prices:
+        return []
+
+    sections: list[str] = []
+    for pattern in SECTION_RES:
+        sections = pattern.findall(text)
+        if sections:
+            break
+    rows = ROW_RE.findall(text)
+
+    listings: list[TicketListing] = []
+    seen: set[tuple[tuple[str, str], float]] = set()
+    for i, price in enumerate(prices[:MAX_FALLBACK_LISTINGS]):
+        section = sections[i].strip() if i < len(sections) else f"Section {i+1}"
+        row = rows[i].strip() if i < len(rows) else ""
+        key = (seat_key(section, row), _price(price))
+        if key not in seen:
+            seen.add(key)
+            listings.append(_listing(source, section, row, price))
+    return listings
+
+
+def parse_json_listings(text: str, source: str) -> Optional[list[TicketListing]]:
+    """
+    Parse a structured JSON listing payload, or None if the text has none.
+
+    Accepts a bare array of listing objects or {"listings": [...]}, either
+    fenced or embedded in the answer. Items without a section or a positive
+    price are skipped; price and fees are per ticket, so total_price is
+    their sum. Listings with the same canonical section, row and price are
+    kept once.
+    """
+    payload = _find_json_payload(text)
+    if payload is None:
+        return None
+
+    listings: list[TicketListing] = []
+    seen: set[tuple[tuple[str, str], float]] = set()
+    for item in payload:
+        listing = _json_listing(item, source)
+        if listing is None:
+            continue
+        key = (seat_key(listing.section, listing.row), listing.price_per_ticket)
+        if key not in seen:
+            seen.add(key)
+            listings.append(listing)
+    return listings
+
+
+def _find_json_payload(text: str) -> Optional[list]:
+    candidates = [match.group(1) for match in JSON_FENCE_RE.finditer(text)]
+    candidates.append(text)
+    for candidate in candidates:
+        start = _next_json_start(candidate, 0)
+        while start != -1:
+            try:
+                value, end = _decoder.raw_decode(candidate, start)
+            except ValueError:
+                start = _next_json_start(candidate, start + 1)
+                continue
+            if isinstance(value, dict):
+                value = value.get("listings")
+            if isinstance(value, list) and any(isinstance(item, dict) for item in value):
+                return value
+            start = _next_json_start(candidate, end)
+    return None
+
+
+def _next_json_start(text: str, position: int) -> int:
+    starts = [i for i in (text.find("[", position), text.find("{", position)) if i != -1]
+    return min(starts) if starts else -1
+
+
+def _json_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.replace("$", "").replace(",", "").strip())
+        except ValueError:
+            return None
+    return None
+
+
+def _json_listing(item: Any, source: str) -> Optional[TicketListing]:
+    if not isinstance(item, dict):
+        return None
+    section = item.get("section")
+    price = _json_number(item.get("price"))
+    if not isinstance(section, (str, int)) or not str(section).strip() or not price or price <= 0:
+        return None
+
+    row = item.get("row")
+    fees = _json_number(item.get("fees")) or 0.0
+    quantity = _json_number(item.get("quantity"))
+    url = item.get("url")
+    return TicketListing(
+        source=source,
+        section=str(section).strip(),
+        row=str(row).strip() if row is not None else "",
+        quantity=int(quantity) if quantity and quantity >= 1 else 2,
+        price_per_ticket=price,
+        fees_per_ticket=max(fees, 0.0),
+        total_price=price + max(fees, 0.0),
+        url=url.strip() if isinstance(url, str) else "",
+        is_verified=item.get("verified") is True,
+    )
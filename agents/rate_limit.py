@@ -0,0 +1,138 @@
+"""
+Agent rate limiting: Shared token bucket and retry backoff for model calls.
+
+Every agent execution in the process takes a token from one bucket, so a
+burst of parallel agents is smoothed out instead of hitting the model API
+together. Errors are classified so quota errors pause the whole bucket,
+transient errors retry with exponential backoff and full jitter (so agents
+don't retry in lockstep), and fatal errors fail fast.
+"""
+
+import asyncio
+import os
+import random
+import re
+import time
+from enum import Enum
+from typing import Optional
+
+
+# Agent executions allowed per minute across the process, and burst size
+AGENT_EXECUTIONS_PER_MINUTE = float(os.environ.get("AGENT_EXECUTIONS_PER_MINUTE", "60"))
+AGENT_EXECUTION_BURST = int(os.environ.get("AGENT_EXECUTION_BURST", "8"))
+
+# Exponential backoff: up to BASE * 2^attempt seconds (jittered), capped
+BACKOFF_BASE = 2.0
+BACKOFF_CAP = 30.0
+
+# Pause applied to the whole bucket after a quota error without a retry hint
+QUOTA_PAUSE = 20.0
+
+QUOTA_MARKERS = ("429", "resource_exhausted", "resource exhausted", "quota", "rate limit")
+TRANSIENT_MARKERS = (
+    "500", "502", "503", "504", "internal", "unavailable", "overloaded",
+    "no candidates", "nonetype", "timeout", "timed out", "deadline exceeded",
+    "connection reset", "connection aborted",
+)
+
+
+class ErrorKind(Enum):
+    """How an agent execution error should be retried."""
+    QUOTA = "quota"  # Rate/quota limit - slow everyone down, then retry
+    TRANSIENT = "transient"  # Server hiccup - retry this call with backoff
+    FATAL = "fatal"  # Bad request, auth, page gone... - don't retry
+
+
+def classify_error(error: BaseException) -> ErrorKind:
+    """Classify an agent execution error by its message."""
+    text = str(error).lower()
+    if any(marker in text for marker in QUOTA_MARKERS):
+        return ErrorKind.QUOTA
+    if isinstance(error, asyncio.TimeoutError) or any(marker in text for marker in TRANSIENT_MARKERS):
+        return ErrorKind.TRANSIENT
+    return ErrorKind.FATAL
+
+
+def parse_retry_after(error: BaseException) -> Optional[float]:
+    """Retry delay hinted by a quota error ("retry in 12s", "retryDelay": "12s")."""
+    match = re.search(
+        r'retry(?:[ _-]?delay)?["\']?\s*(?:in|:|after)?\s*["\']?(\d+(?:\.\d+)?)\s*s',
+        str(error),
+        re.IGNORECASE,
+    )
+    return float(match.group(1)) if match else None
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """Exponential backoff with full jitter for the given (0-based) retry."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    Each acquire() reserves the next token up front (tokens may go negative),
+    so waiters are served in arrival order without a lock.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = max(rate_per_second, 1e-6)
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.acquired = 0
+        self.total_wait = 0.0
+
+    async def acquire(self) -> float:
+        """Wait for a token; returns the seconds waited."""
+        delay = self._reserve()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.tokens += 1  # Give the unused reservation back
+                raise
+        self.acquired += 1
+        self.total_wait += delay
+        return delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every new acquisition for the next `seconds`."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def stats(self) -> dict:
+        """Snapshot of the bucket."""
+        self._refill()
+        return {
+            "tokens": self.tokens,
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "paused_for_seconds": max(0.0, self.paused_until - time.monotonic()),
+            "acquired": self.acquired,
+            "avg_wait_seconds": self.total_wait / self.acquired if self.acquired else 0.0,
+        }
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _reserve(self) -> float:
+        self._refill()
+        self.tokens -= 1
+        debt_wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        pause_wait = self.paused_until - self.updated
+        return max(debt_wait, pause_wait, 0.0)
+
+
+_limiter: Optional[TokenBucket] = None
+
+
+def get_agent_rate_limiter() -> TokenBucket:
+    """Get the process-wide limiter for agent executions."""
+    global _limiter
+    if _limiter is None:
+        _limiter = TokenBucket(AGENT_EXECUTIONS_PER_MINUTE / 60.0, AGENT_EXECUTION_BURST)
+    return _limiter
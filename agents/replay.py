@@ -0,0 +1,455 @@
+"""
+Record/replay Stagehand backends for offline runs and benchmarks.
+
+RECORD wraps live Stagehand sessions and saves, per agent session, every
+navigation, agent execution (result and timing) and DOM evaluation. REPLAY
+stands in for Stagehand entirely: agents get a fake session that returns the
+recorded outputs after a simulated latency, so the orchestrator, parsers and
+scoring run deterministically without browsers, network or a Gemini key.
+
+    STAGEHAND_BACKEND=record STAGEHAND_RECORDING=data/recordings/louis_ck.json python main.py
+    STAGEHAND_BACKEND=replay STAGEHAND_RECORDING=data/recordings/louis_ck.json python main.py
+
+Sessions are keyed by agent name (ResearchAgent, TicketmasterAgent, ...).
+Replay hands out an agent's recorded sessions round-robin, so one recording
+can drive any number of searches.
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from collections import defaultdict, deque
+from typing import Any, Awaitable, Optional
+
+from .browser_pool import launch_stagehand
+
+
+# "live" (real browsers), "record" or "replay"
+STAGEHAND_BACKEND = os.environ.get("STAGEHAND_BACKEND", "live").lower()
+STAGEHAND_RECORDING = os.environ.get("STAGEHAND_RECORDING", "data/recordings/session.json")
+
+# Multiplier on recorded latencies during replay (0 = as fast as possible)
+REPLAY_LATENCY_SCALE = float(os.environ.get("REPLAY_LATENCY_SCALE", "1.0"))
+
+RECORDING_VERSION = 1
+
+
+class Recording:
+    """Recorded agent sessions: agent name -> sessions, each a list of operations."""
+
+    def __init__(self, sessions: Optional[dict[str, list[list[dict]]]] = None):
+        self.sessions = sessions or {}
+
+    @classmethod
+    def load(cls, path: str) -> "Recording":
+        """Load a recording saved with save()."""
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"No recording at {path} - record one with STAGEHAND_BACKEND=record STAGEHAND_RECORDING={path}"
+            )
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version {data.get('version')} in {path}")
+        return cls(data["sessions"])
+
+    def save(self, path: str) -> None:
+        """Write the recording atomically."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": RECORDING_VERSION, "sessions": self.sessions}, f, indent=1)
+        os.replace(tmp_path, path)
+
+    def missing(self, agent_names: list[str]) -> list[str]:
+        """The agents (of agent_names) with no recorded session."""
+        return [name for name in agent_names if not self.sessions.get(name)]
+
+    def add_session(self, agent_name: str) -> list[dict]:
+        """Start a new session for an agent and return its (live) operation list."""
+        operations: list[dict] = []
+        self.sessions.setdefault(agent_name, []).append(operations)
+        return operations
+
+
+def _dump_result(result: Any) -> Any:
+    """JSON form of an AgentResult (or whatever execute() returned)."""
+    if hasattr(result, "model_dump"):
+        return result.model_dump(mode="json")
+    return result
+
+
+def _load_result(data: Any) -> Any:
+    """Rebuild an AgentResult from _dump_result() output."""
+    if not isinstance(data, dict):
+        return data
+    from stagehand.types.agent import AgentResult
+
+    return AgentResult.model_validate(data)
+
+
+# ============================================================================
+# RECORD
+# ============================================================================
+
+
+class _Recorder:
+    """Times an awaitable and appends it to a session as one operation."""
+
+    def __init__(self, operations: list[dict], page: Any):
+        self.operations = operations
+        self.page = page
+
+    async def record(self, op: str, awaitable: Awaitable, keep_result: bool = False, **fields: Any) -> Any:
+        entry = {"op": op, **fields}
+        started = time.perf_counter()
+        try:
+            result = await awaitable
+            if keep_result:
+                entry["result"] = _dump_result(result)
+            return result
+        except Exception as e:
+            entry["error"] = str(e)
+            raise
+        finally:
+            entry["duration"] = round(time.perf_counter() - started, 3)
+            entry["url"] = getattr(self.page, "url", "")
+            self.operations.append(entry)
+
+
+class RecordingPage:
+    """Page wrapper that records goto() and evaluate()."""
+
+    def __init__(self, page: Any, recorder: _Recorder):
+        self._page = page
+        self._recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._page, name)
+
+    async def goto(self, url: str, **kwargs) -> Any:
+        return await self._recorder.record("goto", self._page.goto(url, **kwargs), url_requested=url)
+
+    async def evaluate(self, *args, **kwargs) -> Any:
+        return await self._recorder.record("evaluate", self._page.evaluate(*args, **kwargs), keep_result=True)
+
+
+class RecordingAgent:
+    """Agent wrapper that records execute() results and timings."""
+
+    def __init__(self, agent: Any, recorder: _Recorder):
+        self._agent = agent
+        self._recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._agent, name)  # cua_handler etc.
+
+    async def execute(self, **kwargs) -> Any:
+        instruction = str(kwargs.get("instruction", ""))
+        return await self._recorder.record(
+            "execute", self._agent.execute(**kwargs), keep_result=True, instruction=instruction[:200]
+        )
+
+
+class RecordingStagehand:
+    """Live Stagehand session whose page and agents are recorded."""
+
+    def __init__(self, stagehand: Any, operations: list[dict]):
+        self._stagehand = stagehand
+        self._operations = operations
+        self._page: Optional[RecordingPage] = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stagehand, name)
+
+    @property
+    def page(self) -> RecordingPage:
+        page = self._stagehand.page
+        if self._page is None or self._page._page is not page:
+            self._page = RecordingPage(page, _Recorder(self._operations, page))
+        return self._page
+
+    def agent(self, **kwargs) -> RecordingAgent:
+        page = self._stagehand.page
+        return RecordingAgent(self._stagehand.agent(**kwargs), _Recorder(self._operations, page))
+
+
+class RecordBackend:
+    """Launches real browsers and records every agent session to a file."""
+    name = "record"
+
+    def __init__(self, path: str):
+        self.path = path
+        self.recording = Recording.load(path) if os.path.exists(path) else Recording()
+
+    async def open(self, agent: Any) -> RecordingStagehand:
+        stagehand = await launch_stagehand(agent.headless, agent.verbose)
+        return RecordingStagehand(stagehand, self.recording.add_session(agent.name))
+
+    async def release(self, agent: Any, stagehand: Any, reusable: bool = True) -> None:
+        try:
+            await stagehand.close()
+        finally:
+            self.recording.save(self.path)
+            print(f"[{agent.name}] Session recorded to {self.path}")
+
+
+# ============================================================================
+# REPLAY
+# ============================================================================
+
+
+class ReplayLatency:
+    """
+    Simulated latency for replayed operations.
+
+    Each operation sleeps for its recorded duration times scale, unless
+    overrides gives a fixed duration for that operation kind ("launch",
+    "goto", "execute", "evaluate", "close"). jitter adds a seeded +/- fraction
+    so runs are varied but repeatable.
+    """
+
+    def __init__(
+        self,
+        scale: float = 1.0,
+        overrides: Optional[dict[str, float]] = None,
+        jitter: float = 0.0,
+        seed: int = 0,
+    ):
+        self.scale = scale
+        self.overrides = dict(overrides or {})
+        self.jitter = jitter
+        self._random = random.Random(seed)
+
+    def delay(self, op: str, recorded: float = 0.0) -> float:
+        seconds = self.overrides.get(op, recorded * self.scale)
+        if self.jitter and seconds:
+            seconds *= 1 + self._random.uniform(-self.jitter, self.jitter)
+        return max(0.0, seconds)
+
+    async def sleep(self, op: str, recorded: float = 0.0) -> None:
+        seconds = self.delay(op, recorded)
+        if seconds:
+            await asyncio.sleep(seconds)
+
+
+class ReplayPage:
+    """Fake page: goto() and evaluate() replay recorded operations in order."""
+
+    def __init__(self, operations: list[dict], latency: ReplayLatency):
+        self.url = "about:blank"
+        self._latency = latency
+        self._queues: dict[str, deque] = defaultdict(deque)
+        for entry in operations:
+            self._queues[entry["op"]].append(entry)
+
+    def next_op(self, op: str) -> Optional[dict]:
+        queue = self._queues[op]
+        return queue.popleft() if queue else None
+
+    async def replay(self, op: str) -> Optional[dict]:
+        """Wait out the next recorded op of this kind and apply its page URL."""
+        entry = self.next_op(op)
+        await self._latency.sleep(op, entry["duration"] if entry else 0.0)
+        if entry:
+            if entry.get("url"):
+                self.url = entry["url"]
+            if entry.get("error"):
+                raise Exception(entry["error"])
+        return entry
+
+    async def goto(self, url: str, **kwargs) -> None:
+        entry = await self.replay("goto")
+        if not (entry and entry.get("url")):
+            self.url = url
+
+    async def evaluate(self, *args, **kwargs) -> Any:
+        entry = await self.replay("evaluate")
+        return entry.get("result") if entry else None
+
+
+class ReplayAgent:
+    """Fake Computer Use agent returning recorded AgentResults."""
+
+    def __init__(self, page: ReplayPage):
+        self._page = page
+
+    async def execute(self, **kwargs) -> Any:
+        entry = await self._page.replay("execute")
+        if entry is None:
+            # Recording ran out - an agent that found nothing
+            return _load_result({"actions": [], "message": "", "usage": None, "completed": False})
+        return _load_result(entry.get("result"))
+
+
+class ReplayStagehand:
+    """Stand-in for a Stagehand session backed by one recorded session."""
+
+    def __init__(self, operations: list[dict], latency: ReplayLatency):
+        self.page = ReplayPage(operations, latency)
+        self._latency = latency
+
+    async def init(self) -> None:
+        pass
+
+    def agent(self, **kwargs) -> ReplayAgent:
+        return ReplayAgent(self.page)
+
+    async def close(self) -> None:
+        await self._latency.sleep("close")
+
+
+class ReplayBackend:
+    """Serves agents from a Recording instead of launching browsers."""
+    name = "replay"
+
+    def __init__(self, recording: Recording, latency: Optional[ReplayLatency] = None):
+        self.recording = recording
+        self.latency = latency or ReplayLatency()
+        self._next_session: dict[str, int] = defaultdict(int)
+
+    async def open(self, agent: Any) -> ReplayStagehand:
+        sessions = self.recording.sessions.get(agent.name)
+        if not sessions:
+            raise RuntimeError(f"No recorded session for {agent.name} (recorded: {', '.join(self.recording.sessions) or 'none'})")
+        index = self._next_session[agent.name]
+        self._next_session[agent.name] = index + 1
+        await self.latency.sleep("launch")
+        return ReplayStagehand(sessions[index % len(sessions)], self.latency)
+
+    async def release(self, agent: Any, stagehand: Any, reusable: bool = True) -> None:
+        await stagehand.close()
+
+
+# ============================================================================
+# SYNTHETIC RECORDINGS
+# ============================================================================
+
+
+SYNTHETIC_SECTIONS = [
+    ("Orchestra", 9), ("Floor", 9), ("Mezzanine", 7), ("Lower", 7),
+    ("Club", 7), ("Upper", 5), ("Balcony", 4),
+]
+
+
+def _synthetic_op(op: str, duration: float, url: str, result: Any = None) -> dict:
+    entry = {"op": op, "duration": round(duration, 3), "url": url}
+    if op == "execute":
+        entry["result"] = {
+            "actions": [],
+            "message": result,
+            "usage": {"input_tokens": 12000, "output_tokens": 800, "inference_time_ms": int(duration * 600)},
+            "completed": True,
+        }
+    return entry
+
+
+def synthesize_recording(
+    sites: list[str],
+    venue: str = "Bob Hope Theatre",
+    city: str = "Stockton",
+    listings_per_site: int = 40,
+    sessions_per_agent: int = 3,
+    seed: int = 0,
+    structured: bool = False,
+) -> Recording:
+    """
+    Build a plausible recording without a browser or API key.
+
+    Durations are in the range live searches take (seconds to minutes) and
+    agent messages use the formats the agents' parsers expect - site agents
+    answer with a JSON listing array if structured is set. Deterministic
+    for a given seed.
+    """
+    from .extractors import get_extractor
+    from .site_search import SITE_CONFIGS
+
+    rng = random.Random(seed)
+    recording = Recording()
+    google = "https://www.google.com/"
+
+    for _ in range(sessions_per_agent):
+        research = (
+            f"Found upcoming shows. 1) {venue}, {city} - Friday 8:00 PM. "
+            f"2) {venue}, {city} - Saturday 7:00 PM. Tickets are on sale."
+        )
+        recording.add_session("ResearchAgent").extend([
+            _synthetic_op("goto", rng.uniform(0.8, 2.0), google),
+            _synthetic_op("execute", rng.uniform(20, 40), google, research),
+        ])
+
+        ratings = "\n".join(
+            f"- Section: {name}, Quality: {score}/10, Notes: Reviewed"
+            for name, score in SYNTHETIC_SECTIONS
+        )
+        intel = f"{ratings}\nBest value sections: Mezzanine\nSections to avoid: Balcony"
+        recording.add_session("VenueIntelAgent").extend([
+            _synthetic_op("goto", rng.uniform(0.8, 2.0), google),
+            _synthetic_op("execute", rng.uniform(30, 60), google, intel),
+        ])
+
+        for site in sites:
+            config = SITE_CONFIGS[site]
+            event_url = f"{config['url']}/search?event={rng.randrange(10**6)}"
+            lines = []
+            payload = []
+            for _ in range(listings_per_site):
+                name, score = rng.choice(SYNTHETIC_SECTIONS)
+                price = round(rng.uniform(30, 120) * (1 + score / 10), 2)
+                section, row = f"{name} {rng.randint(1, 30)}", rng.choice("ABCDEFGHJK")
+                lines.append(f"Section: {section}, Row: {row}, Price: ${price:.2f}")
+                payload.append({
+                    "section": section, "row": row, "quantity": 2, "price": price,
+                    "fees": round(price * 0.18, 2), "verified": rng.random() < 0.3, "url": event_url,
+                })
+            answer = json.dumps(payload) if structured else "\n".join(lines)
+            ops = [_synthetic_op("goto", rng.uniform(1.0, 3.0), config["url"])]
+            navigation = _synthetic_op("execute", rng.uniform(15, 30), event_url, "Reached the event page.")
+            if get_extractor(site):
+                # DOM fast path: navigation run, page is not a recognised listing page
+                ops.append(navigation)
+            # Agent extraction (extraction-only after a navigation run, else the full search)
+            ops.append(_synthetic_op("execute", rng.uniform(40, 90), event_url, answer))
+            recording.add_session(f"{config['name']}Agent").extend(ops)
+
+    return recording
+
+
+# ============================================================================
+# BACKEND SELECTION
+# ============================================================================
+
+
+_backend = None
+_backend_configured = False
+
+
+def get_stagehand_backend():
+    """
+    The process-wide record/replay backend, or None for live browsers.
+
+    Configured from STAGEHAND_BACKEND / STAGEHAND_RECORDING /
+    REPLAY_LATENCY_SCALE unless set_stagehand_backend() was called.
+    """
+    global _backend, _backend_configured
+    if not _backend_configured:
+        if STAGEHAND_BACKEND == "record":
+            _backend = RecordBackend(STAGEHAND_RECORDING)
+        elif STAGEHAND_BACKEND == "replay":
+            _backend = ReplayBackend(
+                Recording.load(STAGEHAND_RECORDING),
+                ReplayLatency(scale=REPLAY_LATENCY_SCALE),
+            )
+        _backend_configured = True
+    return _backend
+
+
+def set_stagehand_backend(backend) -> None:
+    """Use a RecordBackend/ReplayBackend for every agent (None = live browsers)."""
+    global _backend, _backend_configured
+    _backend = backend
+    _backend_configured = True
@@ -8,17 +8,19 @@ from datetime import datetime
 from typing import Optional
 
 from .base import BaseAgent
+from .shared_browser import SharedBrowser
 from models import EventInfo, SearchQuery, AgentStatus
 
 
 class ResearchAgent(BaseAgent):
     """Agent that researches event information via Google search."""
 
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, shared_browser: Optional[SharedBrowser] = None):
         super().__init__(
             name="ResearchAgent",
             max_steps=8,  # Enough to search Google and extract event info
             headless=False,  # Never use headless mode
+            shared_browser=shared_browser,
         )
 
     def get_system_instructions(self) -> str:
@@ -75,7 +77,8 @@ Summarize your findings with specific dates and venues."""
                 )
 
                 # Parse results into EventInfo
-                return self._parse_results(query, result)
+                with self.instrument("parse"):
+                    return self._parse_results(query, result)
 
         except Exception as e:
             self.status = AgentStatus.FAILED
@@ -0,0 +1,200 @@
+"""
+Shared browser: one Chromium process that parallel agents attach to over CDP.
+Each agent gets its own isolated browser context (cookies, storage, pages),
+so concurrent site searches share a single process tree instead of one each.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from dotenv import load_dotenv
+from playwright.async_api import Browser, Playwright, async_playwright
+from stagehand import Stagehand, StagehandConfig
+from stagehand.browser import apply_stealth_scripts
+from stagehand.context import StagehandContext
+
+load_dotenv()
+
+
+# Chromium flags for the shared process (no GPU process, no automation banner)
+SHARED_BROWSER_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+]
+
+# Context options matching Stagehand's own local launch defaults
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 1288, "height": 711},
+    "locale": "en-US",
+    "timezone_id": "America/New_York",
+    "bypass_csp": True,
+    "ignore_https_errors": True,
+    "accept_downloads": True,
+}
+
+
+# How long to wait for Chromium to open its CDP endpoint
+STARTUP_TIMEOUT = 30.0
+
+
+async def _read_devtools_port(user_data_dir: Path, process: asyncio.subprocess.Process,
+                              timeout: float = STARTUP_TIMEOUT) -> int:
+    """
+    Wait for Chromium to write DevToolsActivePort and return the port in it.
+
+    Launched with --remote-debugging-port=0, Chromium binds a port itself and
+    writes it to the first line of this file, so no other process can take it
+    between choosing the port and binding it.
+    """
+    port_file = user_data_dir / "DevToolsActivePort"
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        if process.returncode is not None:
+            raise RuntimeError(f"Chromium exited with code {process.returncode} before opening CDP")
+        try:
+            first_line = port_file.read_text().splitlines()[0]
+            return int(first_line)
+        except (FileNotFoundError, IndexError, ValueError):
+            pass  # Not written yet (or only partly)
+        await asyncio.sleep(0.05)
+    raise RuntimeError(f"Chromium did not open a CDP endpoint within {timeout:.0f}s")
+
+
+class SharedBrowser:
+    """
+    A single Chromium process hosting one isolated context per agent.
+
+    Usage:
+        async with SharedBrowser() as browser:
+            agent = SiteSearchAgent("tickpick", shared_browser=browser)
+            await agent.run(event_info)
+    """
+
+    def __init__(self, headless: bool = False):
+        self.headless = headless
+        self.cdp_url: Optional[str] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._user_data_dir: Optional[Path] = None
+
+    async def start(self) -> None:
+        """Launch the shared Chromium process with a CDP endpoint."""
+        if self._browser:
+            return
+
+        # Launched directly (not via playwright.chromium.launch) so the port
+        # Chromium binds can be read back from its profile directory
+        self._playwright = await async_playwright().start()
+        self._user_data_dir = Path(tempfile.mkdtemp(prefix="shared-browser-"))
+        args = SHARED_BROWSER_ARGS + [
+            "--remote-debugging-port=0",
+            f"--user-data-dir={self._user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+        ]
+        if self.headless:
+            args.append("--headless=new")
+
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                self._playwright.chromium.executable_path, *args, "about:blank",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            port = await _read_devtools_port(self._user_data_dir, self._process)
+            self.cdp_url = f"http://127.0.0.1:{port}"
+            self._browser = await self._playwright.chromium.connect_over_cdp(self.cdp_url)
+        except Exception:
+            await self.close()
+            raise
+        print(f"[SharedBrowser] Chromium started at {self.cdp_url}")
+
+    async def new_session(self, verbose: int = 1) -> Stagehand:
+        """Attach a Stagehand session to the shared browser in a fresh context."""
+        if not self.cdp_url:
+            raise RuntimeError("SharedBrowser not started. Call start() first.")
+
+        config = StagehandConfig(
+            env="LOCAL",
+            model_api_key=os.environ.get("GEMINI_API_KEY"),
+            headless=self.headless,
+            verbose=verbose,
+            local_browser_launch_options={"cdp_url": self.cdp_url},
+        )
+        stagehand = Stagehand(config)
+        await stagehand.init()
+
+        try:
+            await self._isolate(stagehand)
+        except Exception:
+            await stagehand.close()
+            raise
+        return stagehand
+
+    async def release(self, stagehand: Stagehand) -> None:
+        """Close an agent's context; the shared process keeps running."""
+        # Over CDP, Stagehand.close() closes its own context and only disconnects
+        await stagehand.close()
+
+    async def close(self) -> None:
+        """Shut down the shared Chromium process."""
+        if self._browser:
+            # Over CDP this only disconnects; the process is stopped below
+            await self._browser.close()
+            self._browser = None
+        if self._process:
+            if self._process.returncode is None:
+                self._process.terminate()
+                try:
+                    await asyncio.wait_for(self._process.wait(), timeout=10)
+                except asyncio.TimeoutError:
+                    self._process.kill()
+                    await self._process.wait()
+            self._process = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        if self._user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+            self._user_data_dir = None
+        self.cdp_url = None
+        print("[SharedBrowser] Chromium stopped")
+
+    async def _isolate(self, stagehand: Stagehand) -> None:
+        """
+        Move a CDP-attached Stagehand off the browser's default context.
+
+        Stagehand always attaches to contexts[0] when given a cdp_url, which
+        would make every agent share cookies and tabs. Swap in a new context
+        and page so agents cannot see each other.
+        """
+        default_page = stagehand._playwright_page
+
+        context = await stagehand._browser.new_context(**CONTEXT_OPTIONS)
+        await apply_stealth_scripts(context, stagehand.logger)
+        stagehand_context = await StagehandContext.init(context, stagehand)
+        page = await stagehand_context.new_page()  # Also becomes stagehand.page
+
+        stagehand._context = context
+        stagehand.context = stagehand_context
+        stagehand._playwright_page = page._page
+
+        # The default-context tab is no longer used (another agent may close it first)
+        try:
+            await default_page.close()
+        except Exception:
+            pass
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
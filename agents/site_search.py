@@ -3,14 +3,36 @@ Site Search Agents: Specialized agents for each ticketing platform.
 Each agent searches its assigned site and extracts ticket listings.
 """
 
-import re
+import os
 import uuid
 from typing import Optional
 
 from .base import BaseAgent
+from .extractors import get_extractor
+from .listing_parser import extract_text, parse_json_listings, parse_listings
+from .shared_browser import SharedBrowser
 from models import EventInfo, TicketListing, SiteSearchResult, AgentStatus
 
 
+# Agent step budget for reaching the listing page on the DOM fast path
+NAVIGATION_MAX_STEPS = 12
+
+# Ask site agents for a JSON listing payload instead of "Section: X, Row: Y, Price: $Z" text
+STRUCTURED_LISTINGS = os.environ.get("STRUCTURED_LISTINGS", "false").lower() == "true"
+
+TEXT_OUTPUT_FORMAT = """OUTPUT FORMAT - List each ticket like this:
+Section: [name], Row: [row], Price: $[amount]"""
+
+JSON_OUTPUT_FORMAT = """OUTPUT FORMAT - Your final answer must be ONLY a JSON array with one object per listing:
+[{"section": "101", "row": "F", "quantity": 2, "price": 89.50, "fees": 12.30, "verified": false, "url": ""}]
+- section: section name as shown; row: row as shown ("" if not shown)
+- quantity: tickets in the listing (2 if not shown)
+- price: price per ticket in USD before fees, as a number (no $)
+- fees: fees per ticket in USD (0 if included or not shown)
+- verified: true only if the site marks the tickets as verified
+- url: link to the listing ("" if none)
+Do not wrap the array in prose - no text before or after it."""
+
 # Site configurations
 SITE_CONFIGS = {
     "ticketmaster": {
@@ -34,10 +56,7 @@ PRICE EXTRACTION:
 - Prices shown include fees (look for "Prices include fees")
 - Note if tickets are "Official Platinum" (dynamic pricing)
 - Note if tickets are "Verified Resale"
-- Extract: Section, Row, Price for each listing
-
-OUTPUT FORMAT - Use this exact format for each ticket:
-Section: [name], Row: [row], Price: $[amount]""",
+- Extract: Section, Row, Price for each listing""",
     },
     "stubhub": {
         "url": "https://www.stubhub.com",
@@ -96,17 +115,23 @@ class SiteSearchAgent(BaseAgent):
         self,
         site_name: str,
         headless: bool = False,
+        shared_browser: Optional[SharedBrowser] = None,
+        structured_output: Optional[bool] = None,
     ):
         if site_name not in SITE_CONFIGS:
             raise ValueError(f"Unknown site: {site_name}. Valid: {list(SITE_CONFIGS.keys())}")
 
         self.site_name = site_name
         self.site_config = SITE_CONFIGS[site_name]
+        self.extractor = get_extractor(site_name)
+        self.structured_output = STRUCTURED_LISTINGS if structured_output is None else structured_output
+        self.parse_format = ""  # How the last agent answer was parsed: json, text or none
 
         super().__init__(
             name=f"{self.site_config['name']}Agent",
             max_steps=20,  # Increased for Ticketmaster popups and location filter
             headless=False,  # Never use headless mode
+            shared_browser=shared_browser,
         )
 
     def get_system_instructions(self) -> str:
@@ -126,7 +151,7 @@ For each ticket listing you find, extract:
 SCROLLING:
 - Use keypress PageDown to scroll (NOT scroll_at - it has a library bug)
 - Extract visible tickets BEFORE scrolling
-- Format your findings clearly: "Section: X, Row: Y, Price: $Z"
+- {self._findings_format()}
 
 Be thorough - review all available listings to find the best options.
 If you encounter a CAPTCHA or are blocked, report this and try to proceed if possible."""
@@ -144,6 +169,7 @@ If you encounter a CAPTCHA or are blocked, report this and try to proceed if pos
         result = SiteSearchResult(
             site_name=self.site_name,
             status=AgentStatus.PENDING,
+            timeline=self.timeline,  # Filled in as the agent's steps complete
         )
 
         try:
@@ -151,10 +177,72 @@ If you encounter a CAPTCHA or are blocked, report this and try to proceed if pos
                 # Navigate to the site
                 await self.navigate(self.site_config["url"])
 
-                # Build search instruction - site-specific strategies
-                if self.site_name == "ticketmaster":
-                    # Ticketmaster: Skip location filter (it's buggy), scroll to find city
-                    search_instruction = f"""Search for tickets to: {event_info.artist_name}
+                instruction = self._build_search_instruction(event_info)
+                max_steps = None
+
+                # Fast path: agent only navigates, listings are read from the DOM.
+                # On a selector miss the agent carries on from the listing page with
+                # the rest of the step budget - never more than a full search
+                if self.extractor:
+                    navigation = await self.execute_agent(
+                        self._build_navigation_instruction(event_info),
+                        max_steps=NAVIGATION_MAX_STEPS,
+                    )
+                    result.search_url = self.stagehand.page.url if self.stagehand else ""
+                    if not navigation["success"]:
+                        result.status = AgentStatus.PARTIAL
+                        result.error_message = navigation.get("error") or "Could not reach the listing page"
+                        return result
+
+                    listings = await self._run_dom_extraction()
+                    if listings:
+                        result.status = AgentStatus.SUCCESS
+                        result.listings = listings
+                        return result
+
+                    instruction = self._build_extraction_instruction(event_info)
+                    max_steps = max(self.max_steps - NAVIGATION_MAX_STEPS, 1)
+
+                # Execute the search
+                agent_result = await self.execute_agent(instruction, max_steps=max_steps)
+
+                result.status = AgentStatus.SUCCESS if agent_result["success"] else AgentStatus.PARTIAL
+                result.search_url = self.stagehand.page.url if self.stagehand else ""
+
+                # Parse listings from agent output
+                with self.instrument("parse") as step:
+                    result.listings = self._parse_listings(agent_result)
+                    step.attributes["listings"] = len(result.listings)
+                    step.attributes["format"] = self.parse_format
+
+        except Exception as e:
+            result.status = AgentStatus.FAILED
+            result.error_message = str(e)
+            print(f"[{self.name}] Error: {e}")
+
+        return result
+
+    async def _run_dom_extraction(self) -> list[TicketListing]:
+        """
+        Read listings from the page the navigation run stopped on.
+
+        Returns an empty list when the selectors miss; the caller then has the
+        agent extract from the same page.
+        """
+        with self.instrument("extract") as step:
+            listings = await self.extractor.extract(self.stagehand.page)
+            step.attributes["listings"] = len(listings)
+        if listings:
+            print(f"[{self.name}] DOM fast path extracted {len(listings)} listings")
+        else:
+            print(f"[{self.name}] DOM fast path missed - falling back to agent extraction")
+        return listings
+
+    def _build_search_instruction(self, event_info: EventInfo) -> str:
+        """Build the full search + extraction instruction (site-specific strategies)."""
+        if self.site_name == "ticketmaster":
+            # Ticketmaster: Skip location filter (it's buggy), scroll to find city
+            return f"""Search for tickets to: {event_info.artist_name}
 
 Target City: {event_info.city}
 
@@ -166,13 +254,12 @@ STRATEGY FOR TICKETMASTER:
 5. Handle popups: Click "Accept & Continue" or "Any" for ticket quantity
 6. Extract all visible ticket prices with Section, Row, and Price
 
-OUTPUT FORMAT - List each ticket like this:
-Section: [name], Row: [row], Price: $[amount]
+{self._output_format()}
 
 Use keypress PageDown to scroll and see more tickets."""
-                else:
-                    # Other sites: Use location filter normally
-                    search_instruction = f"""Search for tickets to: {event_info.artist_name}
+
+        # Other sites: Use location filter normally
+        return f"""Search for tickets to: {event_info.artist_name}
 
 City: {event_info.city}
 
@@ -183,164 +270,85 @@ Steps:
 4. View the ticket listings page
 5. Extract pricing for ALL visible tickets
 
-OUTPUT FORMAT - List each ticket like this:
-Section: [name], Row: [row], Price: $[amount]
+{self._output_format()}
 
 Use keypress PageDown to scroll and see more listings.
 
 IMPORTANT: Only find tickets in or very near {event_info.city}."""
 
-                # Execute the search
-                agent_result = await self.execute_agent(search_instruction)
+    def _build_extraction_instruction(self, event_info: EventInfo) -> str:
+        """Build an extraction-only instruction that starts on the listing page."""
+        return f"""Extract the ticket listings for: {event_info.artist_name}
 
-                result.status = AgentStatus.SUCCESS if agent_result["success"] else AgentStatus.PARTIAL
-                result.search_url = self.stagehand.page.url if self.stagehand else ""
+City: {event_info.city}
 
-                # Parse listings from agent output
-                result.listings = self._parse_listings(agent_result)
+You are already on the ticket listings page - do NOT search again or go back.
+1. Close any popups covering the ticket list (choose "Any" for ticket quantity)
+2. Extract pricing for ALL visible tickets
 
-        except Exception as e:
-            result.status = AgentStatus.FAILED
-            result.error_message = str(e)
-            print(f"[{self.name}] Error: {e}")
+{self._output_format()}
 
-        return result
+Use keypress PageDown to scroll and see more listings."""
 
-    def _parse_listings(self, agent_result: dict) -> list[TicketListing]:
-        """Parse agent output into TicketListing objects."""
-        listings = []
+    def _output_format(self) -> str:
+        """The answer format the agent is asked for (JSON payload or listing lines)."""
+        return JSON_OUTPUT_FORMAT if self.structured_output else TEXT_OUTPUT_FORMAT
 
-        if not agent_result.get("success"):
-            return listings
+    def _findings_format(self) -> str:
+        if self.structured_output:
+            return "Keep track of every listing and report them all as one JSON array at the end"
+        return 'Format your findings clearly: "Section: X, Row: Y, Price: $Z"'
 
-        # The agent returns a complex object - try multiple extraction methods
-        result = agent_result.get("result")
+    def _build_navigation_instruction(self, event_info: EventInfo) -> str:
+        """Build a navigation-only instruction that stops on the listing page."""
+        if self.site_name == "ticketmaster":
+            steps = f"""1. Type "{event_info.artist_name}" in the search bar and press Enter
+2. DO NOT use the location filter - it clears unexpectedly
+3. Scroll down the results to find shows in {event_info.city}
+4. Click on the {event_info.city} event to view tickets
+5. Handle popups: Click "Accept & Continue" or "Any" for ticket quantity"""
+        else:
+            steps = f"""1. Use the search bar to search for "{event_info.artist_name}"
+2. Set location filter to "{event_info.city}" if available
+3. Select ANY show in {event_info.city}
+4. Close any popups covering the ticket list"""
 
-        # Collect all text from the result object
-        result_texts = []
+        return f"""Open the ticket listings page for: {event_info.artist_name}
 
-        # Method 1: Try common text attributes
-        for attr in ['message', 'text', 'content', 'output', 'reasoning', 'thoughts']:
-            if hasattr(result, attr):
-                text = getattr(result, attr)
-                if text:
-                    result_texts.append(str(text))
+City: {event_info.city}
 
-        # Method 2: If result is a dict, get all string values
-        if isinstance(result, dict):
-            for key, value in result.items():
-                if isinstance(value, str) and len(value) > 10:
-                    result_texts.append(value)
+Steps:
+{steps}
 
-        # Method 3: Get string representation
-        result_texts.append(str(result))
+STOP as soon as the ticket listings are visible on screen.
+Do NOT scroll through or extract the listings - just report the page you ended on."""
+
+    def _parse_listings(self, agent_result: dict) -> list[TicketListing]:
+        """Parse agent output into TicketListing objects."""
+        listings = []
+        self.parse_format = "none"
 
-        # Method 4: Check for __dict__ attribute (object introspection)
-        if hasattr(result, '__dict__'):
-            for key, value in result.__dict__.items():
-                if isinstance(value, str) and len(value) > 10:
-                    result_texts.append(value)
+        if not agent_result.get("success"):
+            return listings
 
-        # Combine all text sources
-        full_text = "\n".join(result_texts)
+        # The agent returns a complex object - read each distinct text once
+        result = agent_result.get("result")
+        full_text = extract_text(result)
 
         print(f"[{self.name}] Parsing result (first 1000 chars): {full_text[:1000]}")
 
-        # Enhanced parsing patterns
-        # Pattern 1: "Section: X, Row: Y, Price: $Z" (agent output format)
-        structured_pattern = r'Section:\s*([^,\n]+)(?:,\s*Row:\s*([^,\n]+))?,.*?Price:\s*\$(\d+(?:\.\d{2})?)'
-        structured_matches = re.findall(structured_pattern, full_text, re.IGNORECASE)
+        # Structured payload first; the text patterns are the fallback
+        if self.structured_output:
+            listings = parse_json_listings(full_text, self.site_name) or []
+            if listings:
+                self.parse_format = "json"
+            else:
+                print(f"[{self.name}] No valid JSON listing payload - falling back to text parsing")
 
-        for section, row, price in structured_matches:
-            listing = TicketListing(
-                source=self.site_name,
-                section=section.strip(),
-                row=row.strip() if row else "",
-                price_per_ticket=float(price),
-                total_price=float(price),
-                quantity=2,
-            )
-            listings.append(listing)
-
-        # Pattern 2: Ticketmaster style "Sec OR • Row M" with nearby price
-        # Matches: "Sec OR • Row M, Standard Admission, $99.75"
-        ticketmaster_pattern = r'Sec\s+([A-Z0-9]+)\s*[•·]\s*Row\s+([A-Z0-9]+)[^$]*\$(\d+(?:\.\d{2})?)'
-        tm_matches = re.findall(ticketmaster_pattern, full_text, re.IGNORECASE)
-        
-        for section, row, price in tm_matches:
-            # Avoid duplicates
-            is_dup = any(
-                l.section == section.strip() and l.row == row.strip() 
-                for l in listings
-            )
-            if not is_dup:
-                listings.append(TicketListing(
-                    source=self.site_name,
-                    section=section.strip(),
-                    row=row.strip(),
-                    price_per_ticket=float(price),
-                    total_price=float(price),
-                    quantity=2,
-                ))
-
-        # Pattern 3: TickPick/general style "**Section:** Name, **Row:** X, ... $Y"
-        tickpick_pattern = r'\*\*(?:Section|Sec)[:\s]*\*\*\s*([^,*]+),?\s*\*\*Row[:\s]*\*\*\s*([^,*]+).*?\$(\d+(?:\.\d{2})?)'
-        tp_matches = re.findall(tickpick_pattern, full_text, re.IGNORECASE)
-        
-        for section, row, price in tp_matches:
-            is_dup = any(
-                l.section == section.strip() and l.row == row.strip() 
-                for l in listings
-            )
-            if not is_dup:
-                listings.append(TicketListing(
-                    source=self.site_name,
-                    section=section.strip(),
-                    row=row.strip(),
-                    price_per_ticket=float(price),
-                    total_price=float(price),
-                    quantity=2,
-                ))
-
-        # Pattern 2: Fallback to simple price extraction if structured parsing fails
         if not listings:
-            price_pattern = r'\$(\d+(?:\.\d{2})?)'
-            prices = re.findall(price_pattern, full_text)
-
-            # Look for section patterns (more flexible)
-            section_patterns = [
-                r'Section:\s*([A-Za-z0-9\s]+?)(?:,|\n|Row)',
-                r'(?:Section|Sec\.?)\s*([A-Za-z0-9\s]+)',
-                r'([A-Z][a-z]+\s+Balc(?:ony)?\s+(?:Center|Left|Right|Centre))',
-                r'([A-Z][a-z]+\s+(?:Floor|Orchestra|Mezzanine|Balcony))',
-            ]
-
-            sections = []
-            for pattern in section_patterns:
-                sections = re.findall(pattern, full_text, re.IGNORECASE)
-                if sections:
-                    break
-
-            # Look for row patterns
-            row_pattern = r'Row:\s*([A-Za-z0-9]+)'
-            rows = re.findall(row_pattern, full_text, re.IGNORECASE)
-
-            print(f"[{self.name}] Found {len(prices)} prices, {len(sections)} sections, {len(rows)} rows")
-
-            # Create listings from found data
-            for i, price in enumerate(prices[:10]):  # Limit to 10 listings
-                section = sections[i].strip() if i < len(sections) else f"Section {i+1}"
-                row = rows[i].strip() if i < len(rows) else ""
-
-                listing = TicketListing(
-                    source=self.site_name,
-                    section=section,
-                    row=row,
-                    price_per_ticket=float(price),
-                    total_price=float(price),  # Agent should report with fees
-                    quantity=2,  # Default assumption
-                )
-                listings.append(listing)
+            listings = parse_listings(full_text, self.site_name)
+            if listings:
+                self.parse_format = "text"
 
         # If still no prices found, create a placeholder
         if not listings:
@@ -352,26 +360,25 @@ IMPORTANT: Only find tickets in or very near {event_info.city}."""
                 section="Various",
                 notes="Could not extract specific pricing - check site directly",
             ))
+        else:
+            print(f"[{self.name}] Parsed {len(listings)} unique listings")
 
-        # Deduplicate listings (agent reasoning can repeat the same data)
-        seen = set()
-        unique_listings = []
-        for listing in listings:
-            # Create a unique key based on section, row, and price
-            key = (listing.section, listing.row or "", listing.price_per_ticket)
-            if key not in seen:
-                seen.add(key)
-                unique_listings.append(listing)
-
-        if len(listings) != len(unique_listings):
-            print(f"[{self.name}] Deduplicated {len(listings)} listings down to {len(unique_listings)} unique")
-
-        return unique_listings
+        return listings
 
 
-def create_site_agent(site_name: str, headless: bool = False) -> SiteSearchAgent:
+def create_site_agent(
+    site_name: str,
+    headless: bool = False,
+    shared_browser: Optional[SharedBrowser] = None,
+    structured_output: Optional[bool] = None,
+) -> SiteSearchAgent:
     """Factory function to create a site-specific search agent."""
-    return SiteSearchAgent(site_name=site_name, headless=headless)
+    return SiteSearchAgent(
+        site_name=site_name,
+        headless=headless,
+        shared_browser=shared_browser,
+        structured_output=structured_output,
+    )
 
 
 async def run_site_search(site_name: str, event_info: EventInfo, headless: bool = False) -> SiteSearchResult:
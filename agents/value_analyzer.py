@@ -1,14 +1,30 @@
 """
 ValueAnalyzerAgent: Calculates aiValueScore for each ticket based on price and seat quality.
 This is a pure Python agent - no browser needed, just computation.
+
+The same seats listed on several sites are merged first (keyed on canonical
+section, row, seat numbers and quantity), keeping the cheapest listing with
+the others as alternates. Listings without seat numbers are never merged -
+two sites' tickets in the same row are usually different seats. Each physical seat is then scored once, as columns
+(price, section quality, verified) with NumPy, and Seat objects are only
+built for the rows that are returned.
 """
 
-import statistics
+import os
 import uuid
-from typing import Optional
+from itertools import compress
+from operator import attrgetter
+from typing import Iterable, Optional
+
+import numpy as np
 
 from models import (
+    SectionIndex,
     Seat,
+    SeatAlternate,
+    canonical_section,
+    canonical_seats,
+    seat_key,
     TicketListing,
     SiteSearchResult,
     VenueIntel,
@@ -18,6 +34,106 @@ from models import (
 )
 
 
+# Common section quality mappings, used when venue intel is unavailable (first match wins)
+ESTIMATED_SECTION_QUALITY = {
+    "floor": 9.0,
+    "pit": 9.5,
+    "vip": 9.0,
+    "orchestra": 8.5,
+    "front": 8.5,
+    "premium": 8.0,
+    "lower": 7.5,
+    "club": 7.0,
+    "100": 7.5,
+    "200": 6.0,
+    "mezzanine": 6.5,
+    "mezz": 6.5,
+    "loge": 6.0,
+    "upper": 5.0,
+    "300": 5.0,
+    "balcony": 4.5,
+    "400": 4.0,
+    "nosebleed": 3.5,
+}
+
+# Default middle quality for unknown sections
+ESTIMATED_DEFAULT_QUALITY = 5.5
+
+# Precompiled once; a key matches when it appears anywhere in the canonical section name
+ESTIMATED_SECTION_INDEX = SectionIndex(
+    ESTIMATED_SECTION_QUALITY.items(),
+    default=ESTIMATED_DEFAULT_QUALITY,
+    match_contained=False,
+    normalize=canonical_section,
+)
+
+
+def merge_key(listing: TicketListing) -> Optional[tuple]:
+    """
+    Listings with equal keys on different sites are the same physical seats.
+
+    None when the listing has no seat numbers: section and row alone do not
+    identify seats, so such listings are never merged.
+    """
+    seats = canonical_seats(listing.seat_numbers or "")
+    if not seats:
+        return None
+    return (
+        *seat_key(listing.section, listing.row),
+        seats,
+        listing.quantity,
+    )
+
+
+_SECTION = attrgetter("section")
+_SEAT_NUMBERS = attrgetter("seat_numbers")
+_TOTAL_PRICE = attrgetter("total_price")
+_PRICE_PER_TICKET = attrgetter("price_per_ticket")
+_IS_VERIFIED = attrgetter("is_verified")
+
+
+def value_scores(
+    prices: np.ndarray,
+    qualities: np.ndarray,
+    verified: np.ndarray,
+    median_price: float,
+) -> np.ndarray:
+    """
+    aiValueScore (0-100) per seat: quality x 10 / (price / median price).
+
+    Cheaper than the median and better sections score higher; verified
+    sellers get a 10% bonus; the result is clipped to 0-100 and truncated.
+    Unknown prices (<= 0) score 50.
+    """
+    priced = prices > 0
+    # Divide by 1.0 where the price is unknown to keep the arithmetic finite
+    price_ratios = np.where(priced, prices, 1.0) / median_price
+    raw_scores = (qualities * 10) / price_ratios
+    raw_scores = np.where(verified, raw_scores * 1.10, raw_scores)
+    scores = np.clip(raw_scores, 0, 100).astype(np.int64)
+    return np.where(priced, scores, 50)
+
+
+def seat_ids(count: int) -> list[str]:
+    """count random version-4 UUID strings, from one urandom call instead of a uuid4() each."""
+    digits = os.urandom(16 * count).hex()
+    return [
+        f"{digits[i:i + 8]}-{digits[i + 8:i + 12]}-4{digits[i + 13:i + 16]}-"
+        f"{_UUID_VARIANT[digits[i + 16]]}{digits[i + 17:i + 20]}-{digits[i + 20:i + 32]}"
+        for i in range(0, 32 * count, 32)
+    ]
+
+
+# RFC 4122 variant: the first hex digit of the fourth group is 8, 9, a or b
+_UUID_VARIANT = {digit: "89ab"[int(digit, 16) % 4] for digit in "0123456789abcdef"}
+
+
+def merge_price(listing: TicketListing) -> float:
+    """All-in price for picking the cheapest duplicate (unknown prices sort last)."""
+    price = listing.total_price or listing.price_per_ticket
+    return price if price > 0 else float("inf")
+
+
 class ValueAnalyzerAgent:
     """
     Analyzes ticket listings and calculates value scores.
@@ -32,6 +148,7 @@ class ValueAnalyzerAgent:
         search_results: dict[str, SiteSearchResult],
         venue_intel: Optional[VenueIntel] = None,
         event_info: Optional[EventInfo] = None,
+        top_k: Optional[int] = None,
     ) -> tuple[list[Seat], list[Event]]:
         """
         Analyze all ticket listings and calculate value scores.
@@ -40,6 +157,7 @@ class ValueAnalyzerAgent:
             search_results: Dict of site_name -> SiteSearchResult
             venue_intel: Venue quality information (optional)
             event_info: Event details (optional)
+            top_k: Only return the best top_k seats (default: all)
 
         Returns:
             Tuple of (ranked_seats, events)
@@ -55,20 +173,27 @@ class ValueAnalyzerAgent:
             print(f"[{self.name}] No listings to analyze")
             return [], []
 
+        # One entry per physical seat: cheapest listing plus the same seats on other sites
+        all_listings, alternates = self._merge_listings(all_listings)
+
         # Calculate median price for normalization
-        prices = [l.total_price for l in all_listings if l.total_price > 0]
-        median_price = statistics.median(prices) if prices else 100.0
+        totals = np.fromiter(map(_TOTAL_PRICE, all_listings), dtype=np.float64, count=len(all_listings))
+        prices = totals[totals > 0]
+        median_price = float(np.median(prices)) if prices.size else 100.0
 
         print(f"[{self.name}] Median price: ${median_price:.2f}")
 
-        # Calculate value score for each listing
-        scored_seats = []
-        for listing in all_listings:
-            seat = self._create_seat_from_listing(listing, venue_intel, median_price)
-            scored_seats.append(seat)
+        # Score every listing at once, then rank (highest first, ties keep listing order)
+        scores = self._score_listings(all_listings, venue_intel, median_price)
+        order = np.argsort(-scores, kind="stable")
+        if top_k is not None:
+            order = order[:max(top_k, 0)]
 
-        # Sort by value score (highest first)
-        scored_seats.sort(key=lambda s: s.aiValueScore, reverse=True)
+        # Only the returned rows become Seats
+        scored_seats = [
+            self._seat_from_listing(all_listings[i], score, alternates.get(i, ()), seat_id)
+            for i, score, seat_id in zip(order.tolist(), scores[order].tolist(), seat_ids(len(order)))
+        ]
 
         # Create events for frontend
         events = self._create_events(search_results, event_info)
@@ -77,30 +202,105 @@ class ValueAnalyzerAgent:
 
         return scored_seats, events
 
-    def _create_seat_from_listing(
+    def _merge_listings(
         self,
-        listing: TicketListing,
+        listings: list[TicketListing],
+    ) -> tuple[list[TicketListing], dict[int, list[TicketListing]]]:
+        """
+        Group the same seats listed on different sites, in one pass.
+
+        Listings share a group when they have seat numbers, their canonical
+        section, row, seat numbers and quantity match, and the group has no
+        listing from that site yet - listings within one site are already
+        deduplicated, so matching ones there are different seats. Each group
+        keeps its cheapest listing (unknown prices lose), in the position of
+        the group's first listing.
+
+        Returns:
+            Tuple of (one listing per group, group position -> other listings)
+        """
+        # Only listings with seat numbers can merge - usually none, so skip the keying
+        seated = list(compress(range(len(listings)), map(_SEAT_NUMBERS, listings)))
+        if not seated:
+            return list(listings), {}
+
+        first_group: dict[tuple, int] = {}
+        more_groups: dict[tuple, list[int]] = {}  # Further groups for a key, same site twice
+        groups: dict[int, list[TicketListing]] = {}  # First listing's index -> duplicates
+        absorbed: set[int] = set()
+
+        for i in seated:
+            listing = listings[i]
+            key = merge_key(listing)
+            first = first_group.get(key)
+            if first is None:
+                first_group[key] = i
+                continue
+
+            for first in (first, *more_groups.get(key, ())):
+                group = groups.get(first, ())
+                if listings[first].source != listing.source and all(o.source != listing.source for o in group):
+                    groups.setdefault(first, []).append(listing)
+                    absorbed.add(i)
+                    break
+            else:
+                more_groups.setdefault(key, []).append(i)
+
+        if not groups:
+            return list(listings), {}
+
+        merged: list[TicketListing] = []
+        alternates: dict[int, list[TicketListing]] = {}
+        for i, listing in enumerate(listings):
+            if i in absorbed:
+                continue
+            others = groups.get(i)
+            if others:
+                group = sorted([listing, *others], key=merge_price)
+                listing = group[0]
+                alternates[len(merged)] = group[1:]
+            merged.append(listing)
+
+        print(f"[{self.name}] Merged {len(absorbed)} cross-site duplicate listings into {len(alternates)} seats")
+        return merged, alternates
+
+    def _score_listings(
+        self,
+        listings: list[TicketListing],
         venue_intel: Optional[VenueIntel],
         median_price: float,
-    ) -> Seat:
-        """Convert a TicketListing to a Seat with aiValueScore."""
+    ) -> np.ndarray:
+        """
+        aiValueScore for every listing, as an int array in listing order.
 
-        # Get section quality (1-10)
-        if venue_intel:
-            section_quality = venue_intel.get_section_quality(listing.section)
-        else:
-            section_quality = self._estimate_section_quality(listing.section)
+        Columns are gathered with map() over attribute getters, so no Python
+        code runs per listing. Section quality is looked up once per
+        canonical section name, so "Sec 101" and "Section 101" share a lookup.
+        """
+        count = len(listings)
+        get_quality = venue_intel.get_section_quality if venue_intel else self._estimate_section_quality
 
-        # Calculate value score (0-100)
-        value_score = self._calculate_value_score(
-            price=listing.total_price or listing.price_per_ticket,
-            section_quality=section_quality,
-            median_price=median_price,
-            is_verified=listing.is_verified,
-        )
+        sections = list(map(canonical_section, map(_SECTION, listings)))
+        quality_by_section = {section: get_quality(section) for section in set(sections)}
+        qualities = np.fromiter(map(quality_by_section.__getitem__, sections), dtype=np.float64, count=count)
 
+        totals = np.fromiter(map(_TOTAL_PRICE, listings), dtype=np.float64, count=count)
+        per_ticket = np.fromiter(map(_PRICE_PER_TICKET, listings), dtype=np.float64, count=count)
+        verified = np.fromiter(map(_IS_VERIFIED, listings), dtype=bool, count=count)
+        prices = np.where(totals != 0, totals, per_ticket)  # total_price or price_per_ticket
+
+        return value_scores(prices, qualities, verified, median_price)
+
+    def _seat_from_listing(
+        self,
+        listing: TicketListing,
+        value_score: int,
+        alternates: Iterable[TicketListing] = (),
+        seat_id: Optional[str] = None,
+    ) -> Seat:
+        """Build the Seat for a listing that has already been scored."""
         return Seat(
-            id=str(uuid.uuid4()),
+            id=seat_id or str(uuid.uuid4()),
             section=listing.section,
             row=listing.row or "",
             seatNumber=listing.seat_numbers or "",
@@ -110,85 +310,20 @@ class ValueAnalyzerAgent:
             fees=listing.fees_per_ticket,
             url=listing.url,
             source=listing.source,
+            alternates=[
+                SeatAlternate(
+                    source=alternate.source,
+                    price=alternate.total_price or alternate.price_per_ticket,
+                    fees=alternate.fees_per_ticket,
+                    url=alternate.url,
+                )
+                for alternate in alternates
+            ],
         )
 
-    def _calculate_value_score(
-        self,
-        price: float,
-        section_quality: float,
-        median_price: float,
-        is_verified: bool = False,
-    ) -> int:
-        """
-        Calculate aiValueScore (0-100) for a seat.
-
-        Formula: score = (quality / price_ratio) * multiplier
-        Higher quality and lower price = higher score
-
-        Args:
-            price: Total ticket price
-            section_quality: Quality rating 1-10
-            median_price: Median price across all listings
-            is_verified: Whether seller is verified (bonus)
-
-        Returns:
-            aiValueScore between 0-100
-        """
-        if price <= 0:
-            return 50  # Default for unknown prices
-
-        # Calculate price ratio (how expensive relative to median)
-        price_ratio = price / median_price
-
-        # Base score: quality * 10 gives us 10-100 range
-        # Then adjust by price ratio
-        # If price_ratio < 1 (cheaper than median), score goes up
-        # If price_ratio > 1 (more expensive), score goes down
-
-        raw_score = (section_quality * 10) / price_ratio
-
-        # Apply verified bonus (10% boost)
-        if is_verified:
-            raw_score *= 1.10
-
-        # Apply diminishing returns for very high scores
-        # and floor for very low scores
-        final_score = int(min(100, max(0, raw_score)))
-
-        return final_score
-
     def _estimate_section_quality(self, section_name: str) -> float:
         """Estimate section quality when venue intel is unavailable."""
-        section_lower = section_name.lower()
-
-        # Common section quality mappings
-        quality_map = {
-            "floor": 9.0,
-            "pit": 9.5,
-            "vip": 9.0,
-            "orchestra": 8.5,
-            "front": 8.5,
-            "premium": 8.0,
-            "lower": 7.5,
-            "club": 7.0,
-            "100": 7.5,
-            "200": 6.0,
-            "mezzanine": 6.5,
-            "mezz": 6.5,
-            "loge": 6.0,
-            "upper": 5.0,
-            "300": 5.0,
-            "balcony": 4.5,
-            "400": 4.0,
-            "nosebleed": 3.5,
-        }
-
-        for key, quality in quality_map.items():
-            if key in section_lower:
-                return quality
-
-        # Default middle quality for unknown sections
-        return 5.5
+        return ESTIMATED_SECTION_INDEX.lookup(section_name)
 
     def _create_events(
         self,
@@ -238,7 +373,8 @@ def analyze_tickets(
     search_results: dict[str, SiteSearchResult],
     venue_intel: Optional[VenueIntel] = None,
     event_info: Optional[EventInfo] = None,
+    top_k: Optional[int] = None,
 ) -> tuple[list[Seat], list[Event]]:
     """Convenience function to analyze tickets."""
     analyzer = ValueAnalyzerAgent()
-    return analyzer.analyze(search_results, venue_intel, event_info)
+    return analyzer.analyze(search_results, venue_intel, event_info, top_k=top_k)
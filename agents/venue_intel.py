@@ -7,17 +7,19 @@ import re
 from typing import Optional
 
 from .base import BaseAgent
+from .shared_browser import SharedBrowser
 from models import VenueIntel, SectionQuality, AgentStatus
 
 
 class VenueIntelAgent(BaseAgent):
     """Agent that researches venue seating quality and recommendations."""
 
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, shared_browser: Optional[SharedBrowser] = None):
         super().__init__(
             name="VenueIntelAgent",
             max_steps=12,  # Enough to find charts and reviews
             headless=False,  # Never use headless mode
+            shared_browser=shared_browser,
         )
 
     def get_system_instructions(self) -> str:
@@ -95,7 +97,8 @@ Also list:
                 agent_result = await self.execute_agent(search_instruction)
 
                 # Parse results
-                result = self._parse_results(agent_result, venue_name, city)
+                with self.instrument("parse"):
+                    result = self._parse_results(agent_result, venue_name, city)
 
         except Exception as e:
             print(f"[{self.name}] Error: {e}")
@@ -6,6 +6,12 @@ import os
 
 from src.application.use_cases.search_use_case import SearchUseCase
 from src.infrastructure.api.agent_orchestrator_client import AgentOrchestratorClient
+from src.infrastructure.api.single_flight import SingleFlight
+from src.infrastructure.cache.result_cache import SearchResultCache, create_result_cache
+from src.infrastructure.database.venue_intel_store import SQLiteVenueIntelStore
+from src.infrastructure.jobs.search_jobs import JobQueue, create_job_queue
+from src.infrastructure.jobs.worker_pool import SearchJobWorkerPool
+from src.infrastructure.metrics.search_metrics import SearchMetrics
 
 
 @lru_cache()
@@ -13,12 +19,94 @@ def get_settings():
     """Get application settings"""
     return {
         "use_agents": os.getenv("USE_AGENTS", "true").lower() == "true",
+        "redis_url": os.getenv("REDIS_URL", ""),
+        "result_cache_ttl": int(os.getenv("RESULT_CACHE_TTL", "600")),
+        "venue_intel_db_path": os.getenv("VENUE_INTEL_DB_PATH", "data/venue_intel.db"),
+        "venue_intel_ttl_days": float(os.getenv("VENUE_INTEL_TTL_DAYS", "30")),
+        "job_queue_backend": os.getenv("JOB_QUEUE_BACKEND", "memory").lower(),
+        "search_workers": int(os.getenv("SEARCH_WORKERS", "2")),
+        "job_ttl": int(os.getenv("SEARCH_JOB_TTL", "3600")),
+        "search_deadline": float(os.getenv("SEARCH_DEADLINE_SECONDS", "0")) or None,
+        "search_enough_listings": int(os.getenv("SEARCH_ENOUGH_LISTINGS", "0")) or None,
     }
 
 
+@lru_cache()
+def get_result_cache() -> SearchResultCache:
+    """Process-wide search result cache (Redis if REDIS_URL is set)"""
+    settings = get_settings()
+    return create_result_cache(
+        redis_url=settings["redis_url"],
+        ttl_seconds=settings["result_cache_ttl"],
+    )
+
+
+@lru_cache()
+def get_venue_intel_store() -> SQLiteVenueIntelStore:
+    """Process-wide durable venue intel store"""
+    settings = get_settings()
+    return SQLiteVenueIntelStore(
+        path=settings["venue_intel_db_path"],
+        ttl_seconds=settings["venue_intel_ttl_days"] * 24 * 3600,
+    )
+
+
+@lru_cache()
+def get_single_flight() -> SingleFlight:
+    """Process-wide coalescing group for identical in-flight searches"""
+    return SingleFlight()
+
+
 def get_search_use_case() -> SearchUseCase:
     """Dependency for search use case - uses AI agent orchestrator"""
+    return _create_search_use_case(priority="interactive")
+
+
+def get_batch_search_use_case() -> SearchUseCase:
+    """Search use case for background jobs (yields browser slots to interactive searches)"""
+    return _create_search_use_case(priority="batch")
+
+
+def _create_search_use_case(priority: str) -> SearchUseCase:
+    settings = get_settings()
     return SearchUseCase(
-        agent_client=AgentOrchestratorClient()
+        agent_client=AgentOrchestratorClient(
+            cache=get_result_cache(),
+            venue_store=get_venue_intel_store(),
+            single_flight=get_single_flight(),
+            deadline=settings["search_deadline"],
+            enough_listings=settings["search_enough_listings"],
+            priority=priority,
+        )
     )
 
+
+@lru_cache()
+def get_search_metrics() -> SearchMetrics:
+    """Process-wide metrics served at /metrics"""
+    cache = get_result_cache()
+    return SearchMetrics(
+        cache_stats=lambda: (cache.hits, cache.misses),
+        scheduler_stats=AgentOrchestratorClient.scheduler_stats,
+    )
+
+
+@lru_cache()
+def get_job_queue() -> JobQueue:
+    """Process-wide search job queue (in-process unless JOB_QUEUE_BACKEND=redis)"""
+    settings = get_settings()
+    return create_job_queue(
+        backend=settings["job_queue_backend"],
+        redis_url=settings["redis_url"],
+        job_ttl_seconds=settings["job_ttl"],
+    )
+
+
+@lru_cache()
+def get_worker_pool() -> SearchJobWorkerPool:
+    """Process-wide pool of background search workers"""
+    return SearchJobWorkerPool(
+        queue=get_job_queue(),
+        use_case_factory=get_batch_search_use_case,
+        size=get_settings()["search_workers"],
+    )
@@ -2,18 +2,86 @@
 Main FastAPI application
 """
 import os
+import time
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
+from src.api.dependencies import get_search_metrics, get_worker_pool
 from src.api.v1.routes import router as v1_router
-from src.api.logging_config import setup_logging, add_correlation_id_middleware
+from src.api.logging_config import correlation_id_var, setup_logging, add_correlation_id_middleware
+from src.infrastructure.api.agent_orchestrator_client import AgentOrchestratorClient
 
 
 # Setup structured logging
 setup_logging(level=os.getenv("LOG_LEVEL", "INFO"))
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown"""
+    # Orchestrator phase, site search and agent step metrics
+    metrics = get_search_metrics()
+    metrics.install()
+    
+    # Trace agent and orchestrator steps under each request's span
+    from tracing import get_tracer, trace_agent_steps
+    from agents.instrumentation import remove_agent_hook
+    step_tracer = trace_agent_steps()
+    
+    # Background workers for POST /api/v1/searches
+    worker_pool = get_worker_pool()
+    worker_pool.start()
+    
+    yield
+    
+    await worker_pool.stop()
+    # Release browsers held by the agent browser pool
+    await AgentOrchestratorClient.shutdown()
+    metrics.uninstall()
+    remove_agent_hook(step_tracer)
+    get_tracer().shutdown()
+
+
+async def record_request_metrics_middleware(request: Request, call_next):
+    """Middleware to record request latency by route template"""
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Route templates (not raw paths) keep label cardinality bounded
+        route = request.scope.get("route")
+        get_search_metrics().observe_request(
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=status,
+            seconds=time.perf_counter() - started,
+        )
+
+
+async def add_tracing_middleware(request: Request, call_next):
+    """Middleware to open the root span of each request, tagged with its correlation ID"""
+    from tracing import start_span
+    
+    with start_span(
+        f"{request.method} {request.url.path}",
+        correlation_id=correlation_id_var.get(),
+        method=request.method,
+        path=request.url.path,
+    ) as span:
+        response = await call_next(request)
+        route = request.scope.get("route")
+        if route is not None:
+            span.name = f"{request.method} {route.path}"
+        span.attributes["status"] = response.status_code
+        return response
+
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application"""
     app = FastAPI(
@@ -22,12 +90,19 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
-        openapi_url="/openapi.json"
+        openapi_url="/openapi.json",
+        lifespan=lifespan
     )
     
+    # Tracing (registered first so it runs inside the correlation ID middleware)
+    app.middleware("http")(add_tracing_middleware)
+    
     # Add correlation ID middleware
     app.middleware("http")(add_correlation_id_middleware)
     
+    # Request latency metrics
+    app.middleware("http")(record_request_metrics_middleware)
+    
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -50,6 +125,14 @@ def create_app() -> FastAPI:
             "health": "/api/v1/health"
         }
     
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics():
+        """Prometheus metrics"""
+        return PlainTextResponse(
+            get_search_metrics().render(),
+            media_type="text/plain; version=0.0.4; charset=utf-8"
+        )
+    
     return app
 
 
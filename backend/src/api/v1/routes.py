@@ -1,17 +1,37 @@
 """
 API v1 routes
 """
+import json
+import logging
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
-from src.api.dependencies import get_search_use_case
-from src.api.v1.schemas import SearchRequest, SearchResponse, EventResponse, PriceTierResponse, HealthResponse
+from src.api.dependencies import get_search_use_case, get_venue_intel_store, get_worker_pool
+from src.api.logging_config import correlation_id_var
+from src.api.v1.schemas import (
+    SearchRequest,
+    SearchResponse,
+    EventResponse,
+    PriceTierResponse,
+    HealthResponse,
+    BrowserSchedulerResponse,
+    SearchJobResponse,
+    SearchJobSubmitResponse,
+    VenueIntelInvalidationResponse,
+)
 from src.application.use_cases.search_use_case import SearchUseCase
 from src.domain.entities.search_criteria import SearchCriteria
+from src.infrastructure.api.agent_orchestrator_client import AgentOrchestratorClient
+from src.infrastructure.database.venue_intel_store import SQLiteVenueIntelStore
+from src.infrastructure.jobs.search_jobs import SearchJob
+from src.infrastructure.jobs.worker_pool import SearchJobWorkerPool
 
 
 router = APIRouter(prefix="/api/v1", tags=["v1"])
+logger = logging.getLogger(__name__)
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -28,6 +48,17 @@ async def health_check():
     )
 
 
+@router.get("/scheduler", response_model=BrowserSchedulerResponse)
+async def browser_scheduler_stats():
+    """
+    Browser slot scheduler introspection
+    
+    Shows how many browser slots are in use, how many agents are queued
+    (by priority class) and how long they have waited for a slot.
+    """
+    return BrowserSchedulerResponse(**AgentOrchestratorClient.scheduler_stats())
+
+
 @router.post("/search", response_model=SearchResponse)
 async def search_events(
     request: SearchRequest,
@@ -45,46 +76,13 @@ async def search_events(
     """
     try:
         # Convert request to domain entity
-        criteria = SearchCriteria(
-            artist=request.artist,
-            location=request.location,
-            latitude=request.latitude,
-            longitude=request.longitude,
-            start_date=request.start_date,
-            end_date=request.end_date,
-            max_price=request.max_price
-        )
+        criteria = _to_criteria(request)
         
         # Execute search
         events = await use_case.execute(criteria)
         
         # Convert to response format
-        event_responses = [
-            EventResponse(
-                id=event.id,
-                name=event.name,
-                artist=event.artist,
-                venue_name=event.venue_name,
-                date=event.date,
-                location=event.location,
-                latitude=event.latitude,
-                longitude=event.longitude,
-                price_tiers=[
-                    PriceTierResponse(
-                        name=tier.name,
-                        min_price=tier.min_price,
-                        max_price=tier.max_price,
-                        currency=tier.currency
-                    )
-                    for tier in event.price_tiers
-                ],
-                min_price=event.min_price,
-                max_price=event.max_price,
-                vendor=event.vendor,
-                vendor_url=event.vendor_url
-            )
-            for event in events
-        ]
+        event_responses = [_to_event_response(event) for event in events]
         
         return SearchResponse(
             events=event_responses,
@@ -101,3 +99,197 @@ async def search_events(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
         )
+
+
+@router.get("/search/stream")
+async def stream_search_get(
+    request: SearchRequest = Depends(),
+    use_case: SearchUseCase = Depends(get_search_use_case)
+):
+    """
+    Stream a search as Server-Sent Events (query-string version)
+    
+    See POST /search/stream for the event sequence.
+    """
+    return _stream_search(request, use_case)
+
+
+@router.post("/search/stream")
+async def stream_search_post(
+    request: SearchRequest,
+    use_case: SearchUseCase = Depends(get_search_use_case)
+):
+    """
+    Stream a search as Server-Sent Events
+    
+    Events, in order:
+    - research: event info found by the research agent
+    - site_result: one per ticket site, as soon as that site finishes
+    - best_so_far: top seats by AI value score from the sites finished so far
+    - venue_intel: seating quality for the venue
+    - ranked: seats ranked by AI value score
+    - results: final event list (same shape as POST /search)
+    - error: sent instead of results if the search fails
+    """
+    return _stream_search(request, use_case)
+
+
+@router.post(
+    "/searches",
+    response_model=SearchJobSubmitResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def submit_search(
+    request: SearchRequest,
+    workers: SearchJobWorkerPool = Depends(get_worker_pool)
+):
+    """
+    Submit a search to run in the background
+    
+    Returns a job id immediately; poll GET /searches/{id} for progress.
+    """
+    try:
+        criteria = _to_criteria(request)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    job = await workers.submit(SearchJob(criteria=criteria, correlation_id=correlation_id_var.get()))
+    
+    return SearchJobSubmitResponse(
+        id=job.id,
+        status=job.status.value,
+        status_url=f"{router.prefix}/searches/{job.id}"
+    )
+
+
+@router.get("/searches/{job_id}", response_model=SearchJobResponse)
+async def get_search_job(
+    job_id: str,
+    workers: SearchJobWorkerPool = Depends(get_worker_pool)
+):
+    """
+    Get a search job's status, partial results and final results
+    
+    partial_results fills in as agents finish (research, site_results,
+    best_so_far, venue_intel, ranked); results is set once the job has completed.
+    """
+    job = await workers.queue.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Search job {job_id} not found"
+        )
+    
+    results = None
+    if job.results is not None:
+        event_responses = [_to_event_response(e) for e in job.results]
+        results = SearchResponse(events=event_responses, total=len(event_responses))
+    
+    return SearchJobResponse(
+        id=job.id,
+        status=job.status.value,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+        partial_results=job.partial_results,
+        results=results,
+        error=job.error
+    )
+
+
+def _stream_search(request: SearchRequest, use_case: SearchUseCase) -> StreamingResponse:
+    """Validate the request up front, then stream the use case as SSE"""
+    try:
+        criteria = _to_criteria(request)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    async def event_stream():
+        try:
+            async for event, payload in use_case.execute_stream(criteria):
+                if event == "results":
+                    event_responses = [_to_event_response(e) for e in payload]
+                    payload = SearchResponse(events=event_responses, total=len(event_responses))
+                yield _format_sse(event, payload)
+        except Exception:
+            logger.exception("Streaming search failed")
+            yield _format_sse("error", {"detail": "Internal server error"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _format_sse(event: str, payload) -> str:
+    """Format one Server-Sent Event"""
+    data = json.dumps(jsonable_encoder(payload))
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def _to_criteria(request: SearchRequest) -> SearchCriteria:
+    """Convert a search request to the domain entity (raises ValueError)"""
+    return SearchCriteria(
+        artist=request.artist,
+        location=request.location,
+        latitude=request.latitude,
+        longitude=request.longitude,
+        start_date=request.start_date,
+        end_date=request.end_date,
+        max_price=request.max_price
+    )
+
+
+def _to_event_response(event) -> EventResponse:
+    """Convert a domain event to the response schema"""
+    return EventResponse(
+        id=event.id,
+        name=event.name,
+        artist=event.artist,
+        venue_name=event.venue_name,
+        date=event.date,
+        location=event.location,
+        latitude=event.latitude,
+        longitude=event.longitude,
+        price_tiers=[
+            PriceTierResponse(
+                name=tier.name,
+                min_price=tier.min_price,
+                max_price=tier.max_price,
+                currency=tier.currency
+            )
+            for tier in event.price_tiers
+        ],
+        min_price=event.min_price,
+        max_price=event.max_price,
+        vendor=event.vendor,
+        vendor_url=event.vendor_url
+    )
+
+
+@router.delete("/venue-intel", response_model=VenueIntelInvalidationResponse)
+async def invalidate_venue_intel(
+    venue_name: str,
+    city: str | None = None,
+    store: SQLiteVenueIntelStore = Depends(get_venue_intel_store)
+):
+    """
+    Invalidate stored venue intel
+    
+    The next search at this venue re-runs the VenueIntelAgent.
+    Omit city to drop the venue in every city.
+    """
+    removed = await store.invalidate(venue_name, city)
+    
+    return VenueIntelInvalidationResponse(
+        venue_name=venue_name,
+        city=city,
+        removed=removed
+    )
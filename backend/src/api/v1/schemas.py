@@ -3,6 +3,7 @@ Pydantic schemas for API requests/responses
 """
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -49,8 +50,46 @@ class SearchResponse(BaseModel):
     total: int
 
 
+class SearchJobSubmitResponse(BaseModel):
+    """Response schema for an accepted search job"""
+    id: str
+    status: str
+    status_url: str
+
+
+class SearchJobResponse(BaseModel):
+    """Status and results of a search job"""
+    id: str
+    status: str
+    created_at: datetime
+    started_at: datetime | None
+    completed_at: datetime | None
+    partial_results: dict[str, Any]
+    results: SearchResponse | None
+    error: str | None
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
     version: str
     timestamp: datetime
+
+
+class VenueIntelInvalidationResponse(BaseModel):
+    """Result of invalidating stored venue intel"""
+    venue_name: str
+    city: str | None
+    removed: int
+
+
+class BrowserSchedulerResponse(BaseModel):
+    """Browser slot usage across all in-flight searches"""
+    capacity: int
+    in_use: int
+    queue_depth: int
+    queued_by_priority: dict[str, int]
+    waiting_requests: int
+    granted: int
+    avg_wait_seconds: float
+    max_wait_seconds: float
@@ -2,7 +2,7 @@
 Search use case - Application layer
 Orchestrates the complete search flow using AI agents
 """
-from typing import Protocol
+from typing import Any, AsyncIterator, Protocol
 
 from src.domain.entities.event import Event
 from src.domain.entities.search_criteria import SearchCriteria
@@ -14,6 +14,9 @@ class AgentClient(Protocol):
     """Protocol for agent-based search client"""
     async def search_events(self, criteria: SearchCriteria) -> list[Event]:
         ...
+    
+    def stream_events(self, criteria: SearchCriteria) -> AsyncIterator[tuple[str, Any]]:
+        ...
 
 
 class SearchUseCase:
@@ -31,9 +34,43 @@ class SearchUseCase:
         criteria: SearchCriteria
     ) -> list[Event]:
         """Execute search using AI agents"""
-        # 1. Query AI agent orchestrator (searches multiple sites internally)
-        events = await self.agent_client.search_events(criteria)
+        from tracing import start_span
+        
+        with start_span("SearchUseCase.execute", artist=criteria.artist, location=criteria.location or "") as span:
+            # 1. Query AI agent orchestrator (searches multiple sites internally)
+            events = await self.agent_client.search_events(criteria)
+            
+            events = self._process_events(events, criteria)
+            span.attributes["events"] = len(events)
+            return events
+    
+    async def execute_stream(
+        self,
+        criteria: SearchCriteria
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Execute search using AI agents, yielding progress as it happens
         
+        Passes through the agent client's progress events and finishes
+        with a results event holding the deduplicated, filtered, sorted events.
+        """
+        from tracing import start_span
+        
+        with start_span("SearchUseCase.execute_stream", artist=criteria.artist, location=criteria.location or "") as span:
+            async for event, payload in self.agent_client.stream_events(criteria):
+                if event == "events":
+                    events = self._process_events(payload, criteria)
+                    span.attributes["events"] = len(events)
+                    yield "results", events
+                else:
+                    yield event, payload
+    
+    def _process_events(
+        self,
+        events: list[Event],
+        criteria: SearchCriteria
+    ) -> list[Event]:
+        """Deduplicate, filter and sort raw agent events"""
         if not events:
             return []
         
@@ -6,10 +6,13 @@ functionality through browser automation agents.
 """
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 
 from src.domain.entities.event import Event, PriceTier
 from src.domain.entities.search_criteria import SearchCriteria
+from src.infrastructure.api.single_flight import SingleFlight
+from src.infrastructure.cache.result_cache import SearchResultCache
+from src.infrastructure.database.venue_intel_store import SQLiteVenueIntelStore
 
 
 class AgentOrchestratorClient:
@@ -20,6 +23,24 @@ class AgentOrchestratorClient:
     with browser automation agents that actually visit the sites.
     """
     
+    def __init__(
+        self,
+        cache: Optional[SearchResultCache] = None,
+        venue_store: Optional[SQLiteVenueIntelStore] = None,
+        single_flight: Optional[SingleFlight] = None,
+        sites: Optional[list[str]] = None,
+        deadline: Optional[float] = None,
+        enough_listings: Optional[int] = None,
+        priority: str = "interactive"
+    ):
+        self.cache = cache
+        self.venue_store = venue_store
+        self.single_flight = single_flight
+        self.sites = sites
+        self.deadline = deadline
+        self.enough_listings = enough_listings
+        self.priority = priority  # Browser slot class: "interactive" or "batch"
+    
     async def search_events(self, criteria: SearchCriteria) -> list[Event]:
         """
         Search for events using the AI agent orchestrator.
@@ -27,15 +48,7 @@ class AgentOrchestratorClient:
         Note: This can take 2-5 minutes as agents actually browse ticketing sites.
         """
         try:
-            # Import the orchestrator (at runtime to avoid circular imports)
-            from orchestrator.coordinator import run_ticket_search
-            
-            # Execute the agent search
-            result = await run_ticket_search(
-                query=criteria.artist,
-                location=criteria.location or "",
-                headless=False,  # Show browsers for debugging
-            )
+            result = await self._get_orchestrator_result(criteria)
             
             # Convert orchestrator result to backend Event format
             return self._convert_to_events(result, criteria)
@@ -46,6 +59,137 @@ class AgentOrchestratorClient:
             traceback.print_exc()
             return []
     
+    async def _get_orchestrator_result(self, criteria: SearchCriteria):
+        """
+        Return a cached OrchestratorResult, or run the agents and cache the result
+        
+        Concurrent identical searches share a single orchestrator run.
+        """
+        # Import the orchestrator (at runtime to avoid circular imports)
+        from orchestrator.coordinator import DEFAULT_SITES
+        
+        search_key = SearchResultCache.make_key(criteria, self.sites or DEFAULT_SITES)
+        if self.cache:
+            cached = await self.cache.get(search_key)
+            if cached is not None:
+                print(f"[AgentOrchestratorClient] Cache hit for {criteria.artist} ({criteria.location})")
+                return cached
+        
+        if self.single_flight:
+            return await self.single_flight.do(
+                search_key,
+                lambda: self._run_orchestrator(criteria, search_key)
+            )
+        return await self._run_orchestrator(criteria, search_key)
+    
+    async def _run_orchestrator(self, criteria: SearchCriteria, cache_key: str):
+        """Run the agent orchestrator and cache its result"""
+        from orchestrator.coordinator import run_ticket_search
+        
+        # Execute the agent search
+        result = await run_ticket_search(
+            query=criteria.artist,
+            location=criteria.location or "",
+            sites=self.sites,
+            headless=False,  # Show browsers for debugging
+            venue_store=self.venue_store,
+            deadline=self.deadline,
+            enough_listings=self.enough_listings,
+            priority=self._slot_priority(),
+        )
+        
+        await self._cache_result(cache_key, result)
+        
+        return result
+    
+    async def stream_events(self, criteria: SearchCriteria) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Stream a search as (event, payload) pairs while the agents run.
+        
+        Yields research, site_result, best_so_far, venue_intel and ranked
+        events with JSON-ready payloads as each arrives, then a final events event with
+        the list of backend Event entities. Cached searches replay instantly.
+        """
+        from orchestrator.coordinator import DEFAULT_SITES, stream_ticket_search
+        from models.serialization import to_jsonable
+        
+        cache_key = None
+        progress_stream = None
+        if self.cache:
+            cache_key = self.cache.make_key(criteria, self.sites or DEFAULT_SITES)
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                cache_key = None  # Already cached - nothing to store afterwards
+                progress_stream = self._replay_progress(cached)
+        
+        if progress_stream is None:
+            progress_stream = stream_ticket_search(
+                query=criteria.artist,
+                location=criteria.location or "",
+                sites=self.sites,
+                headless=False,  # Show browsers for debugging
+                venue_store=self.venue_store,
+                deadline=self.deadline,
+                enough_listings=self.enough_listings,
+                priority=self._slot_priority(),
+            )
+        
+        async for progress in progress_stream:
+            if progress.kind == "complete":
+                await self._cache_result(cache_key, progress.data)
+                yield "events", self._convert_to_events(progress.data, criteria)
+            else:
+                yield progress.kind, to_jsonable(progress.data)
+    
+    async def _replay_progress(self, result):
+        """Replay a finished OrchestratorResult as orchestrator progress events"""
+        from models import SearchProgress
+        
+        if result.event_info:
+            yield SearchProgress(kind="research", data=result.event_info)
+        for site_result in result.search_results.values():
+            yield SearchProgress(kind="site_result", data=site_result)
+        if result.venue_intel:
+            yield SearchProgress(kind="venue_intel", data=result.venue_intel)
+        yield SearchProgress(kind="ranked", data=result.ranked_seats)
+        yield SearchProgress(kind="complete", data=result)
+    
+    async def _cache_result(self, cache_key: Optional[str], result) -> None:
+        """Cache a result if caching is on and the search ran to completion with priced listings"""
+        # A deadline or enough_listings cut-off left sites unsearched - run those again next time
+        if result.cut_off:
+            return
+        # The price-0 "check site directly" placeholder is not a found listing
+        found_listings = any(
+            listing.price_per_ticket > 0
+            for site_result in result.search_results.values()
+            for listing in site_result.listings
+        )
+        if self.cache and cache_key and found_listings:
+            await self.cache.set(cache_key, result)
+    
+    def _slot_priority(self):
+        """Orchestrator scheduling Priority for this client's searches"""
+        from orchestrator.scheduler import Priority
+        
+        return Priority[self.priority.upper()]
+    
+    @staticmethod
+    def scheduler_stats() -> dict:
+        """Browser slot usage, queue depth and wait times across all searches"""
+        from orchestrator.scheduler import get_browser_scheduler
+        
+        return get_browser_scheduler().stats()
+    
+    @staticmethod
+    async def shutdown() -> None:
+        """Close the warm browsers the agents keep between searches."""
+        try:
+            from agents.browser_pool import close_browser_pools
+        except ImportError:
+            return
+        await close_browser_pools()
+    
     def _convert_to_events(self, orchestrator_result, criteria: SearchCriteria) -> list[Event]:
         """
         Convert OrchestratorResult to list of backend Event entities.
@@ -0,0 +1,50 @@
+"""
+Single-flight request coalescing
+
+Concurrent calls that share a key attach to one in-flight execution and all
+receive its result, so a burst of identical searches runs the agents once.
+"""
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into a single execution"""
+
+    def __init__(self):
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn() for key, or wait for the run already in flight for key
+
+        The shared run is shielded: a caller that is cancelled (e.g. client
+        disconnect) stops waiting without cancelling it for everyone else.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Number of distinct executions currently running"""
+        return len(self._in_flight)
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished execution"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception retrieved even if every caller went away
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,160 @@
+"""
+Search result cache
+
+Caches serialized OrchestratorResult payloads so repeat searches for the same
+show skip the 2-5 minute agent pipeline. Uses Redis when available and falls
+back to an in-process cache otherwise.
+"""
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Optional, Protocol
+
+from src.domain.entities.search_criteria import SearchCriteria
+
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "showme:search:v1:"
+
+
+class CacheBackend(Protocol):
+    """Protocol for raw string key/value stores with TTL"""
+    async def get(self, key: str) -> Optional[str]:
+        ...
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        ...
+
+
+class InMemoryCacheBackend:
+    """Process-local cache backend (used when Redis is not configured)"""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[float, str]] = {}  # key -> (expires_at, value)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a value if present and not expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store a value with a TTL, evicting the oldest entry when full"""
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            oldest_key = min(self._entries, key=lambda k: self._entries[k][0])
+            del self._entries[oldest_key]
+
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+
+
+class RedisCacheBackend:
+    """Redis cache backend that degrades to a fallback backend on Redis errors"""
+
+    def __init__(self, redis_url: str, fallback: Optional[CacheBackend] = None):
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(redis_url, decode_responses=True)
+        self._fallback = fallback or InMemoryCacheBackend()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a value from Redis (or the fallback if Redis is down)"""
+        try:
+            return await self._client.get(key)
+        except Exception as e:
+            logger.warning(f"Redis get failed, using in-memory cache: {e}")
+            return await self._fallback.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store a value in Redis (or the fallback if Redis is down)"""
+        try:
+            await self._client.set(key, value, ex=ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Redis set failed, using in-memory cache: {e}")
+            await self._fallback.set(key, value, ttl_seconds)
+
+
+class SearchResultCache:
+    """Cache of OrchestratorResult objects keyed on normalized search parameters"""
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: int = 600):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(criteria: SearchCriteria, sites: Optional[list[str]] = None) -> str:
+        """
+        Build a cache key from the parts of a search that change the agent run
+
+        Artist and location are case/whitespace normalized, sites are sorted
+        and dates are reduced to calendar days.
+        """
+        def normalize(text: Optional[str]) -> str:
+            return " ".join((text or "").lower().split())
+
+        def day(value: Optional[datetime]) -> str:
+            return value.date().isoformat() if value else ""
+
+        parts = {
+            "artist": normalize(criteria.artist),
+            "location": normalize(criteria.location),
+            "sites": sorted(s.lower() for s in sites or []),
+            "start": day(criteria.start_date),
+            "end": day(criteria.end_date),
+        }
+        digest = hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+        return f"{KEY_PREFIX}{digest[:32]}"
+
+    async def get(self, key: str):
+        """Get a cached OrchestratorResult (None on miss)"""
+        from models.serialization import orchestrator_result_from_dict
+
+        payload = await self.backend.get(key)
+        if payload is None:
+            self.misses += 1
+            return None
+
+        try:
+            result = orchestrator_result_from_dict(json.loads(payload))
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return result
+
+    async def set(self, key: str, result) -> None:
+        """Cache an OrchestratorResult"""
+        from models.serialization import to_jsonable
+
+        payload = json.dumps(to_jsonable(result))
+        await self.backend.set(key, payload, self.ttl_seconds)
+
+
+def create_result_cache(redis_url: Optional[str], ttl_seconds: int) -> SearchResultCache:
+    """Create a result cache backed by Redis if configured, in-memory otherwise"""
+    backend: CacheBackend
+
+    if redis_url:
+        try:
+            backend = RedisCacheBackend(redis_url)
+        except ImportError:
+            logger.warning("redis package not installed, using in-memory result cache")
+            backend = InMemoryCacheBackend()
+    else:
+        backend = InMemoryCacheBackend()
+
+    return SearchResultCache(backend, ttl_seconds=ttl_seconds)
@@ -0,0 +1,125 @@
+"""
+Venue intel store
+
+Durable SQLite store of VenueIntel keyed by (venue, city). A venue's seating
+quality rarely changes, so the orchestrator consults this before launching
+the VenueIntelAgent browser and only researches venues it has not seen.
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS venue_intel (
+    venue_key TEXT NOT NULL,
+    city_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (venue_key, city_key)
+)
+"""
+
+
+def _normalize(text: Optional[str]) -> str:
+    """Case/whitespace-insensitive key part"""
+    return " ".join((text or "").lower().split())
+
+
+class SQLiteVenueIntelStore:
+    """
+    SQLite-backed VenueIntel store with a long TTL and manual invalidation
+
+    Methods are async (blocking SQLite calls run in a worker thread) so the
+    orchestrator can await them alongside its agents.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 30 * 24 * 3600):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, commit on success and always close it"""
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    async def get(self, venue_name: str, city: str):
+        """Get stored VenueIntel (None if unknown or older than the TTL)"""
+        return await asyncio.to_thread(self._get, venue_name, city)
+
+    async def put(self, intel) -> None:
+        """Store (or replace) VenueIntel for its venue and city"""
+        await asyncio.to_thread(self._put, intel)
+
+    async def invalidate(self, venue_name: str, city: Optional[str] = None) -> int:
+        """Remove a venue's intel (every city if city is None); returns rows removed"""
+        return await asyncio.to_thread(self._invalidate, venue_name, city)
+
+    async def clear(self) -> int:
+        """Remove all stored venue intel; returns rows removed"""
+        return await asyncio.to_thread(self._clear)
+
+    def _get(self, venue_name: str, city: str):
+        from models.serialization import venue_intel_from_dict
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload, updated_at FROM venue_intel WHERE venue_key = ? AND city_key = ?",
+                (_normalize(venue_name), _normalize(city)),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        payload, updated_at = row
+        if time.time() - updated_at > self.ttl_seconds:
+            return None
+
+        return venue_intel_from_dict(json.loads(payload))
+
+    def _put(self, intel) -> None:
+        from models.serialization import to_jsonable
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO venue_intel (venue_key, city_key, payload, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    _normalize(intel.venue_name),
+                    _normalize(intel.city),
+                    json.dumps(to_jsonable(intel)),
+                    time.time(),
+                ),
+            )
+
+    def _invalidate(self, venue_name: str, city: Optional[str]) -> int:
+        with self._connect() as conn:
+            if city is None:
+                cursor = conn.execute(
+                    "DELETE FROM venue_intel WHERE venue_key = ?",
+                    (_normalize(venue_name),),
+                )
+            else:
+                cursor = conn.execute(
+                    "DELETE FROM venue_intel WHERE venue_key = ? AND city_key = ?",
+                    (_normalize(venue_name), _normalize(city)),
+                )
+            return cursor.rowcount
+
+    def _clear(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM venue_intel").rowcount
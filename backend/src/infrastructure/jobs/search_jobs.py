@@ -0,0 +1,251 @@
+"""
+Search jobs and job queues
+
+A SearchJob tracks one asynchronous search from submission to results. Jobs
+go through a JobQueue: in-process by default, or Redis-backed so several
+backend processes can share one queue.
+"""
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Optional, Protocol
+
+from src.domain.entities.event import Event, PriceTier
+from src.domain.entities.search_criteria import SearchCriteria
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a search job"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class SearchJob:
+    """An asynchronous search and everything it has produced so far"""
+    criteria: SearchCriteria
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    partial_results: dict[str, Any] = field(default_factory=dict)
+    results: Optional[list[Event]] = None
+    error: Optional[str] = None
+    correlation_id: str = ""  # Of the request that submitted the job (for tracing)
+
+    def record_progress(self, event: str, payload: Any) -> None:
+        """Fold one streamed progress event into partial_results"""
+        if event == "site_result":
+            self.partial_results.setdefault("site_results", {})[payload["site_name"]] = payload
+        else:
+            self.partial_results[event] = payload
+
+
+class JobQueue(Protocol):
+    """Protocol for search job queues"""
+    async def submit(self, job: SearchJob) -> None:
+        ...
+
+    async def next_job_id(self, timeout: float) -> Optional[str]:
+        ...
+
+    async def get(self, job_id: str) -> Optional[SearchJob]:
+        ...
+
+    async def save(self, job: SearchJob) -> None:
+        ...
+
+
+class InMemoryJobQueue:
+    """In-process job queue (jobs are lost on restart)"""
+
+    def __init__(self, job_ttl_seconds: int = 3600):
+        self.job_ttl_seconds = job_ttl_seconds
+        self._pending: asyncio.Queue[str] = asyncio.Queue()
+        self._jobs: dict[str, SearchJob] = {}
+        self._expires_at: dict[str, float] = {}
+
+    async def submit(self, job: SearchJob) -> None:
+        """Store a job and queue it for a worker"""
+        self._evict_expired()
+        await self.save(job)
+        await self._pending.put(job.id)
+
+    async def next_job_id(self, timeout: float) -> Optional[str]:
+        """Wait up to timeout seconds for the next queued job id"""
+        try:
+            return await asyncio.wait_for(self._pending.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def get(self, job_id: str) -> Optional[SearchJob]:
+        """Get a job by id"""
+        return self._jobs.get(job_id)
+
+    async def save(self, job: SearchJob) -> None:
+        """Store the latest state of a job"""
+        self._jobs[job.id] = job
+        self._expires_at[job.id] = time.monotonic() + self.job_ttl_seconds
+
+    def _evict_expired(self) -> None:
+        """Drop finished jobs past their TTL"""
+        now = time.monotonic()
+        for job_id, expires_at in list(self._expires_at.items()):
+            job = self._jobs.get(job_id)
+            if expires_at < now and job and job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                del self._jobs[job_id]
+                del self._expires_at[job_id]
+
+
+class RedisJobQueue:
+    """Redis-backed job queue shared by every backend process"""
+
+    QUEUE_KEY = "showme:jobs:queue"
+    JOB_KEY_PREFIX = "showme:jobs:"
+
+    def __init__(self, redis_url: str, job_ttl_seconds: int = 3600):
+        import redis.asyncio as redis
+
+        self.job_ttl_seconds = job_ttl_seconds
+        self._client = redis.from_url(redis_url, decode_responses=True)
+
+    async def submit(self, job: SearchJob) -> None:
+        """Store a job and push it onto the shared queue"""
+        await self.save(job)
+        await self._client.lpush(self.QUEUE_KEY, job.id)
+
+    async def next_job_id(self, timeout: float) -> Optional[str]:
+        """Block up to timeout seconds for the next queued job id"""
+        item = await self._client.brpop([self.QUEUE_KEY], timeout=max(1, int(timeout)))
+        return item[1] if item else None
+
+    async def get(self, job_id: str) -> Optional[SearchJob]:
+        """Get a job by id"""
+        payload = await self._client.get(self.JOB_KEY_PREFIX + job_id)
+        return _job_from_dict(json.loads(payload)) if payload else None
+
+    async def save(self, job: SearchJob) -> None:
+        """Store the latest state of a job"""
+        await self._client.set(
+            self.JOB_KEY_PREFIX + job.id,
+            json.dumps(_job_to_dict(job)),
+            ex=self.job_ttl_seconds,
+        )
+
+
+def create_job_queue(backend: str, redis_url: Optional[str], job_ttl_seconds: int) -> JobQueue:
+    """Create the configured job queue ("memory" or "redis")"""
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("JOB_QUEUE_BACKEND=redis requires REDIS_URL")
+        return RedisJobQueue(redis_url, job_ttl_seconds=job_ttl_seconds)
+    if backend != "memory":
+        raise ValueError(f"Unknown job queue backend: {backend}")
+    return InMemoryJobQueue(job_ttl_seconds=job_ttl_seconds)
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _parse(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _event_to_dict(event: Event) -> dict:
+    return {
+        "id": event.id,
+        "name": event.name,
+        "artist": event.artist,
+        "venue_id": event.venue_id,
+        "venue_name": event.venue_name,
+        "date": event.date.isoformat(),
+        "location": event.location,
+        "latitude": event.latitude,
+        "longitude": event.longitude,
+        "price_tiers": [
+            {
+                "name": tier.name,
+                "min_price": str(tier.min_price),
+                "max_price": str(tier.max_price),
+                "currency": tier.currency,
+            }
+            for tier in event.price_tiers
+        ],
+        "vendor": event.vendor,
+        "vendor_url": event.vendor_url,
+    }
+
+
+def _event_from_dict(data: dict) -> Event:
+    return Event(
+        **{
+            **data,
+            "date": datetime.fromisoformat(data["date"]),
+            "price_tiers": [
+                PriceTier(
+                    name=tier["name"],
+                    min_price=Decimal(tier["min_price"]),
+                    max_price=Decimal(tier["max_price"]),
+                    currency=tier["currency"],
+                )
+                for tier in data["price_tiers"]
+            ],
+        }
+    )
+
+
+def _job_to_dict(job: SearchJob) -> dict:
+    criteria = job.criteria
+    return {
+        "id": job.id,
+        "status": job.status.value,
+        "criteria": {
+            "artist": criteria.artist,
+            "location": criteria.location,
+            "latitude": criteria.latitude,
+            "longitude": criteria.longitude,
+            "start_date": _isoformat(criteria.start_date),
+            "end_date": _isoformat(criteria.end_date),
+            "max_price": str(criteria.max_price) if criteria.max_price is not None else None,
+        },
+        "created_at": _isoformat(job.created_at),
+        "started_at": _isoformat(job.started_at),
+        "completed_at": _isoformat(job.completed_at),
+        "partial_results": job.partial_results,
+        "results": [_event_to_dict(e) for e in job.results] if job.results is not None else None,
+        "error": job.error,
+        "correlation_id": job.correlation_id,
+    }
+
+
+def _job_from_dict(data: dict) -> SearchJob:
+    criteria = data["criteria"]
+    return SearchJob(
+        id=data["id"],
+        status=JobStatus(data["status"]),
+        criteria=SearchCriteria(
+            artist=criteria["artist"],
+            location=criteria["location"],
+            latitude=criteria["latitude"],
+            longitude=criteria["longitude"],
+            start_date=_parse(criteria["start_date"]),
+            end_date=_parse(criteria["end_date"]),
+            max_price=Decimal(criteria["max_price"]) if criteria["max_price"] is not None else None,
+        ),
+        created_at=_parse(data["created_at"]),
+        started_at=_parse(data["started_at"]),
+        completed_at=_parse(data["completed_at"]),
+        partial_results=data["partial_results"],
+        results=[_event_from_dict(e) for e in data["results"]] if data["results"] is not None else None,
+        error=data["error"],
+        correlation_id=data.get("correlation_id", ""),
+    )
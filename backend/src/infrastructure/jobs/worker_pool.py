@@ -0,0 +1,110 @@
+"""
+Search job worker pool
+
+Background workers that pull search jobs off a JobQueue and run them through
+the search use case, saving partial results as each progress event arrives.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Callable
+
+from src.application.use_cases.search_use_case import SearchUseCase
+from src.infrastructure.jobs.search_jobs import JobQueue, JobStatus, SearchJob
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchJobWorkerPool:
+    """Fixed-size pool of asyncio workers draining a search job queue"""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        use_case_factory: Callable[[], SearchUseCase],
+        size: int = 2,
+        poll_timeout: float = 5.0
+    ):
+        self.queue = queue
+        self.use_case_factory = use_case_factory
+        self.size = size
+        self.poll_timeout = poll_timeout
+        self._workers: list[asyncio.Task] = []
+
+    async def submit(self, job: SearchJob) -> SearchJob:
+        """Queue a job for the workers"""
+        await self.queue.submit(job)
+        return job
+
+    def start(self) -> None:
+        """Start the worker tasks"""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"search-worker-{i}")
+            for i in range(self.size)
+        ]
+        logger.info(f"Started {self.size} search job workers")
+
+    async def stop(self) -> None:
+        """Cancel the workers and wait for them to exit"""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _worker(self, index: int) -> None:
+        """Pull and run jobs until cancelled"""
+        while True:
+            try:
+                job_id = await self.queue.next_job_id(timeout=self.poll_timeout)
+            except Exception as e:
+                logger.warning(f"Worker {index} could not read the job queue: {e}")
+                await asyncio.sleep(self.poll_timeout)
+                continue
+
+            if job_id is None:
+                continue
+
+            job = await self.queue.get(job_id)
+            if job is None:
+                logger.warning(f"Worker {index} dequeued unknown job {job_id}")
+                continue
+
+            await self._run_job(job)
+
+    async def _run_job(self, job: SearchJob) -> None:
+        """Run one job, saving progress and the final outcome"""
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+        await self.queue.save(job)
+
+        from tracing import start_span
+
+        try:
+            # Jobs run outside the submitting request - trace them under its correlation ID
+            with start_span("SearchJob.run", correlation_id=job.correlation_id, job_id=job.id):
+                use_case = self.use_case_factory()
+                async for event, payload in use_case.execute_stream(job.criteria):
+                    if event == "results":
+                        job.results = payload
+                    else:
+                        job.record_progress(event, payload)
+                        await self.queue.save(job)
+
+            job.status = JobStatus.COMPLETED
+        except asyncio.CancelledError:
+            job.status = JobStatus.FAILED
+            job.error = "Search cancelled (server shutting down)"
+            job.completed_at = datetime.utcnow()
+            await self.queue.save(job)
+            raise
+        except Exception as e:
+            logger.exception(f"Search job {job.id} failed")
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+
+        job.completed_at = datetime.utcnow()
+        await self.queue.save(job)
+
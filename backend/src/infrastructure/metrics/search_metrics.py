@@ -0,0 +1,135 @@
+"""
+Search metrics
+
+Hot-path metrics for the search backend: HTTP latency, orchestrator phases,
+per-site searches, agent steps, result cache and browser slots. Orchestrator
+and agent timings arrive through an agent instrumentation hook, so they are
+observed live - including searches that are cut off or fail.
+"""
+from typing import Callable, Optional
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+
+# Listings per site search - most sites return a page or two of results
+LISTING_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500)
+
+
+class SearchMetrics:
+    """
+    Metrics registry for the search backend
+
+    Also acts as an agents.instrumentation.AgentHook (see install())
+    """
+
+    def __init__(
+        self,
+        cache_stats: Optional[Callable[[], tuple[int, int]]] = None,
+        scheduler_stats: Optional[Callable[[], dict]] = None
+    ):
+        self.registry = MetricsRegistry()
+        self._cache_stats = cache_stats
+        self._scheduler_stats = scheduler_stats
+
+        self.request_latency = self.registry.histogram(
+            "showme_http_request_duration_seconds",
+            "HTTP request latency by route",
+            ("method", "route", "status"),
+        )
+        self.phase_duration = self.registry.histogram(
+            "showme_orchestrator_phase_duration_seconds",
+            "Orchestrator phase durations (research, search, analysis)",
+            ("phase",),
+        )
+        self.site_search_duration = self.registry.histogram(
+            "showme_site_search_duration_seconds",
+            "Per-site search duration, including timeouts",
+            ("site",),
+        )
+        self.site_searches = self.registry.counter(
+            "showme_site_searches_total",
+            "Per-site search outcomes",
+            ("site", "status"),
+        )
+        self.listings_found = self.registry.histogram(
+            "showme_site_listings_found",
+            "Listings found per site search",
+            ("site",),
+            buckets=LISTING_BUCKETS,
+        )
+        self.agent_step_duration = self.registry.histogram(
+            "showme_agent_step_duration_seconds",
+            "Agent step durations by kind (launch, navigate, execute, ...)",
+            ("kind",),
+        )
+        self.registry.counter(
+            "showme_result_cache_requests_total",
+            "Search result cache lookups",
+            ("result",),
+            callback=self._cache_samples,
+        )
+        self.registry.gauge(
+            "showme_browser_slots",
+            "Browser slot capacity and slots in use",
+            ("state",),
+            callback=self._slot_samples,
+        )
+        self.registry.gauge(
+            "showme_browser_slot_queue_depth",
+            "Site searches waiting for a browser slot",
+            callback=self._queue_samples,
+        )
+
+    def install(self) -> None:
+        """Start observing agent and orchestrator steps"""
+        from agents.instrumentation import add_agent_hook
+
+        add_agent_hook(self)
+
+    def uninstall(self) -> None:
+        """Stop observing agent and orchestrator steps"""
+        from agents.instrumentation import remove_agent_hook
+
+        remove_agent_hook(self)
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float) -> None:
+        """Record one HTTP request"""
+        self.request_latency.observe(seconds, method=method, route=route, status=str(status))
+
+    def on_step_start(self, step) -> None:
+        """Steps are only observed once they end"""
+
+    def on_step_end(self, step) -> None:
+        """Record a finished agent or orchestrator step"""
+        if step.kind.endswith("_phase"):
+            self.phase_duration.observe(step.duration, phase=step.kind[:-len("_phase")])
+        elif step.kind == "site_search":
+            site = step.attributes.get("site", "unknown")
+            status = step.attributes.get("status", "cancelled")
+            self.site_search_duration.observe(step.duration, site=site)
+            self.site_searches.inc(site=site, status=status)
+            if "listings" in step.attributes:
+                self.listings_found.observe(step.attributes["listings"], site=site)
+        else:
+            self.agent_step_duration.observe(step.duration, kind=step.kind)
+
+    def render(self) -> str:
+        """Prometheus text exposition of all metrics"""
+        return self.registry.render()
+
+    def _cache_samples(self) -> dict:
+        if not self._cache_stats:
+            return {}
+        hits, misses = self._cache_stats()
+        return {("hit",): hits, ("miss",): misses}
+
+    def _slot_samples(self) -> dict:
+        if not self._scheduler_stats:
+            return {}
+        stats = self._scheduler_stats()
+        return {("capacity",): stats["capacity"], ("in_use",): stats["in_use"]}
+
+    def _queue_samples(self) -> dict:
+        if not self._scheduler_stats:
+            return {}
+        return {(): self._scheduler_stats()["queue_depth"]}
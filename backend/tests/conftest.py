@@ -0,0 +1,12 @@
+"""
+Shared test setup
+
+The backend imports the agent packages (agents, models, orchestrator) from
+the repository root at runtime - put it on the path for tests too
+"""
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
@@ -0,0 +1,56 @@
+"""
+AgentOrchestratorClient result caching tests
+"""
+import asyncio
+
+import pytest
+
+from models import AgentStatus, OrchestratorResult, SearchQuery, SiteSearchResult, TicketListing
+from src.infrastructure.api.agent_orchestrator_client import AgentOrchestratorClient
+
+
+class RecordingCache:
+    """Stands in for SearchResultCache, remembering what was stored"""
+
+    def __init__(self):
+        self.stored = {}
+
+    async def set(self, key, result):
+        self.stored[key] = result
+
+
+def orchestrator_result(*prices: float) -> OrchestratorResult:
+    listings = [
+        TicketListing(source="stubhub", section="Floor", row="A", price_per_ticket=price, total_price=price)
+        for price in prices
+    ]
+    return OrchestratorResult(
+        query=SearchQuery(query="Artist", location="City"),
+        search_results={"stubhub": SiteSearchResult(site_name="stubhub", status=AgentStatus.SUCCESS, listings=listings)},
+    )
+
+
+def cache_result(result: OrchestratorResult) -> dict:
+    cache = RecordingCache()
+    client = AgentOrchestratorClient(cache=cache)
+    asyncio.run(client._cache_result("key", result))
+    return cache.stored
+
+
+@pytest.mark.unit
+class TestCacheResult:
+    """Which orchestrator results are cached"""
+
+    def test_priced_listings_are_cached(self):
+        assert "key" in cache_result(orchestrator_result(0.0, 85.0))
+
+    def test_check_site_placeholder_is_not_cached(self):
+        assert cache_result(orchestrator_result(0.0)) == {}
+
+    def test_no_listings_is_not_cached(self):
+        assert cache_result(orchestrator_result()) == {}
+
+    def test_cut_off_search_is_not_cached(self):
+        result = orchestrator_result(85.0)
+        result.cut_off = "search deadline reached"
+        assert cache_result(result) == {}
@@ -0,0 +1,121 @@
+"""
+BrowserPool reset and event loop tests
+"""
+import asyncio
+
+import pytest
+
+from agents.browser_pool import BrowserPool, PooledBrowser, get_browser_pool
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+        self.context.open_pages.remove(self)
+
+    async def send_cdp(self, method, params=None):
+        self.context.calls.append((method, params["origin"]))
+
+
+class FakeContext:
+    """Records what BrowserPool clears; starts with one page and some site state"""
+
+    def __init__(self):
+        self.calls = []
+        self.open_pages = [FakePage(self)]
+        self.cookies = [{"domain": ".stubhub.com"}]
+
+    async def storage_state(self):
+        return {"cookies": self.cookies, "origins": [{"origin": "https://www.tickpick.com"}]}
+
+    async def pages(self):
+        return list(self.open_pages)
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.open_pages.append(page)
+        return page
+
+    async def clear_cookies(self):
+        self.cookies = []
+        self.calls.append(("clear_cookies", None))
+
+    async def clear_permissions(self):
+        self.calls.append(("clear_permissions", None))
+
+
+class FakeStagehand:
+    def __init__(self):
+        self.context = FakeContext()
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.unit
+class TestBrowserPoolReset:
+    """What a released browser keeps from its last borrower"""
+
+    def test_release_clears_cookies_storage_permissions_and_tabs(self):
+        pool = BrowserPool(max_size=1)
+        stagehand = FakeStagehand()
+        old_page = stagehand.context.open_pages[0]
+
+        async def borrow_and_release():
+            pool._in_use[id(stagehand)] = PooledBrowser(stagehand=stagehand, uses=1)
+            await pool._slots.acquire()
+            await pool.release(stagehand)
+
+        asyncio.run(borrow_and_release())
+
+        context = stagehand.context
+        assert pool.stats()["idle"] == 1
+        assert old_page.closed and len(context.open_pages) == 1
+        assert ("clear_cookies", None) in context.calls
+        assert ("clear_permissions", None) in context.calls
+        cleared = {origin for method, origin in context.calls if method == "Storage.clearDataForOrigin"}
+        assert {"https://www.tickpick.com", "https://stubhub.com"} <= cleared
+
+    def test_browser_that_cannot_be_cleared_is_closed(self):
+        pool = BrowserPool(max_size=1)
+        stagehand = FakeStagehand()
+        stagehand.context = None  # Every reset step fails
+
+        async def borrow_and_release():
+            pool._in_use[id(stagehand)] = PooledBrowser(stagehand=stagehand, uses=1)
+            await pool._slots.acquire()
+            await pool.release(stagehand)
+
+        asyncio.run(borrow_and_release())
+        assert stagehand.closed
+        assert pool.stats()["idle"] == 0
+
+
+@pytest.mark.unit
+class TestBrowserPoolLoops:
+    """Pools hold loop-bound primitives, so each event loop gets its own"""
+
+    def test_each_loop_gets_its_own_pool(self):
+        async def pool_pair():
+            return get_browser_pool(headless=True), get_browser_pool(headless=True)
+
+        first, same = asyncio.run(pool_pair())
+        second, _ = asyncio.run(pool_pair())
+        assert first is same
+        assert first is not second
+
+    def test_pool_used_from_another_loop_fails_loudly(self):
+        pool = BrowserPool(max_size=1)
+        stagehand = FakeStagehand()
+
+        async def release():
+            await pool.release(stagehand)
+
+        asyncio.run(release())
+        with pytest.raises(RuntimeError, match="different event loop"):
+            asyncio.run(release())
@@ -0,0 +1,98 @@
+"""
+SiteCircuitBreaker tests
+"""
+import pytest
+
+from models import AgentStatus, SiteSearchResult, TicketListing
+from orchestrator import circuit_breaker
+from orchestrator.circuit_breaker import SiteCircuitBreaker
+
+
+def site_result(status=AgentStatus.SUCCESS, price: float = 80.0, error: str = None) -> SiteSearchResult:
+    listing = TicketListing(source="stubhub", section="Floor", row="A", price_per_ticket=price)
+    return SiteSearchResult(site_name="stubhub", status=status, listings=[listing], error_message=error)
+
+
+FAILED = site_result(AgentStatus.FAILED)
+GOOD = site_result()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the breaker's cooldowns"""
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+class TestIsFailure:
+    """Which site results count against a site"""
+
+    def test_priced_listings_are_not_a_failure(self):
+        assert not SiteCircuitBreaker.is_failure(GOOD)
+
+    @pytest.mark.parametrize("result", [
+        site_result(AgentStatus.FAILED),
+        site_result(AgentStatus.PARTIAL),
+        site_result(error="Blocked by CAPTCHA"),
+        site_result(price=0.0),  # Only the "check site directly" placeholder
+    ])
+    def test_failures(self, result):
+        assert SiteCircuitBreaker.is_failure(result)
+
+
+@pytest.mark.unit
+class TestSiteCircuitBreaker:
+    """Open after repeated failures, probe after the cooldown"""
+
+    def test_opens_after_threshold(self, clock):
+        breaker = SiteCircuitBreaker(failure_threshold=3, cooldown=60)
+        for _ in range(2):
+            breaker.record("stubhub", FAILED)
+            assert breaker.allow("stubhub")
+        breaker.record("stubhub", FAILED)
+        assert not breaker.allow("stubhub")
+        assert breaker.retry_in("stubhub") == 60
+        assert breaker.allow("seatgeek")
+
+    def test_success_resets_the_count(self, clock):
+        breaker = SiteCircuitBreaker(failure_threshold=2, cooldown=60)
+        breaker.record("stubhub", FAILED)
+        breaker.record("stubhub", GOOD)
+        breaker.record("stubhub", FAILED)
+        assert breaker.allow("stubhub")
+
+    def test_single_probe_after_cooldown(self, clock):
+        breaker = SiteCircuitBreaker(failure_threshold=1, cooldown=60)
+        breaker.record("stubhub", FAILED)
+        clock[0] += 61
+        assert breaker.allow("stubhub")
+        assert not breaker.allow("stubhub")  # One probe at a time
+
+    def test_probe_success_closes(self, clock):
+        breaker = SiteCircuitBreaker(failure_threshold=1, cooldown=60)
+        breaker.record("stubhub", FAILED)
+        clock[0] += 61
+        breaker.allow("stubhub")
+        breaker.record("stubhub", GOOD)
+        assert breaker.stats()["stubhub"]["state"] == "closed"
+        assert breaker.allow("stubhub") and breaker.allow("stubhub")
+
+    def test_probe_failure_reopens(self, clock):
+        breaker = SiteCircuitBreaker(failure_threshold=3, cooldown=60)
+        for _ in range(3):
+            breaker.record("stubhub", FAILED)
+        clock[0] += 61
+        breaker.allow("stubhub")
+        breaker.record("stubhub", FAILED)
+        assert not breaker.allow("stubhub")
+        assert breaker.retry_in("stubhub") == 60
+
+    def test_lost_probe_is_replaced_after_cooldown(self, clock):
+        breaker = SiteCircuitBreaker(failure_threshold=1, cooldown=60)
+        breaker.record("stubhub", FAILED)
+        clock[0] += 61
+        assert breaker.allow("stubhub")  # Probe is cut off and never records
+        clock[0] += 61
+        assert breaker.allow("stubhub")
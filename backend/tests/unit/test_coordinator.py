@@ -0,0 +1,88 @@
+"""
+TicketSearchOrchestrator cut-off tests
+"""
+import asyncio
+
+import pytest
+
+from models import AgentStatus, EventInfo, SiteSearchResult, TicketListing, VenueIntel
+from orchestrator.circuit_breaker import SiteCircuitBreaker
+from orchestrator.coordinator import TicketSearchOrchestrator
+from orchestrator.latency import SiteLatencyTracker
+from orchestrator.scheduler import BrowserSlotScheduler
+
+
+class StoredVenues:
+    """Venue store that already knows every venue (no VenueIntelAgent runs)"""
+
+    async def get(self, venue_name, city):
+        return VenueIntel(venue_name=venue_name, city=city)
+
+    async def put(self, intel):
+        pass
+
+
+class FakeSiteOrchestrator(TicketSearchOrchestrator):
+    """Site searches that take a fixed time per site and find one listing each"""
+
+    def __init__(self, delays: dict[str, float], placeholder_sites: tuple[str, ...] = ()):
+        super().__init__(
+            sites=list(delays),
+            shared_browser=False,
+            venue_store=StoredVenues(),
+            scheduler=BrowserSlotScheduler(capacity=len(delays)),
+            latency_tracker=SiteLatencyTracker(path=None),
+            circuit_breaker=SiteCircuitBreaker(),
+        )
+        self.delays = delays
+        self.placeholder_sites = placeholder_sites
+
+    async def _run_site_search(self, site_name, event_info, shared=None):
+        await asyncio.sleep(self.delays[site_name])
+        price = 0.0 if site_name in self.placeholder_sites else 50.0  # 0: "check site directly"
+        listing = TicketListing(source=site_name, section="Floor", row="A", price_per_ticket=price)
+        return SiteSearchResult(site_name=site_name, status=AgentStatus.SUCCESS, listings=[listing])
+
+
+def run_phase(
+    delays: dict[str, float],
+    deadline: float = None,
+    enough_listings: int = None,
+    placeholder_sites: tuple[str, ...] = (),
+):
+    async def phase():
+        orchestrator = FakeSiteOrchestrator(delays, placeholder_sites)
+        deadline_at = None if deadline is None else asyncio.get_running_loop().time() + deadline
+        event_info = EventInfo(artist_name="Artist", event_name="Artist", city="City")
+        return await orchestrator._run_parallel_tasks(
+            event_info, None, deadline_at=deadline_at, enough_listings=enough_listings
+        )
+
+    return asyncio.run(phase())
+
+
+@pytest.mark.unit
+class TestCutOff:
+    """The parallel phase reports why it stopped early"""
+
+    def test_complete_phase_is_not_cut_off(self):
+        search_results, _, cut_off = run_phase({"fast": 0.0, "slow": 0.05}, deadline=5.0)
+        assert cut_off is None
+        assert all(r.status == AgentStatus.SUCCESS for r in search_results.values())
+
+    def test_deadline_cut_off(self):
+        search_results, _, cut_off = run_phase({"fast": 0.0, "slow": 5.0}, deadline=0.2)
+        assert cut_off == "search deadline reached"
+        assert search_results["slow"].status == AgentStatus.FAILED
+
+    def test_enough_listings_cut_off(self):
+        search_results, _, cut_off = run_phase({"fast": 0.0, "slow": 5.0}, enough_listings=1)
+        assert cut_off == "enough listings found"
+        assert search_results["fast"].status == AgentStatus.SUCCESS
+
+    def test_placeholder_listings_do_not_count_as_enough(self):
+        search_results, _, cut_off = run_phase(
+            {"blocked": 0.0, "slow": 0.05}, enough_listings=1, placeholder_sites=("blocked",)
+        )
+        assert cut_off is None
+        assert search_results["slow"].status == AgentStatus.SUCCESS
@@ -0,0 +1,185 @@
+"""
+DOM extractor tests
+
+The browser test loads each saved listing page from tests/fixtures/listing_pages
+and runs the real EXTRACT_SCRIPT over it. It needs a Chromium build: the
+Playwright one, or any binary named by CHROMIUM_PATH - skipped otherwise
+"""
+import asyncio
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from agents.extractors import SITE_EXTRACTORS, SiteExtractor, get_extractor
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "listing_pages"
+TICKPICK_URL = "https://www.tickpick.com/buy-artist-tickets-venue-city-10-17-26-8pm/1234567/"
+
+
+def extractor(**overrides) -> SiteExtractor:
+    return SiteExtractor(**{**SITE_EXTRACTORS["tickpick"].__dict__, **overrides})
+
+
+class FakePage:
+    """Page stub: a URL plus the rows EXTRACT_SCRIPT would return"""
+
+    def __init__(self, url: str, rows=None, error: Exception = None):
+        self.url = url
+        self.rows = rows or []
+        self.error = error
+        self.calls = []
+
+    async def evaluate(self, script, arg):
+        self.calls.append(arg)
+        if self.error:
+            raise self.error
+        return self.rows
+
+
+@pytest.mark.unit
+class TestToListing:
+    """Raw DOM row -> TicketListing"""
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("Section 101", "101"),
+        ("section: 101", "101"),
+        ("Sec. 312", "312"),
+        ("SEC-312", "312"),
+        ("Floor A", "Floor A"),
+        ("  Lower Level 118 ", "Lower Level 118"),
+    ])
+    def test_section_label_is_stripped(self, raw, expected):
+        listing = extractor()._to_listing({"section": raw, "price": "$50"})
+        assert listing.section == expected
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("Row F", "F"),
+        ("Row: 14", "14"),
+        ("row - AA", "AA"),
+        ("GA", "GA"),
+        ("", ""),
+    ])
+    def test_row_label_is_stripped(self, raw, expected):
+        listing = extractor()._to_listing({"section": "101", "row": raw, "price": "$50"})
+        assert listing.row == expected
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("$145", 145.0),
+        ("$1,250.00", 1250.0),
+        ("From $89.5", 89.5),
+        ("$ 75.25 ea", 75.25),
+        ("120", 120.0),
+    ])
+    def test_price_is_parsed(self, raw, expected):
+        listing = extractor()._to_listing({"section": "101", "price": raw})
+        assert listing.price_per_ticket == expected
+        assert listing.total_price == expected
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("4 tickets", 4),
+        ("Qty: 3", 3),
+        ("1", 1),
+        ("", 2),
+        ("Any", 2),
+    ])
+    def test_quantity_defaults_to_two(self, raw, expected):
+        listing = extractor()._to_listing({"section": "101", "price": "$50", "quantity": raw})
+        assert listing.quantity == expected
+
+    @pytest.mark.parametrize("row", [
+        {"section": "", "price": "$50"},
+        {"section": "Section ", "price": "$50"},
+        {"section": "101", "price": ""},
+        {"section": "101", "price": "Sold out"},
+        {"section": "101", "price": "$0"},
+        {},
+    ])
+    def test_incomplete_rows_are_dropped(self, row):
+        assert extractor()._to_listing(row) is None
+
+    def test_listing_carries_site_fields(self):
+        listing = extractor(is_verified=True)._to_listing(
+            {"section": "101", "price": "$50", "url": "https://www.tickpick.com/x"}
+        )
+        assert listing.source == "tickpick"
+        assert listing.url == "https://www.tickpick.com/x"
+        assert listing.is_verified is True
+
+
+@pytest.mark.unit
+class TestExtract:
+    """extract() around a stubbed page"""
+
+    def test_rows_are_converted_and_incomplete_ones_skipped(self):
+        page = FakePage(TICKPICK_URL, rows=[
+            {"section": "Section 101", "row": "Row F", "price": "$145", "quantity": "2", "url": ""},
+            {"section": "Section 220", "row": "Row B", "price": "Sold out", "quantity": "", "url": ""},
+        ])
+        listings = asyncio.run(extractor().extract(page))
+        assert [(l.section, l.row, l.price_per_ticket) for l in listings] == [("101", "F", 145.0)]
+        assert page.calls[0]["listing"] == SITE_EXTRACTORS["tickpick"].listing_selector
+
+    def test_other_pages_are_not_read(self):
+        page = FakePage("https://www.tickpick.com/search?q=artist", rows=[{"section": "101", "price": "$1"}])
+        assert asyncio.run(extractor().extract(page)) == []
+        assert page.calls == []
+
+    def test_script_errors_fall_back_to_the_agent(self):
+        page = FakePage(TICKPICK_URL, error=RuntimeError("Execution context was destroyed"))
+        assert asyncio.run(extractor().extract(page)) == []
+
+
+@pytest.mark.unit
+class TestGetExtractor:
+    """Only verified (or explicitly enabled) extractors are used"""
+
+    def test_verified_sites_have_a_fixture(self):
+        for site_name, site_extractor in SITE_EXTRACTORS.items():
+            if site_extractor.selectors_verified:
+                assert (FIXTURES / f"{site_name}.html").exists(), site_name
+
+    def test_unverified_sites_need_opting_in(self, monkeypatch):
+        monkeypatch.setattr("agents.extractors.DOM_EXTRACTION_SITES", set())
+        for site_name, site_extractor in SITE_EXTRACTORS.items():
+            assert (get_extractor(site_name) is not None) == site_extractor.selectors_verified
+
+        monkeypatch.setattr("agents.extractors.DOM_EXTRACTION_SITES", set(SITE_EXTRACTORS))
+        assert all(get_extractor(site_name) for site_name in SITE_EXTRACTORS)
+
+    def test_unknown_site(self):
+        assert get_extractor("nosuchsite") is None
+
+
+async def extract_fixture(site_extractor: SiteExtractor, url: str):
+    """Serve a saved listing page at its real URL and run the extractor on it"""
+    from playwright.async_api import async_playwright
+
+    html = (FIXTURES / f"{site_extractor.site_name}.html").read_text()
+    async with async_playwright() as playwright:
+        try:
+            browser = await playwright.chromium.launch(executable_path=os.environ.get("CHROMIUM_PATH"))
+        except Exception as e:
+            pytest.skip(f"No Chromium to run the extraction script: {e}")
+        try:
+            page = await browser.new_page()
+            await page.route("**/*", lambda route: route.fulfill(body=html, content_type="text/html"))
+            await page.goto(url)
+            return await site_extractor.extract(page)
+        finally:
+            await browser.close()
+
+
+@pytest.mark.unit
+class TestListingPageFixtures:
+    """EXTRACT_SCRIPT + selectors against saved listing pages"""
+
+    def test_tickpick(self):
+        listings = asyncio.run(extract_fixture(SITE_EXTRACTORS["tickpick"], TICKPICK_URL))
+        assert [(l.section, l.row, l.quantity, l.price_per_ticket) for l in listings] == [
+            ("101", "F", 2, 145.0),
+            ("312", "14", 4, 1250.0),
+            ("Floor A", "GA", 2, 89.5),
+        ]
+        assert listings[0].url.endswith("?listingId=8812001")
@@ -0,0 +1,144 @@
+"""
+IncrementalRanker and RunningMedian tests
+
+The ranker must give the same ranking as ValueAnalyzerAgent.analyze(top_k)
+on the listings seen so far. Seats whose scores tie at the k-th score may
+differ (the ranker keeps the best density, analyze the earliest listing),
+so that last group is only checked for valid members.
+"""
+import random
+import statistics
+
+import pytest
+
+from agents.incremental_ranker import IncrementalRanker, RunningMedian
+from agents.value_analyzer import ValueAnalyzerAgent
+from models import AgentStatus, SectionQuality, SiteSearchResult, TicketListing, VenueIntel
+
+
+SECTIONS = ["Floor", "Pit", "Orchestra", "Lower", "Club", "Mezzanine", "Upper", "Balcony", "GA", "Section 101"]
+SITES = ["stubhub", "seatgeek", "tickpick", "vividseats"]
+
+
+def random_results(rng: random.Random, per_site: int) -> list[SiteSearchResult]:
+    """Sites' results in arrival order, with some seats listed on several sites"""
+    shared = [
+        (rng.choice(SECTIONS), rng.choice("ABCDEF"), f"{n}-{n + 1}")
+        for n in range(1, 2 * per_site, 2)
+    ]
+    results = []
+    for site in rng.sample(SITES, len(SITES)):
+        listings = []
+        for _ in range(per_site):
+            if rng.random() < 0.3:
+                section, row, seats = rng.choice(shared)  # Maybe the same seats as another site
+            else:
+                section, row, seats = rng.choice(SECTIONS) + f" {rng.randint(1, 30)}", rng.choice("ABCDEF"), None
+            price = round(rng.uniform(20, 400), 2) if rng.random() > 0.05 else 0.0
+            listings.append(TicketListing(
+                source=site, section=section, row=row, seat_numbers=seats,
+                price_per_ticket=price, total_price=price, is_verified=rng.random() < 0.3,
+            ))
+        results.append(SiteSearchResult(site_name=site, status=AgentStatus.SUCCESS, listings=listings))
+    return results
+
+
+def seat_id(seat) -> tuple:
+    return seat.source, seat.section, seat.row, seat.seatNumber, seat.price, seat.aiValueScore
+
+
+def assert_same_ranking(incremental: list, full: list, top_k: int) -> None:
+    expected = full[:top_k]
+    assert [s.aiValueScore for s in incremental] == [s.aiValueScore for s in expected]
+    if not expected:
+        return
+
+    # Everything above the k-th score is identical, in the same order
+    cutoff = expected[-1].aiValueScore
+    assert [seat_id(s) for s in incremental if s.aiValueScore > cutoff] == \
+           [seat_id(s) for s in expected if s.aiValueScore > cutoff]
+
+    # Seats tied at the k-th score are real seats with that score
+    tied = {seat_id(s) for s in full if s.aiValueScore == cutoff}
+    assert {seat_id(s) for s in incremental if s.aiValueScore == cutoff} <= tied
+
+
+def venue_intel() -> VenueIntel:
+    return VenueIntel(venue_name="Venue", city="City", sections=[
+        SectionQuality(section_name=name, quality_score=score)
+        for name, score in [("Pit", 9.5), ("Floor", 9.0), ("Mezzanine", 6.5), ("Balcony", 4.0), ("101", 8.0)]
+    ])
+
+
+@pytest.mark.unit
+class TestRunningMedian:
+    """RunningMedian against statistics.median under random adds and removes"""
+
+    def test_random_adds_and_removes(self):
+        rng = random.Random(25)
+        median = RunningMedian()
+        values: list[float] = []
+        for _ in range(3000):
+            if values and rng.random() < 0.35:
+                value = values.pop(rng.randrange(len(values)))
+                median.remove(value)
+            else:
+                value = float(rng.randint(1, 60))  # Repeats exercise the lazy removal
+                values.append(value)
+                median.add(value)
+            assert len(median) == len(values)
+            assert median.median() == (statistics.median(values) if values else None)
+
+
+@pytest.mark.unit
+class TestIncrementalRanker:
+    """Snapshots match analyze(top_k) on the listings seen so far"""
+
+    @pytest.mark.parametrize("top_k", [1, 10, 50])
+    def test_snapshot_after_each_site(self, top_k):
+        analyzer = ValueAnalyzerAgent()
+        for seed in range(8):
+            rng = random.Random(seed)
+            results = random_results(rng, per_site=rng.randint(5, 60))
+            ranker = IncrementalRanker(top_k=top_k)
+            seen = {}
+            for result in results:
+                ranker.add(result)
+                seen[result.site_name] = result
+                full, _ = analyzer.analyze(seen)
+                assert_same_ranking(ranker.snapshot(), full, top_k)
+
+    def test_venue_intel_mid_stream(self):
+        analyzer = ValueAnalyzerAgent()
+        intel = venue_intel()
+        for seed in range(8):
+            rng = random.Random(100 + seed)
+            results = random_results(rng, per_site=40)
+            ranker = IncrementalRanker(top_k=20)
+            seen = {}
+            for i, result in enumerate(results):
+                ranker.add(result)
+                seen[result.site_name] = result
+                if i == 1:
+                    ranker.set_venue_intel(intel)
+                full, _ = analyzer.analyze(seen, intel if i >= 1 else None)
+                assert_same_ranking(ranker.snapshot(), full, 20)
+
+    def test_alternates_and_median(self):
+        listing = lambda site, price: TicketListing(
+            source=site, section="Section 101", row="F", seat_numbers="5-6",
+            price_per_ticket=price, total_price=price,
+        )
+        ranker = IncrementalRanker(top_k=5)
+        ranker.add(SiteSearchResult(site_name="stubhub", status=AgentStatus.SUCCESS, listings=[listing("stubhub", 120.0)]))
+        ranker.add(SiteSearchResult(site_name="tickpick", status=AgentStatus.SUCCESS, listings=[listing("tickpick", 100.0)]))
+        (seat,) = ranker.snapshot()
+        assert (seat.source, seat.price) == ("tickpick", 100.0)
+        assert [(a.source, a.price) for a in seat.alternates] == [("stubhub", 120.0)]
+        assert ranker.median_price() == 100.0
+        assert (len(ranker), ranker.listing_count) == (1, 2)
+
+    def test_empty(self):
+        ranker = IncrementalRanker(top_k=5)
+        assert ranker.snapshot() == []
+        assert ranker.median_price() == 100.0
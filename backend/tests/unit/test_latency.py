@@ -0,0 +1,71 @@
+"""
+SiteLatencyTracker tests
+"""
+import pytest
+
+from orchestrator.latency import SiteLatencyTracker
+
+
+def tracker(**kwargs) -> SiteLatencyTracker:
+    options = dict(path=None, window=20, min_samples=5, percentile=0.95, headroom=1.5, floor=60, ceiling=600)
+    options.update(kwargs)
+    return SiteLatencyTracker(**options)
+
+
+@pytest.mark.unit
+class TestSiteLatencyTracker:
+    """Percentile timeouts, clamping and recovery from timeouts"""
+
+    def test_default_until_enough_samples(self):
+        latency = tracker()
+        for _ in range(4):
+            latency.record("stubhub", 100)
+        assert latency.timeout_for("stubhub", default=300) == 300
+        latency.record("stubhub", 100)
+        assert latency.timeout_for("stubhub", default=300) == 150
+
+    def test_nearest_rank_percentile(self):
+        latency = tracker(window=100)
+        for seconds in range(1, 101):
+            latency.record("stubhub", seconds)
+        assert latency.stats()["stubhub"]["p50_seconds"] == 50
+        assert latency.stats()["stubhub"]["percentile_seconds"] == 95
+        assert latency.timeout_for("stubhub", default=300) == 95 * 1.5
+
+    def test_clamped_to_floor_and_ceiling(self):
+        latency = tracker()
+        for _ in range(5):
+            latency.record("fast", 5)
+            latency.record("slow", 1000)
+        assert latency.timeout_for("fast", default=300) == 60
+        assert latency.timeout_for("slow", default=300) == 600
+
+    def test_window_drops_old_samples(self):
+        latency = tracker(window=5)
+        for _ in range(5):
+            latency.record("stubhub", 300)
+        for _ in range(5):
+            latency.record("stubhub", 100)
+        assert latency.timeout_for("stubhub", default=300) == 150
+
+    def test_timeout_grows_after_timeouts(self):
+        latency = tracker()
+        for _ in range(20):
+            latency.record("stubhub", 100)
+        timeout = latency.timeout_for("stubhub", default=300)
+        assert timeout == 150
+
+        # The site slowed to 400s: every search now hits its timeout
+        for _ in range(20):
+            latency.record_timeout("stubhub", timeout)
+            grown = latency.timeout_for("stubhub", default=300)
+            assert grown >= timeout
+            timeout = grown
+        assert timeout == 600  # Grew until the ceiling, past the new 400s latency
+
+    def test_history_persists(self, tmp_path):
+        path = str(tmp_path / "latency.json")
+        latency = tracker(path=path)
+        for _ in range(5):
+            latency.record("stubhub", 100)
+        assert tracker(path=path).timeout_for("stubhub", default=300) == 150
@@ -0,0 +1,174 @@
+"""
+Listing parser tests
+
+Differential checks against the per-format regexes the parser used before
+it was rewritten, with the same dedupe rules applied the slow way, plus the
+structured JSON payload path
+"""
+import json
+import random
+import re
+
+import pytest
+
+from agents.listing_parser import parse_json_listings, parse_listings
+from agents.site_search import SiteSearchAgent
+from models import seat_key
+
+
+# The original patterns, verbatim
+OLD_STRUCTURED = r'Section:\s*([^,\n]+)(?:,\s*Row:\s*([^,\n]+))?,.*?Price:\s*\$(\d+(?:\.\d{2})?)'
+OLD_TICKETMASTER = r'Sec\s+([A-Z0-9]+)\s*[•·]\s*Row\s+([A-Z0-9]+)[^$]*\$(\d+(?:\.\d{2})?)'
+OLD_TICKPICK = r'\*\*(?:Section|Sec)[:\s]*\*\*\s*([^,*]+),?\s*\*\*Row[:\s]*\*\*\s*([^,*]+).*?\$(\d+(?:\.\d{2})?)'
+
+
+def reference_parse(text: str) -> list[tuple[str, str, float]]:
+    """Old regexes, one findall each, linear-scan dedupe on canonical seats"""
+    found = []
+    for section, row, price in re.findall(OLD_STRUCTURED, text, re.IGNORECASE):
+        found.append((section.strip(), row.strip() if row else "", float(price)))
+    for pattern in (OLD_TICKETMASTER, OLD_TICKPICK):
+        for section, row, price in re.findall(pattern, text, re.IGNORECASE):
+            seat = seat_key(section.strip(), row.strip())
+            if not any(seat_key(s, r) == seat for s, r, _ in found):
+                found.append((section.strip(), row.strip(), float(price)))
+
+    unique = []
+    for section, row, price in found:
+        if not any(seat_key(s, r) == seat_key(section, row) and p == price for s, r, p in unique):
+            unique.append((section, row, price))
+    return unique
+
+
+def parsed(text: str) -> list[tuple[str, str, float]]:
+    return [(l.section, l.row, l.price_per_ticket) for l in parse_listings(text, "test")]
+
+
+def random_transcript(rng: random.Random) -> str:
+    sections = ["101", "102", "OR", "Floor 3", "Mezz", "Balcony 12", "Sec 101"]
+    lines = ["Here is what I found:"]
+    for _ in range(rng.randint(0, 25)):
+        section = rng.choice(sections)
+        row = rng.choice("ABCF") + rng.choice(["", "1"])
+        price = f"{rng.randint(20, 300)}" + rng.choice(["", ".50"])
+        lines.append(rng.choice([
+            f"Section: {section}, Row: {row}, Price: ${price}",
+            f"Section: {section}, Price: ${price}",
+            f"Sec {section.split()[-1]} • Row {row}, Standard Admission, ${price}",
+            f"Sec {section.split()[-1]} • Row {row} seen on map",
+            f"**Section:** {section}, **Row:** {row}, 2 tickets, ${price}",
+            f"**Section:** {section}, **Row:** {row}",
+            "Scrolling down to see more listings.",
+        ]))
+    return "\n".join(lines)
+
+
+@pytest.mark.unit
+class TestParseListings:
+    """parse_listings matches the original per-format regexes"""
+
+    def test_ticketmaster_mention_does_not_swallow_next_line(self):
+        text = (
+            "Sec 101 • Row A seen on map\n"
+            "Section: 102, Row: B, Price: $80\n"
+            "Section: 103, Row: C, Price: $90"
+        )
+        assert parsed(text) == [("102", "B", 80.0), ("103", "C", 90.0), ("101", "A", 80.0)]
+
+    def test_same_seat_in_two_formats_is_kept_once(self):
+        text = "Section: 101, Row: F, Price: $50\nSec 101 • Row F, Standard Admission, $55"
+        assert parsed(text) == [("101", "F", 50.0)]
+
+    def test_matches_old_regexes_on_random_transcripts(self):
+        rng = random.Random(19)
+        for _ in range(2000):
+            text = random_transcript(rng)
+            expected = reference_parse(text)
+            if expected:  # Without any format match the loose fallback runs instead
+                assert parsed(text) == expected, text
+
+
+@pytest.mark.unit
+class TestPrices:
+    """Dollar amounts in the text formats"""
+
+    def test_thousands_separators(self):
+        text = "Section: Floor A, Row: 1, Price: $1,250.00\nSec 101 • Row C, Platinum, $2,400"
+        assert parsed(text) == [("Floor A", "1", 1250.0), ("101", "C", 2400.0)]
+
+    def test_cents_and_whole_dollars(self):
+        text = "Section: 101, Row: F, Price: $89.50\nSection: 102, Row: G, Price: $90"
+        assert parsed(text) == [("101", "F", 89.5), ("102", "G", 90.0)]
+
+
+def json_parsed(text: str):
+    listings = parse_json_listings(text, "test")
+    return None if listings is None else [
+        (l.section, l.row, l.quantity, l.price_per_ticket, l.fees_per_ticket, l.total_price, l.is_verified, l.url)
+        for l in listings
+    ]
+
+
+@pytest.mark.unit
+class TestJsonListings:
+    """Structured (STRUCTURED_LISTINGS) agent answers"""
+
+    def test_array_to_listings(self):
+        text = json.dumps([
+            {"section": "101", "row": "F", "quantity": 4, "price": 89.5, "fees": 12.3,
+             "verified": True, "url": "https://example.com/l/1"},
+            {"section": "Floor", "row": "", "price": 150},
+        ])
+        assert json_parsed(text) == [
+            ("101", "F", 4, 89.5, 12.3, 89.5 + 12.3, True, "https://example.com/l/1"),
+            ("Floor", "", 2, 150.0, 0.0, 150.0, False, ""),
+        ]
+
+    def test_fenced_payload_inside_prose(self):
+        text = 'Here are the listings:\n```json\n{"listings": [{"section": "Mezz", "row": "B", "price": 75}]}\n```\nDone.'
+        assert json_parsed(text) == [("Mezz", "B", 2, 75.0, 0.0, 75.0, False, "")]
+
+    def test_string_prices_with_commas_or_without_dollar_sign(self):
+        text = json.dumps([
+            {"section": "Pit", "row": "1", "price": "$1,250.00", "fees": "$95"},
+            {"section": "102", "row": "A", "price": "64.25"},
+        ])
+        assert [(s, p, f) for s, _, _, p, f, _, _, _ in json_parsed(text)] == [("Pit", 1250.0, 95.0), ("102", 64.25, 0.0)]
+
+    def test_invalid_items_are_skipped(self):
+        text = json.dumps([
+            {"section": "", "price": 50},
+            {"section": "101", "price": 0},
+            {"section": "101", "price": "call"},
+            {"section": "101", "price": True},
+            "Section 101 $50",
+            {"section": "103", "row": "C", "price": 60},
+            {"section": "Sec 103", "row": "C", "price": 60},  # Same seats and price
+        ])
+        assert json_parsed(text) == [("103", "C", 2, 60.0, 0.0, 60.0, False, "")]
+
+    @pytest.mark.parametrize("text", [
+        "Section: 101, Row: F, Price: $89.50",
+        '[{"section": "101", "row": "F", "price": 89.5',  # Truncated
+        "[1, 2, 3]",
+        '{"note": "no listings"}',
+    ])
+    def test_no_payload_is_none(self, text):
+        assert parse_json_listings(text, "test") is None
+
+
+@pytest.mark.unit
+class TestStructuredFallback:
+    """SiteSearchAgent falls back to the text patterns when the JSON payload is unusable"""
+
+    def parse(self, text: str):
+        agent = SiteSearchAgent("stubhub", headless=True, structured_output=True)
+        listings = agent._parse_listings({"success": True, "result": {"message": text}})
+        return agent.parse_format, [(l.section, l.row, l.price_per_ticket) for l in listings]
+
+    def test_json_payload(self):
+        assert self.parse('[{"section": "101", "row": "F", "price": 89.5}]') == ("json", [("101", "F", 89.5)])
+
+    def test_malformed_json_falls_back_to_text(self):
+        text = '[{"section": "101", "row": "F", "price": 89.5,\nSection: 101, Row: F, Price: $89.50'
+        assert self.parse(text) == ("text", [("101", "F", 89.5)])
@@ -0,0 +1,89 @@
+"""
+Agent rate limiting tests
+"""
+import asyncio
+import random
+
+import pytest
+
+from agents import rate_limit
+from agents.rate_limit import ErrorKind, TokenBucket, backoff_delay, classify_error, parse_retry_after
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the token bucket"""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+class TestErrorClassification:
+    """Quota, transient and fatal agent errors"""
+
+    @pytest.mark.parametrize("message, kind", [
+        ("429 RESOURCE_EXHAUSTED", ErrorKind.QUOTA),
+        ("You exceeded your current quota", ErrorKind.QUOTA),
+        ("503 Service Unavailable", ErrorKind.TRANSIENT),
+        ("'NoneType' object is not subscriptable", ErrorKind.TRANSIENT),
+        ("400 Invalid argument", ErrorKind.FATAL),
+        ("API key not valid", ErrorKind.FATAL),
+    ])
+    def test_classify(self, message, kind):
+        assert classify_error(Exception(message)) == kind
+
+    def test_timeout_is_transient(self):
+        assert classify_error(asyncio.TimeoutError()) == ErrorKind.TRANSIENT
+
+    @pytest.mark.parametrize("message, seconds", [
+        ("Quota exceeded, please retry in 12s", 12.0),
+        ('"retryDelay": "7s"', 7.0),
+        ("retry after 1.5s", 1.5),
+        ("429 Too many requests", None),
+    ])
+    def test_parse_retry_after(self, message, seconds):
+        assert parse_retry_after(Exception(message)) == seconds
+
+    def test_backoff_is_jittered_and_capped(self):
+        random.seed(0)
+        for attempt in range(10):
+            delays = [backoff_delay(attempt, base=2.0, cap=30.0) for _ in range(50)]
+            assert all(0 <= delay <= min(30.0, 2.0 * 2 ** attempt) for delay in delays)
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Burst, steady rate, pauses and cancelled reservations"""
+
+    def test_burst_then_rate(self, clock):
+        bucket = TokenBucket(rate_per_second=2.0, burst=3)
+        assert [bucket._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket._reserve() == pytest.approx(0.5)
+        assert bucket._reserve() == pytest.approx(1.0)  # Waiters queue behind earlier reservations
+
+    def test_refills_up_to_burst(self, clock):
+        bucket = TokenBucket(rate_per_second=1.0, burst=2)
+        bucket._reserve()
+        bucket._reserve()
+        clock[0] += 100
+        assert bucket.stats()["tokens"] == 2
+
+    def test_pause_holds_back_acquisitions(self, clock):
+        bucket = TokenBucket(rate_per_second=10.0, burst=5)
+        bucket.pause(20)
+        assert bucket._reserve() == pytest.approx(20.0)
+
+    def test_cancelled_acquire_returns_its_token(self, clock):
+        async def run():
+            bucket = TokenBucket(rate_per_second=1.0, burst=1)
+            await bucket.acquire()
+            waiter = asyncio.create_task(bucket.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            return bucket
+
+        bucket = asyncio.run(run())
+        assert bucket.tokens == 0
+        assert bucket.acquired == 1
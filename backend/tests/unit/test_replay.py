@@ -0,0 +1,144 @@
+"""
+Record/replay backend tests: record one site search against a fake live
+session, then replay it with no browser
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from stagehand.types.agent import AgentResult
+
+import agents.replay as replay
+from agents import Recording, RecordBackend, ReplayBackend, ReplayLatency, SiteSearchAgent, set_stagehand_backend
+from models import AgentStatus, EventInfo
+
+EVENT_URL = "https://www.tickpick.com/buy-artist-tickets-venue-city/1234567/"
+ANSWER = "Section: 101, Row: F, Price: $145.00\nSection: Mezzanine 3, Row: B, Price: $89.50"
+
+
+class FakeLivePage:
+    def __init__(self):
+        self.url = "about:blank"
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+
+
+class FakeLiveAgent:
+    def __init__(self, page):
+        self.page = page
+
+    async def execute(self, **kwargs):
+        self.page.url = EVENT_URL
+        return AgentResult(actions=[], message=ANSWER, usage=None, completed=True)
+
+
+class FakeLiveStagehand:
+    """What launch_stagehand returns: a page and Gemini agents over it"""
+
+    def __init__(self):
+        self.page = FakeLivePage()
+        self.closed = False
+
+    def agent(self, **kwargs):
+        return FakeLiveAgent(self.page)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def backend_reset(monkeypatch):
+    monkeypatch.setattr("agents.site_search.get_extractor", lambda site_name: None)
+    yield
+    set_stagehand_backend(None)
+
+
+def search():
+    agent = SiteSearchAgent("tickpick", headless=True, structured_output=False)
+    event_info = EventInfo(artist_name="Artist", event_name="Artist", city="City")
+    return asyncio.run(agent.run(event_info))
+
+
+def summary(result):
+    return result.status, result.search_url, [
+        (l.section, l.row, l.price_per_ticket) for l in result.listings
+    ]
+
+
+@pytest.mark.unit
+class TestRecordReplay:
+    """A recorded search replays to the same result"""
+
+    def test_record_then_replay(self, tmp_path, monkeypatch, backend_reset):
+        path = str(tmp_path / "recordings" / "search.json")
+        launched = []
+
+        async def launch(headless, verbose):
+            launched.append(FakeLiveStagehand())
+            return launched[-1]
+
+        monkeypatch.setattr(replay, "launch_stagehand", launch)
+        set_stagehand_backend(RecordBackend(path))
+        recorded = search()
+
+        assert summary(recorded) == (AgentStatus.SUCCESS, EVENT_URL, [
+            ("101", "F", 145.0), ("Mezzanine 3", "B", 89.5),
+        ])
+        assert launched[0].closed
+
+        recording = Recording.load(path)
+        [operations] = recording.sessions["TickPickAgent"]
+        assert [op["op"] for op in operations] == ["goto", "execute"]
+        assert operations[0]["url_requested"] == "https://www.tickpick.com"
+        assert operations[1]["url"] == EVENT_URL
+        assert operations[1]["result"]["message"] == ANSWER
+
+        async def no_browser(headless, verbose):
+            raise AssertionError("replay launched a browser")
+
+        monkeypatch.setattr(replay, "launch_stagehand", no_browser)
+        set_stagehand_backend(ReplayBackend(recording, ReplayLatency(scale=0)))
+        assert summary(search()) == summary(recorded)
+        # Sessions are handed out round-robin, so a recording drives any number of searches
+        assert summary(search()) == summary(recorded)
+
+    def test_replay_waits_out_recorded_latency(self):
+        latency = ReplayLatency(scale=0.5, overrides={"launch": 2.0})
+        assert latency.delay("execute", 30.0) == 15.0
+        assert latency.delay("launch") == 2.0
+
+
+@pytest.mark.unit
+class TestMissingRecording:
+    """Missing recordings fail loudly instead of replaying as empty searches"""
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="No recording at .*none.json"):
+            Recording.load(str(tmp_path / "none.json"))
+
+    def test_wrong_version(self, tmp_path):
+        path = tmp_path / "old.json"
+        path.write_text('{"version": 0, "sessions": {}}')
+        with pytest.raises(ValueError, match="Unsupported recording version"):
+            Recording.load(str(path))
+
+    def test_agent_without_sessions(self):
+        backend = ReplayBackend(Recording({"ResearchAgent": [[]]}), ReplayLatency(scale=0))
+        with pytest.raises(RuntimeError, match="No recorded session for TickPickAgent"):
+            asyncio.run(backend.open(SimpleNamespace(name="TickPickAgent")))
+
+    def test_missing(self):
+        recording = Recording({"ResearchAgent": [[]], "TickPickAgent": []})
+        assert recording.missing(["ResearchAgent", "TickPickAgent", "StubHubAgent"]) == [
+            "TickPickAgent", "StubHubAgent",
+        ]
+
+    def test_benchmark_rejects_a_recording_without_a_site(self, tmp_path, backend_reset):
+        from benchmarks.replay_search import run_benchmark
+
+        path = str(tmp_path / "tickpick.json")
+        replay.synthesize_recording(["tickpick"], sessions_per_agent=1).save(path)
+        args = SimpleNamespace(recording=path)
+        with pytest.raises(SystemExit, match="no sessions for TicketmasterAgent"):
+            asyncio.run(run_benchmark(args, ["ticketmaster", "tickpick"]))
@@ -0,0 +1,96 @@
+"""
+BrowserSlotScheduler tests
+"""
+import asyncio
+
+import pytest
+
+from orchestrator.scheduler import BrowserSlotScheduler, Priority
+
+
+async def queue_waiters(scheduler: BrowserSlotScheduler, waiters: list[tuple[str, Priority]]) -> list:
+    """Start one acquire() per (request_id, priority) and let them all queue up"""
+    tasks = [asyncio.create_task(scheduler.acquire(request_id, priority)) for request_id, priority in waiters]
+    await asyncio.sleep(0)
+    return tasks
+
+
+async def grant_order(scheduler: BrowserSlotScheduler, waiters: list[tuple[str, Priority]]) -> list[int]:
+    """Indexes of waiters in the order they were granted a slot, one release at a time"""
+    tasks = await queue_waiters(scheduler, waiters)
+    order = []
+    while len(order) < len(tasks):
+        scheduler.release()
+        await asyncio.sleep(0)
+        order += [i for i, task in enumerate(tasks) if task.done() and i not in order]
+    return order
+
+
+@pytest.mark.unit
+class TestBrowserSlotScheduler:
+    """Slot cap, priority classes and round-robin between requests"""
+
+    def test_never_grants_more_than_capacity(self):
+        async def run():
+            scheduler = BrowserSlotScheduler(capacity=2)
+            peak = 0
+
+            async def agent():
+                nonlocal peak
+                async with scheduler.slot("search"):
+                    peak = max(peak, scheduler.in_use)
+                    await asyncio.sleep(0.001)
+
+            await asyncio.gather(*(agent() for _ in range(10)))
+            return scheduler, peak
+
+        scheduler, peak = asyncio.run(run())
+        assert peak == 2
+        assert scheduler.in_use == 0
+        assert scheduler.stats()["granted"] == 10
+
+    def test_interactive_before_batch(self):
+        async def run():
+            scheduler = BrowserSlotScheduler(capacity=1)
+            await scheduler.acquire("holder")
+            return await grant_order(scheduler, [
+                ("batch", Priority.BATCH),
+                ("user", Priority.INTERACTIVE),
+            ])
+
+        assert asyncio.run(run()) == [1, 0]
+
+    def test_round_robin_between_requests(self):
+        async def run():
+            scheduler = BrowserSlotScheduler(capacity=1)
+            await scheduler.acquire("holder")
+            return await grant_order(scheduler, [
+                ("big", Priority.INTERACTIVE),
+                ("big", Priority.INTERACTIVE),
+                ("big", Priority.INTERACTIVE),
+                ("small", Priority.INTERACTIVE),
+            ])
+
+        # The small search is served second, not after every agent of the big one
+        assert asyncio.run(run()) == [0, 3, 1, 2]
+
+    def test_cancelled_waiter_leaves_the_queue(self):
+        async def run():
+            scheduler = BrowserSlotScheduler(capacity=1)
+            await scheduler.acquire("holder")
+            cancelled, waiting = await queue_waiters(scheduler, [
+                ("a", Priority.INTERACTIVE),
+                ("b", Priority.INTERACTIVE),
+            ])
+            cancelled.cancel()
+            await asyncio.sleep(0)
+            depth = scheduler.queue_depth()
+
+            scheduler.release()
+            await asyncio.sleep(0)
+            return depth, waiting.done(), scheduler.in_use
+
+        depth, granted, in_use = asyncio.run(run())
+        assert depth == 1
+        assert granted
+        assert in_use == 1
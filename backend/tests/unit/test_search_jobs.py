@@ -0,0 +1,130 @@
+"""
+Search job queue and worker pool tests
+"""
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.domain.entities.event import Event, PriceTier
+from src.domain.entities.search_criteria import SearchCriteria
+from src.infrastructure.jobs.search_jobs import (
+    InMemoryJobQueue,
+    JobStatus,
+    SearchJob,
+    _job_from_dict,
+    _job_to_dict,
+    create_job_queue,
+)
+from src.infrastructure.jobs.worker_pool import SearchJobWorkerPool
+
+
+CRITERIA = SearchCriteria(artist="Artist", location="City", latitude=37.7, longitude=-122.4)
+
+EVENT = Event(
+    id="event-1",
+    name="Artist Live",
+    artist="Artist",
+    venue_id="venue-1",
+    venue_name="Venue",
+    date=datetime(2026, 11, 1, 20, 0),
+    location="City",
+    latitude=37.7,
+    longitude=-122.4,
+    price_tiers=[PriceTier(name="Floor", min_price=Decimal("80.00"), max_price=Decimal("150.00"), currency="USD")],
+    vendor="stubhub",
+    vendor_url="https://www.stubhub.com",
+)
+
+
+class RecordingQueue(InMemoryJobQueue):
+    """In-memory queue that remembers every status a job was saved with"""
+
+    def __init__(self):
+        super().__init__()
+        self.saved_statuses: list[JobStatus] = []
+
+    async def save(self, job):
+        self.saved_statuses.append(job.status)
+        await super().save(job)
+
+
+class FakeUseCase:
+    """Streams a site result, then the final events (or fails after the site result)"""
+
+    def __init__(self, error: Exception = None):
+        self.error = error
+
+    async def execute_stream(self, criteria):
+        yield "site_result", {"site_name": "stubhub", "listings": 3}
+        if self.error:
+            raise self.error
+        yield "results", [EVENT]
+
+
+def run_job(use_case: FakeUseCase) -> tuple[SearchJob, list[JobStatus]]:
+    async def run():
+        queue = RecordingQueue()
+        pool = SearchJobWorkerPool(queue, lambda: use_case, size=1, poll_timeout=0.01)
+        job = await pool.submit(SearchJob(criteria=CRITERIA))
+        pool.start()
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                break
+        await pool.stop()
+        return await queue.get(job.id), queue.saved_statuses
+
+    return asyncio.run(run())
+
+
+@pytest.mark.unit
+class TestSearchJobWorkerPool:
+    """Job status transitions as workers run jobs"""
+
+    def test_completed_job(self):
+        job, statuses = run_job(FakeUseCase())
+        assert statuses[0] == JobStatus.QUEUED
+        assert JobStatus.RUNNING in statuses
+        assert statuses[-1] == JobStatus.COMPLETED
+        assert job.results == [EVENT]
+        assert job.partial_results["site_results"]["stubhub"]["listings"] == 3
+        assert job.started_at and job.completed_at and job.error is None
+
+    def test_failed_job(self):
+        job, statuses = run_job(FakeUseCase(error=RuntimeError("agents crashed")))
+        assert statuses[-1] == JobStatus.FAILED
+        assert job.error == "agents crashed"
+        assert job.results is None
+        assert "stubhub" in job.partial_results["site_results"]  # Progress before the failure is kept
+
+
+@pytest.mark.unit
+class TestJobQueue:
+    """In-memory queue and job serialization"""
+
+    def test_queue_hands_out_submitted_jobs_in_order(self):
+        async def run():
+            queue = InMemoryJobQueue()
+            first, second = SearchJob(criteria=CRITERIA), SearchJob(criteria=CRITERIA)
+            await queue.submit(first)
+            await queue.submit(second)
+            ids = [await queue.next_job_id(timeout=0.1) for _ in range(3)]
+            return ids, first.id, second.id, await queue.get(first.id)
+
+        ids, first_id, second_id, stored = asyncio.run(run())
+        assert ids == [first_id, second_id, None]
+        assert stored.status == JobStatus.QUEUED
+
+    def test_job_round_trips_through_dict(self):
+        job = SearchJob(criteria=CRITERIA, status=JobStatus.COMPLETED, results=[EVENT], correlation_id="req-1")
+        job.record_progress("venue_intel", {"venue_name": "Venue"})
+        restored = _job_from_dict(_job_to_dict(job))
+        assert restored == job
+
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(ValueError):
+            create_job_queue("kafka", None, 60)
+        with pytest.raises(ValueError):
+            create_job_queue("redis", None, 60)
@@ -0,0 +1,84 @@
+"""
+Section quality lookup tests
+"""
+import random
+
+import pytest
+
+from models import SectionIndex, SectionQuality, VenueIntel
+
+
+def venue(*sections: tuple[str, float]) -> VenueIntel:
+    return VenueIntel(
+        venue_name="Venue",
+        city="City",
+        sections=[SectionQuality(section_name=name, quality_score=score) for name, score in sections],
+    )
+
+
+@pytest.mark.unit
+class TestVenueIntelSectionQuality:
+    """VenueIntel.get_section_quality on canonical section names"""
+
+    def test_numbers_do_not_match_inside_other_numbers(self):
+        intel = venue(("Section 2", 9.5), ("Section 102", 3.0))
+        assert intel.get_section_quality("Section 102") == 3.0
+        assert intel.get_section_quality("Sec 2") == 9.5
+        assert intel.get_section_quality("Section 1") == 5.0
+
+    def test_number_inside_a_longer_name_still_matches(self):
+        intel = venue(("Section 1", 8.0), ("Section 112", 4.0))
+        assert intel.get_section_quality("Sec 112") == 4.0
+        assert intel.get_section_quality("Section 1 Left") == 8.0
+
+    def test_abbreviations_match_rated_names(self):
+        intel = venue(("Orch Center", 9.0), ("Mezzanine", 6.0))
+        assert intel.get_section_quality("Orchestra Center 3") == 9.0
+        assert intel.get_section_quality("MEZZ") == 6.0
+        assert intel.get_section_quality("Balcony") == 5.0
+
+    def test_index_follows_added_sections(self):
+        intel = venue(("Floor", 9.0))
+        assert intel.get_section_quality("Balcony B") == 5.0
+        intel.sections.append(SectionQuality(section_name="Balcony", quality_score=4.0))
+        assert intel.get_section_quality("Balcony B") == 4.0
+
+
+def linear_scan(entries: list[tuple[str, float]], section_name: str, match_contained: bool = True):
+    """The substring scan SectionIndex replaced (first match in rating order)"""
+    name = section_name.lower()
+    for index, (rated, _) in enumerate(entries):
+        rated = rated.lower()
+        if rated in name or (match_contained and name in rated):
+            return index
+    return None
+
+
+# Few, overlapping tokens so random names often contain one another
+TOKENS = ["Sec", "sec", "1", "12", "102", "Mezz", "mezzanine", "A", "b", " ", "-", ""]
+
+
+def random_name(rng: random.Random) -> str:
+    return "".join(rng.choice(TOKENS) for _ in range(rng.randint(0, 4)))
+
+
+@pytest.mark.unit
+class TestSectionIndexMatchesLinearScan:
+    """SectionIndex.match returns what the old linear scan did, on random section lists"""
+
+    @pytest.mark.parametrize("match_contained", [True, False])
+    def test_random_sections(self, match_contained):
+        rng = random.Random(22)
+        for _ in range(300):
+            entries = [(random_name(rng), rng.uniform(1, 10)) for _ in range(rng.randint(0, 12))]
+            index = SectionIndex(entries, default=5.0, match_contained=match_contained)
+            for _ in range(20):
+                name = random_name(rng)
+                expected = linear_scan(entries, name, match_contained)
+                assert index.match(name) == expected, (entries, name)
+                assert index.lookup(name) == (5.0 if expected is None else entries[expected][1])
+
+    def test_empty_index_uses_default(self):
+        index = SectionIndex([], default=5.0)
+        assert index.match("Floor") is None
+        assert index.lookup("Floor") == 5.0
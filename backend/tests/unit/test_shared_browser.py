@@ -0,0 +1,44 @@
+"""
+SharedBrowser CDP port discovery tests
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agents.shared_browser import _read_devtools_port
+
+
+def running():
+    return SimpleNamespace(returncode=None)
+
+
+@pytest.mark.unit
+class TestReadDevtoolsPort:
+    """The port comes from the DevToolsActivePort file Chromium writes"""
+
+    def test_reads_port_from_first_line(self, tmp_path):
+        (tmp_path / "DevToolsActivePort").write_text("41235\n/devtools/browser/abc-123\n")
+        assert asyncio.run(_read_devtools_port(tmp_path, running())) == 41235
+
+    def test_waits_for_chromium_to_write_the_file(self, tmp_path):
+        port_file = tmp_path / "DevToolsActivePort"
+
+        async def scenario():
+            reader = asyncio.create_task(_read_devtools_port(tmp_path, running(), timeout=5))
+            await asyncio.sleep(0.1)
+            port_file.write_text("")  # Created but not yet written
+            await asyncio.sleep(0.1)
+            assert not reader.done()
+            port_file.write_text("50001\n/devtools/browser/abc\n")
+            return await reader
+
+        assert asyncio.run(scenario()) == 50001
+
+    def test_fails_when_chromium_exits(self, tmp_path):
+        with pytest.raises(RuntimeError, match="exited with code 1"):
+            asyncio.run(_read_devtools_port(tmp_path, SimpleNamespace(returncode=1)))
+
+    def test_fails_after_timeout(self, tmp_path):
+        with pytest.raises(RuntimeError, match="did not open a CDP endpoint"):
+            asyncio.run(_read_devtools_port(tmp_path, running(), timeout=0.2))
@@ -0,0 +1,95 @@
+"""
+SingleFlight request coalescing tests
+"""
+import asyncio
+
+import pytest
+
+from src.infrastructure.api.single_flight import SingleFlight
+
+
+class CountingSearch:
+    """A slow search that counts how often it actually runs"""
+
+    def __init__(self, result="events", error: Exception = None):
+        self.runs = 0
+        self.result = result
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.runs += 1
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return self.result
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Concurrent identical calls share one execution"""
+
+    def test_concurrent_identical_calls_share_one_run(self):
+        async def run():
+            flight = SingleFlight()
+            search = CountingSearch()
+            callers = [asyncio.create_task(flight.do("key", search)) for _ in range(5)]
+            await asyncio.sleep(0)
+            in_flight = flight.in_flight()
+            search.release.set()
+            return await asyncio.gather(*callers), search.runs, flight, in_flight
+
+        results, runs, flight, in_flight = asyncio.run(run())
+        assert results == ["events"] * 5
+        assert runs == 1
+        assert in_flight == 1
+        assert (flight.executions, flight.coalesced) == (1, 4)
+        assert flight.in_flight() == 0
+
+    def test_different_keys_run_separately(self):
+        async def run():
+            flight = SingleFlight()
+            search = CountingSearch()
+            search.release.set()
+            await asyncio.gather(flight.do("a", search), flight.do("b", search))
+            return search.runs
+
+        assert asyncio.run(run()) == 2
+
+    def test_failure_reaches_every_waiter(self):
+        async def run():
+            flight = SingleFlight()
+            search = CountingSearch(error=RuntimeError("agents crashed"))
+            callers = [asyncio.create_task(flight.do("key", search)) for _ in range(3)]
+            await asyncio.sleep(0)
+            search.release.set()
+            return await asyncio.gather(*callers, return_exceptions=True), search.runs
+
+        results, runs = asyncio.run(run())
+        assert runs == 1
+        assert all(isinstance(r, RuntimeError) and str(r) == "agents crashed" for r in results)
+
+    def test_cancelled_caller_does_not_cancel_the_shared_run(self):
+        async def run():
+            flight = SingleFlight()
+            search = CountingSearch()
+            leaving = asyncio.create_task(flight.do("key", search))
+            staying = asyncio.create_task(flight.do("key", search))
+            await asyncio.sleep(0)
+            leaving.cancel()
+            await asyncio.sleep(0)
+            search.release.set()
+            return await staying, leaving.cancelled()
+
+        assert asyncio.run(run()) == ("events", True)
+
+    def test_finished_run_is_not_reused(self):
+        async def run():
+            flight = SingleFlight()
+            search = CountingSearch()
+            search.release.set()
+            await flight.do("key", search)
+            await flight.do("key", search)
+            return search.runs
+
+        assert asyncio.run(run()) == 2
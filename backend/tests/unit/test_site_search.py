@@ -0,0 +1,41 @@
+"""
+SiteSearchAgent prompt tests
+"""
+import pytest
+
+from agents.site_search import SITE_CONFIGS, SiteSearchAgent
+from models import EventInfo
+
+TEXT_MARKER = "Price: $[amount]"
+JSON_MARKER = "ONLY a JSON array"
+
+
+def prompts(site_name: str, structured: bool) -> str:
+    agent = SiteSearchAgent(site_name, headless=True, structured_output=structured)
+    event_info = EventInfo(artist_name="Artist", event_name="Artist", city="City")
+    return "\n".join([
+        agent.get_system_instructions(),
+        agent._build_search_instruction(event_info),
+        agent._build_extraction_instruction(event_info),
+    ])
+
+
+@pytest.mark.unit
+class TestOutputFormat:
+    """Each site's prompts ask for exactly one answer format"""
+
+    @pytest.mark.parametrize("site_name", list(SITE_CONFIGS))
+    def test_structured_prompts_only_ask_for_json(self, site_name):
+        text = prompts(site_name, structured=True)
+        assert JSON_MARKER in text
+        assert TEXT_MARKER not in text
+
+    @pytest.mark.parametrize("site_name", list(SITE_CONFIGS))
+    def test_text_prompts_only_ask_for_lines(self, site_name):
+        text = prompts(site_name, structured=False)
+        assert TEXT_MARKER in text
+        assert JSON_MARKER not in text
+
+    @pytest.mark.parametrize("site_name", list(SITE_CONFIGS))
+    def test_site_instructions_leave_the_format_to_the_agent(self, site_name):
+        assert "OUTPUT FORMAT" not in SITE_CONFIGS[site_name]["instructions"]
@@ -0,0 +1,81 @@
+"""
+ValueAnalyzerAgent merge and scoring tests
+"""
+import pytest
+
+from agents.value_analyzer import ValueAnalyzerAgent
+from benchmarks.value_scoring import legacy_analyze, make_results
+from models import AgentStatus, SectionQuality, SiteSearchResult, TicketListing, VenueIntel
+
+
+def listing(source: str, price: float, section: str = "Section 101", row: str = "F", seats: str = None) -> TicketListing:
+    return TicketListing(
+        source=source, section=section, row=row, seat_numbers=seats,
+        price_per_ticket=price, total_price=price,
+    )
+
+
+def ranked(*listings: TicketListing) -> list:
+    by_site = {}
+    for l in listings:
+        by_site.setdefault(l.source, []).append(l)
+    results = {
+        site: SiteSearchResult(site_name=site, status=AgentStatus.SUCCESS, listings=site_listings)
+        for site, site_listings in by_site.items()
+    }
+    seats, _ = ValueAnalyzerAgent().analyze(results)
+    return seats
+
+
+@pytest.mark.unit
+class TestCrossSiteMerge:
+    """Which listings are treated as the same physical seats"""
+
+    def test_same_seat_numbers_merge(self):
+        seats = ranked(
+            listing("stubhub", 120.0, section="Sec 101", row="Row 06", seats="Seats 5 & 6"),
+            listing("tickpick", 100.0, section="SECTION 101", row="6", seats="5-6"),
+        )
+        assert len(seats) == 1
+        assert seats[0].source == "tickpick"
+        assert [(a.source, a.price) for a in seats[0].alternates] == [("stubhub", 120.0)]
+
+    def test_same_row_without_seat_numbers_does_not_merge(self):
+        seats = ranked(listing("stubhub", 120.0), listing("tickpick", 100.0))
+        assert sorted(s.source for s in seats) == ["stubhub", "tickpick"]
+        assert all(not s.alternates for s in seats)
+
+    def test_different_seat_numbers_do_not_merge(self):
+        seats = ranked(listing("stubhub", 120.0, seats="1-2"), listing("tickpick", 100.0, seats="3-4"))
+        assert len(seats) == 2
+
+    def test_same_site_never_merges(self):
+        seats = ranked(listing("stubhub", 120.0, seats="5-6"), listing("stubhub", 100.0, seats="5-6"))
+        assert len(seats) == 2
+
+
+@pytest.mark.unit
+class TestScoringMatchesReference:
+    """The NumPy scoring ranks and scores exactly like the per-listing loop it replaced"""
+
+    @pytest.mark.parametrize("with_venue_intel", [False, True])
+    def test_random_listings(self, with_venue_intel):
+        venue_intel = None
+        if with_venue_intel:
+            venue_intel = VenueIntel(venue_name="Venue", city="City", sections=[
+                SectionQuality(section_name=name, quality_score=score)
+                for name, score in [("Floor", 9.0), ("Mezzanine", 6.5), ("Balcony", 4.0), ("101", 8.0)]
+            ])
+
+        analyzer = ValueAnalyzerAgent()
+        for seed in range(5):
+            results = make_results(600, seed=seed)
+            expected = legacy_analyze(analyzer, results, venue_intel)
+            actual, _ = analyzer.analyze(results, venue_intel)
+            top, _ = analyzer.analyze(results, venue_intel, top_k=25)
+
+            def rows(seats):
+                return [(s.source, s.section, s.row, s.price, s.aiValueScore) for s in seats]
+
+            assert rows(actual) == rows(expected)
+            assert rows(top) == rows(expected)[:25]
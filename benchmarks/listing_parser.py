@@ -0,0 +1,129 @@
+"""
+Listing parser throughput on large agent transcripts.
+
+Compares agents.listing_parser with the multi-pass parser it replaced
+(kept here as the baseline) on synthetic AgentResults mixing the three
+listing formats with agent reasoning text.
+
+Usage:
+    python -m benchmarks.listing_parser
+    python -m benchmarks.listing_parser --sizes 100,1000,10000 --repeat 5
+"""
+
+import argparse
+import random
+import re
+import time
+
+from stagehand.types.agent import AgentResult
+
+from agents.listing_parser import extract_text, parse_listings
+from models import TicketListing
+
+
+SECTIONS = ["Orchestra", "Floor", "Mezzanine", "Balcony", "Lower", "Upper", "Club"]
+
+
+def make_transcript(n_listings: int, seed: int = 0) -> AgentResult:
+    """An AgentResult whose message lists n_listings seats in mixed formats."""
+    rng = random.Random(seed)
+    lines = ["I searched the site and scrolled through the listings. Here is what I found:"]
+    for i in range(n_listings):
+        section = f"{rng.choice(SECTIONS)} {rng.randint(1, 40)}"
+        row = rng.choice("ABCDEFGHJKLMN")
+        price = f"{rng.uniform(25, 400):.2f}"
+        style = rng.random()
+        if style < 0.8:
+            lines.append(f"Section: {section}, Row: {row}, Price: ${price}")
+        elif style < 0.9:
+            lines.append(f"Sec {rng.randint(100, 350)} • Row {row}, Standard Admission, ${price}")
+        else:
+            lines.append(f"**Section:** {section}, **Row:** {row}, 2 tickets, ${price}")
+        if i % 25 == 0:
+            lines.append("Scrolling down with PageDown to see more listings.")
+    return AgentResult(actions=[], message="\n".join(lines), usage=None, completed=True)
+
+
+def legacy_parse(result, source: str) -> list[TicketListing]:
+    """The previous _parse_listings (text collection, three findall passes, any() dedupe)."""
+    result_texts = []
+    for attr in ['message', 'text', 'content', 'output', 'reasoning', 'thoughts']:
+        if hasattr(result, attr):
+            text = getattr(result, attr)
+            if text:
+                result_texts.append(str(text))
+    if isinstance(result, dict):
+        for key, value in result.items():
+            if isinstance(value, str) and len(value) > 10:
+                result_texts.append(value)
+    result_texts.append(str(result))
+    if hasattr(result, '__dict__'):
+        for key, value in result.__dict__.items():
+            if isinstance(value, str) and len(value) > 10:
+                result_texts.append(value)
+    full_text = "\n".join(result_texts)
+
+    listings = []
+    structured_pattern = r'Section:\s*([^,\n]+)(?:,\s*Row:\s*([^,\n]+))?,.*?Price:\s*\$(\d+(?:\.\d{2})?)'
+    for section, row, price in re.findall(structured_pattern, full_text, re.IGNORECASE):
+        listings.append(TicketListing(source=source, section=section.strip(), row=row.strip() if row else "",
+                                      price_per_ticket=float(price), total_price=float(price), quantity=2))
+    for pattern in (r'Sec\s+([A-Z0-9]+)\s*[•·]\s*Row\s+([A-Z0-9]+)[^$]*\$(\d+(?:\.\d{2})?)',
+                    r'\*\*(?:Section|Sec)[:\s]*\*\*\s*([^,*]+),?\s*\*\*Row[:\s]*\*\*\s*([^,*]+).*?\$(\d+(?:\.\d{2})?)'):
+        for section, row, price in re.findall(pattern, full_text, re.IGNORECASE):
+            if not any(l.section == section.strip() and l.row == row.strip() for l in listings):
+                listings.append(TicketListing(source=source, section=section.strip(), row=row.strip(),
+                                              price_per_ticket=float(price), total_price=float(price), quantity=2))
+
+    seen = set()
+    unique_listings = []
+    for listing in listings:
+        key = (listing.section, listing.row or "", listing.price_per_ticket)
+        if key not in seen:
+            seen.add(key)
+            unique_listings.append(listing)
+    return unique_listings
+
+
+def time_parser(parse, result, repeat: int) -> tuple[float, list[TicketListing]]:
+    """Best-of-repeat seconds for one parse."""
+    best = float("inf")
+    listings: list[TicketListing] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        listings = parse(result)
+        best = min(best, time.perf_counter() - started)
+    return best, listings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Listing parser throughput")
+    parser.add_argument("--sizes", default="100,1000,5000,20000", help="Listings per transcript")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-legacy-above", type=int, default=5000,
+                        help="Legacy parser is quadratic - skip it for larger transcripts")
+    args = parser.parse_args()
+
+    def new(result):
+        return parse_listings(extract_text(result), "bench")
+
+    def old(result):
+        return legacy_parse(result, "bench")
+
+    print(f"{'Listings':>9} {'KB':>7} {'Parsed':>7} {'New ms':>9} {'New listings/s':>15} "
+          f"{'Old ms':>10} {'Old listings/s':>15} {'Speedup':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        result = make_transcript(size)
+        kb = len(result.message.encode()) / 1024
+        new_seconds, listings = time_parser(new, result, args.repeat)
+        line = (f"{size:>9} {kb:>7.0f} {len(listings):>7} {new_seconds * 1000:>9.2f} "
+                f"{len(listings) / new_seconds:>15,.0f}")
+        if size <= args.skip_legacy_above:
+            old_seconds, old_listings = time_parser(old, result, args.repeat)
+            line += (f" {old_seconds * 1000:>10.2f} {len(old_listings) / old_seconds:>15,.0f} "
+                     f"{old_seconds / new_seconds:>7.1f}x")
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Offline search benchmark: Replays recorded agent sessions through the real
+orchestrator, parsers and value scoring - no browsers, network or API key.
+
+Usage:
+    python -m benchmarks.replay_search                             # synthetic recording
+    python -m benchmarks.replay_search --recording data/recordings/louis_ck.json
+    python -m benchmarks.replay_search --searches 50 --concurrency 8 --latency-scale 0
+    python -m benchmarks.replay_search --latency execute=0.5 --latency goto=0.05
+    python -m benchmarks.replay_search --synthesize data/recordings/synthetic.json
+    python -m benchmarks.replay_search --structured                # JSON listing payloads
+
+Record a real session first with:
+    STAGEHAND_BACKEND=record STAGEHAND_RECORDING=data/recordings/louis_ck.json python main.py
+
+Latencies are the recorded ones times --latency-scale (default 0.01, so a
+2-minute site search replays in ~1s), unless fixed per operation with
+--latency. The agent rate limit is lifted unless --rate-limit is given.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Replay recorded agent sessions through the orchestrator")
+    parser.add_argument("--recording", help="Recording to replay (default: a synthetic one)")
+    parser.add_argument("--synthesize", metavar="PATH", help="Write a synthetic recording to PATH and exit")
+    parser.add_argument("--query", default="Louis CK")
+    parser.add_argument("--location", default="Stockton")
+    parser.add_argument("--sites", default="ticketmaster,tickpick", help="Comma-separated sites")
+    parser.add_argument("--searches", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4, help="Searches in flight at once")
+    parser.add_argument("--slots", type=int, help="MAX_BROWSER_SLOTS for the run")
+    parser.add_argument("--latency-scale", type=float, default=0.01)
+    parser.add_argument("--latency", action="append", default=[], metavar="OP=SECONDS",
+                        help="Fixed latency for launch/goto/execute/evaluate/close")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- fraction of random latency noise")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--listings-per-site", type=int, default=40, help="Synthetic recording only")
+    parser.add_argument("--structured", action="store_true",
+                        help="Site agents answer with JSON listing payloads (STRUCTURED_LISTINGS)")
+    parser.add_argument("--pipelined", action="store_true")
+    parser.add_argument("--rate-limit", action="store_true", help="Keep the agent execution rate limit")
+    parser.add_argument("--verbose", action="store_true", help="Show agent output")
+    return parser.parse_args()
+
+
+def configure_environment(args) -> None:
+    """Settings read at import time - must run before importing agents/orchestrator."""
+    if not args.rate_limit:
+        os.environ["AGENT_EXECUTIONS_PER_MINUTE"] = "1000000"
+        os.environ["AGENT_EXECUTION_BURST"] = "1000000"
+    if args.slots:
+        os.environ["MAX_BROWSER_SLOTS"] = str(args.slots)
+    if args.structured:
+        os.environ["STRUCTURED_LISTINGS"] = "true"
+    # Don't learn (or persist) site timeouts from replayed latencies
+    os.environ["SITE_LATENCY_PATH"] = os.path.join(tempfile.mkdtemp(), "site_latency.json")
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run_benchmark(args, sites: list[str]) -> None:
+    from agents import Recording, ReplayBackend, ReplayLatency, set_stagehand_backend, summarize_timeline
+    from agents import synthesize_recording
+    from orchestrator import run_ticket_search
+
+    if args.recording:
+        recording = Recording.load(args.recording)
+        # A missing agent would only show up as failed site searches in the results
+        from agents.site_search import SITE_CONFIGS
+
+        agents = ["ResearchAgent", "VenueIntelAgent"] + [f"{SITE_CONFIGS[site]['name']}Agent" for site in sites]
+        missing = recording.missing(agents)
+        if missing:
+            raise SystemExit(f"Recording {args.recording} has no sessions for {', '.join(missing)}")
+    else:
+        recording = synthesize_recording(
+            sites, city=args.location, listings_per_site=args.listings_per_site, seed=args.seed,
+            structured=args.structured,
+        )
+
+    overrides = {}
+    for item in args.latency:
+        op, _, seconds = item.partition("=")
+        overrides[op] = float(seconds)
+    set_stagehand_backend(ReplayBackend(
+        recording,
+        ReplayLatency(scale=args.latency_scale, overrides=overrides, jitter=args.jitter, seed=args.seed),
+    ))
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    durations: list[float] = []
+
+    async def one_search():
+        async with semaphore:
+            started = time.perf_counter()
+            result = await run_ticket_search(
+                query=args.query, location=args.location, sites=sites, pipelined=args.pipelined
+            )
+            durations.append(time.perf_counter() - started)
+            return result
+
+    output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    started = time.perf_counter()
+    with output:
+        results = await asyncio.gather(*(one_search() for _ in range(args.searches)))
+    wall = time.perf_counter() - started
+
+    steps = [step for result in results for step in result.all_steps()]
+    summary = summarize_timeline(steps)
+    listings = sum(len(r.listings) for result in results for r in result.search_results.values())
+    seats = sum(len(result.ranked_seats) for result in results)
+    failed = sum(
+        1 for result in results for r in result.search_results.values() if r.status.value != "success"
+    )
+
+    print(f"Searches:     {args.searches} x {len(sites)} sites, concurrency {args.concurrency}"
+          f"{', pipelined' if args.pipelined else ''}")
+    print(f"Latency:      scale {args.latency_scale}" + (f", fixed {overrides}" if overrides else ""))
+    print(f"Wall time:    {wall:.2f}s ({args.searches / wall:.2f} searches/s)")
+    print(f"Per search:   p50 {percentile(durations, 0.5):.3f}s  p95 {percentile(durations, 0.95):.3f}s"
+          f"  max {max(durations):.3f}s  mean {statistics.mean(durations):.3f}s")
+    print(f"Listings:     {listings} parsed, {seats} seats ranked, {failed} site searches not successful")
+
+    print(f"\n{'Step':<15} {'Count':>6} {'Total s':>9} {'Mean ms':>9} {'Max ms':>9}")
+    for kind, entry in sorted(summary.items(), key=lambda item: -item[1]["total_seconds"]):
+        mean_ms = entry["total_seconds"] / entry["count"] * 1000
+        print(f"{kind:<15} {entry['count']:>6} {entry['total_seconds']:>9.3f} "
+              f"{mean_ms:>9.3f} {entry['max_seconds'] * 1000:>9.3f}")
+
+    # CPU-bound stages, independent of simulated latency
+    site_parse_seconds = sum(
+        step.duration
+        for result in results
+        for r in result.search_results.values()
+        for step in r.timeline
+        if step.kind == "parse"
+    )
+    analysis = summary.get("analysis_phase", {})
+    if site_parse_seconds:
+        print(f"\nParsing:      {listings / site_parse_seconds:,.0f} listings/s")
+    if analysis.get("total_seconds"):
+        print(f"Scoring:      {seats / analysis['total_seconds']:,.0f} seats/s")
+
+
+def main():
+    args = parse_args()
+    sites = [site.strip() for site in args.sites.split(",") if site.strip()]
+
+    if args.synthesize:
+        from agents import synthesize_recording
+
+        recording = synthesize_recording(
+            sites, city=args.location, listings_per_site=args.listings_per_site, seed=args.seed,
+            structured=args.structured,
+        )
+        recording.save(args.synthesize)
+        print(f"Synthetic recording for {', '.join(sites)} written to {args.synthesize}")
+        return
+
+    configure_environment(args)
+    asyncio.run(run_benchmark(args, sites))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
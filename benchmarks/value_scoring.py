@@ -0,0 +1,115 @@
+"""
+Value scoring throughput on large listing batches.
+
+Compares ValueAnalyzerAgent.analyze (columnar NumPy scoring, Seats built
+only for returned rows) with the per-listing path it replaced - a Seat
+and a scalar score per listing, then a full sort - and checks both rank
+the same seats with the same scores.
+
+Usage:
+    python -m benchmarks.value_scoring
+    python -m benchmarks.value_scoring --sizes 1000,50000 --top-k 100 --repeat 5
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import statistics
+import time
+from typing import Optional
+
+from agents.value_analyzer import ValueAnalyzerAgent
+from models import SiteSearchResult, TicketListing, VenueIntel
+
+
+SECTIONS = ["Floor", "Pit", "Orchestra", "Lower", "Club", "Mezzanine", "Loge", "Upper", "Balcony", "GA"]
+
+
+def make_results(n_listings: int, sites: int = 3, seed: int = 0) -> dict[str, SiteSearchResult]:
+    """n_listings synthetic listings spread over a few sites, without seat numbers (as parsed)."""
+    rng = random.Random(seed)
+    results = {}
+    for site in range(sites):
+        listings = []
+        for _ in range(n_listings // sites):
+            price = round(rng.uniform(25, 400), 2)
+            listings.append(TicketListing(
+                source=f"site{site}",
+                section=f"{rng.choice(SECTIONS)} {rng.randint(1, 40)}",
+                row=rng.choice("ABCDEFGHJK"),
+                price_per_ticket=price,
+                total_price=price if rng.random() > 0.05 else 0.0,
+                is_verified=rng.random() < 0.3,
+            ))
+        results[f"site{site}"] = SiteSearchResult(site_name=f"site{site}", status="success", listings=listings)
+    return results
+
+
+def legacy_value_score(price: float, section_quality: float, median_price: float, is_verified: bool) -> int:
+    """The previous scalar aiValueScore, kept as the reference for the NumPy scoring."""
+    if price <= 0:
+        return 50
+    raw_score = (section_quality * 10) / (price / median_price)
+    if is_verified:
+        raw_score *= 1.10
+    return int(min(100, max(0, raw_score)))
+
+
+def legacy_analyze(
+    analyzer: ValueAnalyzerAgent,
+    results: dict[str, SiteSearchResult],
+    venue_intel: Optional[VenueIntel] = None,
+) -> list:
+    """The previous analyze scoring loop: a Seat and a scalar score per listing, then a full sort."""
+    all_listings = [listing for result in results.values() for listing in result.listings]
+    prices = [l.total_price for l in all_listings if l.total_price > 0]
+    median_price = statistics.median(prices) if prices else 100.0
+    seats = []
+    for listing in all_listings:
+        if venue_intel:
+            quality = venue_intel.get_section_quality(listing.section)
+        else:
+            quality = analyzer._estimate_section_quality(listing.section)
+        price = listing.total_price or listing.price_per_ticket
+        score = legacy_value_score(price, quality, median_price, listing.is_verified)
+        seats.append(analyzer._seat_from_listing(listing, score))
+    seats.sort(key=lambda s: s.aiValueScore, reverse=True)
+    return seats
+
+
+def best_of(run, repeat: int) -> tuple[float, list]:
+    best = float("inf")
+    seats: list = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            seats = run()
+        best = min(best, time.perf_counter() - started)
+    return best, seats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Value scoring throughput")
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Listings per analyze call")
+    parser.add_argument("--top-k", type=int, default=50, help="Also time analyze(top_k=...)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    analyzer = ValueAnalyzerAgent()
+    print(f"{'Listings':>9} {'Old ms':>9} {'New ms':>9} {'Speedup':>8} "
+          f"{'Top-' + str(args.top_k) + ' ms':>11} {'Speedup':>8} {'Same':>5}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        results = make_results(size)
+        old_seconds, old_seats = best_of(lambda: legacy_analyze(analyzer, results), args.repeat)
+        new_seconds, new_seats = best_of(lambda: analyzer.analyze(results)[0], args.repeat)
+        top_seconds, _ = best_of(lambda: analyzer.analyze(results, top_k=args.top_k)[0], args.repeat)
+        same = [(s.source, s.section, s.row, s.price, s.aiValueScore) for s in old_seats] == \
+               [(s.source, s.section, s.row, s.price, s.aiValueScore) for s in new_seats]
+        print(f"{size:>9} {old_seconds * 1000:>9.1f} {new_seconds * 1000:>9.1f} "
+              f"{old_seconds / new_seconds:>7.1f}x {top_seconds * 1000:>11.1f} "
+              f"{old_seconds / top_seconds:>7.1f}x {'yes' if same else 'NO':>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,12 @@ Usage:
     python main.py                          # Interactive mode
     python main.py "Artist Name" "City"     # Direct search
     python main.py --headless               # Run without browser UI
+    python main.py --shared-browser         # One Chromium process, a context per agent
+    python main.py --pipelined              # Search sites while research is still running
+
+Record a search, then replay it offline (no browsers or API key):
+    STAGEHAND_BACKEND=record STAGEHAND_RECORDING=data/recordings/search.json python main.py
+    STAGEHAND_BACKEND=replay STAGEHAND_RECORDING=data/recordings/search.json python main.py
 """
 
 import asyncio
@@ -15,7 +21,9 @@ from datetime import datetime
 
 from dotenv import load_dotenv
 
+from agents import close_browser_pools
 from orchestrator import run_ticket_search
+from tracing import get_tracer, start_span, trace_agent_steps
 
 load_dotenv()
 
@@ -106,6 +114,8 @@ async def main():
     query = DEFAULT_QUERY
     location = DEFAULT_LOCATION
     headless = False
+    shared_browser = False
+    pipelined = False
     sites = None  # Use all sites
 
     # Simple argument parsing
@@ -113,6 +123,12 @@ async def main():
     if "--headless" in args:
         headless = True
         args.remove("--headless")
+    if "--shared-browser" in args:
+        shared_browser = True
+        args.remove("--shared-browser")
+    if "--pipelined" in args:
+        pipelined = True
+        args.remove("--pipelined")
 
     if "--help" in args or "-h" in args:
         print(__doc__)
@@ -144,13 +160,22 @@ This will:
 Press Ctrl+C to cancel at any time.
 """)
 
-    # Run the search
-    result = await run_ticket_search(
-        query=query,
-        location=location,
-        headless=headless,
-        sites=sites,
-    )
+    # Run the search (traced when TRACE_FILE or OTEL_EXPORTER_OTLP_ENDPOINT is set)
+    trace_agent_steps()
+    try:
+        with start_span("cli.search", query=query, location=location):
+            result = await run_ticket_search(
+                query=query,
+                location=location,
+                headless=headless,
+                sites=sites,
+                shared_browser=shared_browser,
+                pipelined=pipelined,
+            )
+    finally:
+        # Shut down the warm browsers kept by the pool
+        await close_browser_pools()
+        get_tracer().shutdown()
 
     # Display results
     print_results(result)
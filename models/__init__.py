@@ -2,26 +2,49 @@ from .schemas import (
     Venue,
     Event,
     Seat,
+    SeatAlternate,
     TicketListing,
     SiteSearchResult,
+    AgentStep,
     VenueIntel,
     SectionQuality,
     EventInfo,
     SearchQuery,
     OrchestratorResult,
+    SearchProgress,
     AgentStatus,
 )
+from .section_index import SectionIndex
+from .section_names import canonical_section, canonical_row, canonical_seats, seat_key
+from .serialization import (
+    to_jsonable,
+    orchestrator_result_from_dict,
+    site_search_result_from_dict,
+    venue_intel_from_dict,
+)
 
 __all__ = [
     "Venue",
     "Event",
     "Seat",
+    "SeatAlternate",
     "TicketListing",
     "SiteSearchResult",
+    "AgentStep",
     "VenueIntel",
     "SectionQuality",
     "EventInfo",
     "SearchQuery",
     "OrchestratorResult",
+    "SearchProgress",
     "AgentStatus",
+    "SectionIndex",
+    "canonical_section",
+    "canonical_row",
+    "canonical_seats",
+    "seat_key",
+    "to_jsonable",
+    "orchestrator_result_from_dict",
+    "site_search_result_from_dict",
+    "venue_intel_from_dict",
 ]
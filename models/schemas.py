@@ -6,7 +6,10 @@ These schemas match the frontend entities for seamless integration.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
+
+from .section_index import SectionIndex
+from .section_names import canonical_section
 
 
 class AgentStatus(Enum):
@@ -16,6 +19,7 @@ class AgentStatus(Enum):
     SUCCESS = "success"
     FAILED = "failed"
     PARTIAL = "partial"  # Some results, but not complete
+    SKIPPED = "skipped"  # Not run (e.g. site's circuit breaker is open)
 
 
 @dataclass
@@ -40,6 +44,15 @@ class Event:
     vendorSource: str  # "ticketmaster", "stubhub", "seatgeek", "tickpick"
 
 
+@dataclass
+class SeatAlternate:
+    """The same seats listed on another site."""
+    source: str
+    price: float
+    fees: float = 0.0
+    url: str = ""
+
+
 @dataclass
 class Seat:
     """Seat/ticket information - matches frontend Seat entity."""
@@ -55,6 +68,7 @@ class Seat:
     fees: float = 0.0
     url: str = ""
     source: str = ""  # Which site this came from
+    alternates: list[SeatAlternate] = field(default_factory=list)  # Same seats on other sites
 
 
 @dataclass
@@ -73,6 +87,16 @@ class TicketListing:
     notes: str = ""
 
 
+@dataclass
+class AgentStep:
+    """One timed step of an agent (launch, navigate, execute, parse, ...)."""
+    agent: str
+    kind: str
+    started_at: float  # Unix timestamp
+    duration: float = 0.0  # Seconds
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
 @dataclass
 class SiteSearchResult:
     """Result from a single site search agent."""
@@ -82,6 +106,7 @@ class SiteSearchResult:
     error_message: Optional[str] = None
     search_url: str = ""
     screenshots: list[str] = field(default_factory=list)
+    timeline: list[AgentStep] = field(default_factory=list)
 
 
 @dataclass
@@ -104,12 +129,27 @@ class VenueIntel:
     tips: list[str] = field(default_factory=list)
 
     def get_section_quality(self, section_name: str) -> float:
-        """Get quality score for a section (default 5.0 if not found)."""
-        section_lower = section_name.lower()
-        for section in self.sections:
-            if section.section_name.lower() in section_lower or section_lower in section.section_name.lower():
-                return section.quality_score
-        return 5.0  # Default middle quality
+        """Get quality score for a section (default 5.0 if not found), matching canonical names."""
+        return self.section_index().lookup(section_name)
+
+    def section_index(self) -> SectionIndex:
+        """
+        The precompiled quality index for these sections, built on first use.
+
+        Rebuilt if the sections list is replaced or grows; edit sections in
+        place before scoring, not during.
+        """
+        # Kept out of the dataclass fields so it is never serialized or compared
+        built_for, built_size, index = self.__dict__.get("_section_index", (None, 0, None))
+        if index is None or built_for is not self.sections or built_size != len(self.sections):
+            index = SectionIndex(
+                [(section.section_name, section.quality_score) for section in self.sections],
+                default=5.0,  # Default middle quality
+                normalize=canonical_section,
+                whole_numbers=True,  # Canonical names are often bare numbers - "2" is not in "102"
+            )
+            self.__dict__["_section_index"] = (self.sections, len(self.sections), index)
+        return index
 
 
 @dataclass
@@ -134,6 +174,13 @@ class SearchQuery:
     max_price: Optional[float] = None
 
 
+@dataclass
+class SearchProgress:
+    """Progress event streamed by the orchestrator while a search runs."""
+    kind: str  # "research", "site_result", "best_so_far", "venue_intel", "ranked", "complete"
+    data: Any = None  # EventInfo, SiteSearchResult, VenueIntel, list[Seat] or OrchestratorResult
+
+
 @dataclass
 class OrchestratorResult:
     """Final result from the orchestrator."""
@@ -146,6 +193,15 @@ class OrchestratorResult:
     errors: list[str] = field(default_factory=list)
     started_at: datetime = field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
+    timeline: list[AgentStep] = field(default_factory=list)  # Phases, research and venue steps
+    cut_off: Optional[str] = None  # Why the site searches were stopped early (partial results)
+
+    def all_steps(self) -> list[AgentStep]:
+        """Every timed step of the search (including each site's), by start time."""
+        steps = list(self.timeline)
+        for site_result in self.search_results.values():
+            steps.extend(site_result.timeline)
+        return sorted(steps, key=lambda step: step.started_at)
 
     def to_frontend_json(self) -> dict:
         """Convert to JSON format expected by frontend."""
@@ -0,0 +1,170 @@
+"""
+Section quality index: Answers "which rated section does this listing's
+section name match?" in time linear in the name, however many sections a
+venue has.
+
+A name matches a rated section when either normalized string (lowercased,
+or canonical section keys) contains the other, and the first matching
+section (in rating order) wins - the same rule as a linear substring scan,
+precompiled into two automata:
+
+    rated name inside the listing's name   Aho-Corasick over the rated names
+    listing's name inside a rated name     trie of every rated-name suffix
+
+Each automaton node carries the lowest section index it can match, so one
+walk gives the first match for each direction. Lookups are memoized per raw
+section string.
+
+With whole_numbers, each run of digits is wrapped in marker characters
+before matching, so numbers only match whole numbers: "2" matches
+"upper 2" but not "102".
+"""
+
+import re
+from typing import Callable, Iterable, Optional
+
+
+# Memoized raw strings per index before the cache is cleared
+MAX_CACHED_LOOKUPS = 65536
+
+_NO_MATCH = float("inf")
+
+_NUMBER_RE = re.compile(r"\d+")
+
+
+class SectionIndex:
+    """First-match section quality lookups, precompiled from (name, quality) pairs."""
+
+    def __init__(
+        self,
+        entries: Iterable[tuple[str, float]],
+        default: float,
+        match_contained: bool = True,
+        normalize: Callable[[str], str] = str.lower,
+        whole_numbers: bool = False,
+    ):
+        """
+        Args:
+            entries: (section name, quality) in priority order
+            default: Quality when no section matches
+            match_contained: Also match names that are substrings of a rated
+                name (e.g. "Mezz" -> "Mezzanine"), not just names containing one
+            normalize: Applied to rated names and looked-up names before matching
+            whole_numbers: Never match part of a number ("2" inside "102")
+        """
+        entries = list(entries)
+        self.normalize = normalize
+        self.whole_numbers = whole_numbers
+        self.names = [self._prepare(name) for name, _ in entries]
+        self.qualities = [quality for _, quality in entries]
+        self.default = default
+        self.match_contained = match_contained
+        self._cache: dict[str, float] = {}
+
+        self._build_automaton()
+        if match_contained:
+            self._build_suffix_trie()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def lookup(self, section_name: str) -> float:
+        """Quality of the first section matching section_name (default if none)."""
+        quality = self._cache.get(section_name)
+        if quality is None:
+            if len(self._cache) >= MAX_CACHED_LOOKUPS:
+                self._cache.clear()
+            index = self.match(section_name)
+            quality = self._cache[section_name] = self.default if index is None else self.qualities[index]
+        return quality
+
+    def match(self, section_name: str) -> Optional[int]:
+        """Index of the first matching section, or None."""
+        text = self._prepare(section_name)
+        best = self._find_contained_names(text)
+        if self.match_contained:
+            best = min(best, self._find_containing_name(text))
+        return None if best == _NO_MATCH else int(best)
+
+    def _prepare(self, name: str) -> str:
+        text = self.normalize(name)
+        if self.whole_numbers:
+            text = _NUMBER_RE.sub(lambda number: f"\x02{number.group()}\x03", text)
+        return text
+
+    # ------------------------------------------------------------------
+    # Rated names inside the listing's name (Aho-Corasick)
+    # ------------------------------------------------------------------
+
+    def _build_automaton(self) -> None:
+        goto: list[dict[str, int]] = [{}]
+        first: list[float] = [_NO_MATCH]  # Lowest index of a name ending at each node
+        for index, name in enumerate(self.names):
+            node = 0
+            for char in name:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][char] = next_node
+                    goto.append({})
+                    first.append(_NO_MATCH)
+                node = next_node
+            first[node] = min(first[node], index)
+
+        # Breadth-first failure links; fold each node's fail chain into its own match
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for node in queue:
+            for char, child in goto[node].items():
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(char, 0)
+                first[child] = min(first[child], first[fail[child]])
+                queue.append(child)
+
+        self._goto = goto
+        self._fail = fail
+        self._first = first
+
+    def _find_contained_names(self, text: str) -> float:
+        goto, fail, first = self._goto, self._fail, self._first
+        best = first[0]  # An empty rated name is inside everything
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if first[state] < best:
+                best = first[state]
+        return best
+
+    # ------------------------------------------------------------------
+    # Listing's name inside a rated name (suffix trie)
+    # ------------------------------------------------------------------
+
+    def _build_suffix_trie(self) -> None:
+        children: list[dict[str, int]] = [{}]
+        first: list[float] = [0 if self.names else _NO_MATCH]
+        for index, name in enumerate(self.names):
+            for start in range(len(name)):
+                node = 0
+                for char in name[start:]:
+                    next_node = children[node].get(char)
+                    if next_node is None:
+                        next_node = len(children)
+                        children[node][char] = next_node
+                        children.append({})
+                        first.append(index)
+                    node = next_node
+        self._suffix_children = children
+        self._suffix_first = first
+
+    def _find_containing_name(self, text: str) -> float:
+        children = self._suffix_children
+        node = 0
+        for char in text:
+            node = children[node].get(char)
+            if node is None:
+                return _NO_MATCH
+        return self._suffix_first[node]
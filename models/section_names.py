@@ -0,0 +1,96 @@
+"""
+Section and row canonicalization: Maps the spellings different sites use for
+the same seats to one key, so listings can be compared across sites.
+
+    "Sec 101", "Section 101", "SECTION 0101"   -> "101"
+    "ORCH", "Orch", "Sec OR"                   -> "orchestra"
+    "Mezz Ctr", "Mezzanine Centre"             -> "mezzanine center"
+    "Row 05", "row: 5"                         -> "5"
+    "Seats 5 & 6", "5-6"                       -> "5-6"
+
+Keys are lowercase words for sections and uppercase for rows, and
+canonicalizing a key again returns it unchanged. Both functions are
+memoized, so repeated raw strings cost a dict lookup.
+"""
+
+import re
+from functools import lru_cache
+
+
+# Distinct raw strings remembered per function
+CACHE_SIZE = 65536
+
+_SEPARATORS_RE = re.compile(r"[^a-z0-9+&']+")
+
+# Words that only say "this is a section"
+SECTION_WORDS = {"section", "sec", "sect", "sctn"}
+
+# Abbreviations sites use for the same section words
+SECTION_ABBREVIATIONS = {
+    "orch": "orchestra",
+    "orc": "orchestra",
+    "mezz": "mezzanine",
+    "mez": "mezzanine",
+    "mz": "mezzanine",
+    "balc": "balcony",
+    "bal": "balcony",
+    "bl": "balcony",
+    "ctr": "center",
+    "cntr": "center",
+    "centre": "center",
+    "lft": "left",
+    "rt": "right",
+    "rgt": "right",
+    "flr": "floor",
+    "lwr": "lower",
+    "upr": "upper",
+    "uppr": "upper",
+    "lvl": "level",
+    "ga": "general admission",
+}
+
+# Words around seat numbers
+SEAT_WORDS = {"seat", "seats", "&", "and", "to", "thru", "through"}
+
+# Codes that are only abbreviations as the first word ("Sec OR" is Orchestra; "Floor or Pit" is not)
+LEADING_ABBREVIATIONS = {"or": "orchestra"}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def canonical_section(raw: str) -> str:
+    """Canonical key for a section name ("" for an empty name)."""
+    words = []
+    for word in _SEPARATORS_RE.split(raw.lower()):
+        if not word or word in SECTION_WORDS:
+            continue
+        if not words and word in LEADING_ABBREVIATIONS:
+            word = LEADING_ABBREVIATIONS[word]
+        else:
+            word = SECTION_ABBREVIATIONS.get(word, word)
+        if word.isascii() and word.isdigit():
+            word = str(int(word))
+        words.append(word)
+    return " ".join(words)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def canonical_row(raw: str) -> str:
+    """Canonical key for a row ("" for no row)."""
+    row = "".join(char for char in raw.upper() if char.isalnum())
+    if row.startswith("ROW") and len(row) > 3:
+        row = row[3:]
+    if row.isascii() and row.isdigit():
+        row = str(int(row))
+    return row
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def canonical_seats(raw: str) -> str:
+    """Canonical key for seat numbers ("5-6", "5, 6" and "Seats 5 & 6" -> "5-6")."""
+    numbers = [word for word in _SEPARATORS_RE.split(raw.lower()) if word and word not in SEAT_WORDS]
+    return "-".join(str(int(n)) if n.isascii() and n.isdigit() else n.upper() for n in numbers)
+
+
+def seat_key(section: str, row: str = "") -> tuple[str, str]:
+    """(section, row) key identifying the same seats on any site."""
+    return canonical_section(section), canonical_row(row or "")
@@ -0,0 +1,144 @@
+"""
+JSON-friendly (de)serialization for the agent data models.
+Used wherever results leave the process: caches, stores and streams.
+"""
+
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+
+from .schemas import (
+    AgentStatus,
+    AgentStep,
+    Event,
+    EventInfo,
+    OrchestratorResult,
+    SearchQuery,
+    Seat,
+    SeatAlternate,
+    SectionQuality,
+    SiteSearchResult,
+    TicketListing,
+    Venue,
+    VenueIntel,
+)
+
+
+def to_jsonable(obj: Any) -> Any:
+    """Recursively convert dataclasses, enums and datetimes to JSON types."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: to_jsonable(getattr(obj, f.name)) for f in fields(obj)}
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, dict):
+        return {key: to_jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_jsonable(item) for item in obj]
+    return obj
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp (None stays None)."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def listing_from_dict(data: dict) -> TicketListing:
+    """Rebuild a TicketListing from to_jsonable() output."""
+    return TicketListing(**data)
+
+
+def agent_step_from_dict(data: dict) -> AgentStep:
+    """Rebuild an AgentStep from to_jsonable() output."""
+    return AgentStep(**data)
+
+
+def site_search_result_from_dict(data: dict) -> SiteSearchResult:
+    """Rebuild a SiteSearchResult from to_jsonable() output."""
+    return SiteSearchResult(
+        site_name=data["site_name"],
+        status=AgentStatus(data["status"]),
+        listings=[listing_from_dict(l) for l in data.get("listings", [])],
+        error_message=data.get("error_message"),
+        search_url=data.get("search_url", ""),
+        screenshots=list(data.get("screenshots", [])),
+        timeline=[agent_step_from_dict(s) for s in data.get("timeline", [])],
+        cut_off=data.get("cut_off"),
+    )
+
+
+def venue_intel_from_dict(data: dict) -> VenueIntel:
+    """Rebuild a VenueIntel from to_jsonable() output."""
+    return VenueIntel(
+        venue_name=data["venue_name"],
+        city=data["city"],
+        sections=[SectionQuality(**s) for s in data.get("sections", [])],
+        best_value_sections=list(data.get("best_value_sections", [])),
+        avoid_sections=list(data.get("avoid_sections", [])),
+        seating_chart_url=data.get("seating_chart_url"),
+        tips=list(data.get("tips", [])),
+    )
+
+
+def event_info_from_dict(data: dict) -> EventInfo:
+    """Rebuild an EventInfo from to_jsonable() output."""
+    return EventInfo(
+        artist_name=data["artist_name"],
+        event_name=data["event_name"],
+        dates=[_parse_datetime(d) for d in data.get("dates", [])],
+        venues=list(data.get("venues", [])),
+        city=data.get("city", ""),
+        tour_name=data.get("tour_name"),
+        notes=data.get("notes", ""),
+    )
+
+
+def seat_from_dict(data: dict) -> Seat:
+    """Rebuild a Seat from to_jsonable() output."""
+    alternates = [SeatAlternate(**a) for a in data.get("alternates", [])]
+    return Seat(**{**data, "alternates": alternates})
+
+
+def event_from_dict(data: dict) -> Event:
+    """Rebuild an Event from to_jsonable() output."""
+    return Event(
+        id=data["id"],
+        title=data["title"],
+        date=_parse_datetime(data["date"]),
+        venue=Venue(**data["venue"]),
+        lowestPrice=data["lowestPrice"],
+        distance=data["distance"],
+        vendorSource=data["vendorSource"],
+    )
+
+
+def search_query_from_dict(data: dict) -> SearchQuery:
+    """Rebuild a SearchQuery from to_jsonable() output."""
+    return SearchQuery(
+        query=data["query"],
+        location=data["location"],
+        start_date=_parse_datetime(data.get("start_date")),
+        end_date=_parse_datetime(data.get("end_date")),
+        max_price=data.get("max_price"),
+    )
+
+
+def orchestrator_result_from_dict(data: dict) -> OrchestratorResult:
+    """Rebuild an OrchestratorResult from to_jsonable() output."""
+    return OrchestratorResult(
+        query=search_query_from_dict(data["query"]),
+        event_info=event_info_from_dict(data["event_info"]) if data.get("event_info") else None,
+        venue_intel=venue_intel_from_dict(data["venue_intel"]) if data.get("venue_intel") else None,
+        search_results={
+            site: site_search_result_from_dict(r)
+            for site, r in data.get("search_results", {}).items()
+        },
+        ranked_seats=[seat_from_dict(s) for s in data.get("ranked_seats", [])],
+        events=[event_from_dict(e) for e in data.get("events", [])],
+        errors=list(data.get("errors", [])),
+        started_at=_parse_datetime(data["started_at"]),
+        completed_at=_parse_datetime(data.get("completed_at")),
+        timeline=[agent_step_from_dict(s) for s in data.get("timeline", [])],
+    )
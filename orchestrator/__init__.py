@@ -1,3 +1,17 @@
-from .coordinator import TicketSearchOrchestrator, run_ticket_search
+from .coordinator import TicketSearchOrchestrator, run_ticket_search, stream_ticket_search
+from .circuit_breaker import SiteCircuitBreaker, get_circuit_breaker
+from .latency import SiteLatencyTracker, get_latency_tracker
+from .scheduler import BrowserSlotScheduler, Priority, get_browser_scheduler
 
-__all__ = ["TicketSearchOrchestrator", "run_ticket_search"]
+__all__ = [
+    "TicketSearchOrchestrator",
+    "run_ticket_search",
+    "stream_ticket_search",
+    "SiteCircuitBreaker",
+    "get_circuit_breaker",
+    "SiteLatencyTracker",
+    "get_latency_tracker",
+    "BrowserSlotScheduler",
+    "Priority",
+    "get_browser_scheduler",
+]
@@ -0,0 +1,135 @@
+"""
+Site Circuit Breaker: Stop searching sites that are blocking us.
+
+After a run of consecutive bad results from a site (failed, partial, or a
+CAPTCHA/placeholder-only page) the site's circuit opens and searches skip it
+without spending a browser slot or model calls. Once the cooldown passes, a
+single probe search is let through: success closes the circuit, another bad
+result re-opens it for a further cooldown.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from models import SiteSearchResult, AgentStatus
+
+
+# Consecutive bad results that open a site's circuit
+CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("CIRCUIT_FAILURE_THRESHOLD", "3"))
+
+# Seconds an open circuit waits before letting a probe search through
+CIRCUIT_COOLDOWN = float(os.environ.get("CIRCUIT_COOLDOWN_SECONDS", "600"))
+
+# Error text that means the site is blocking automation
+BLOCKED_MARKERS = ("captcha", "blocked", "access denied", "unusual traffic", "are you a robot")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitState:
+    """Breaker bookkeeping for one site."""
+    state: str = CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    probe_started_at: Optional[float] = None
+
+
+class SiteCircuitBreaker:
+    """Per-site circuit breaker consulted before each site search."""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        cooldown: float = CIRCUIT_COOLDOWN,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self._sites: dict[str, CircuitState] = {}
+
+    def allow(self, site_name: str) -> bool:
+        """Whether a search of this site should run now."""
+        circuit = self._sites.get(site_name)
+        if circuit is None or circuit.state == CLOSED:
+            return True
+
+        now = time.monotonic()
+        if circuit.state == OPEN:
+            if now - circuit.opened_at < self.cooldown:
+                return False
+            circuit.state = HALF_OPEN
+
+        # Half-open: one probe at a time (a probe that never reported back,
+        # e.g. because it was cut off, is replaced after a cooldown)
+        if circuit.probe_started_at is not None and now - circuit.probe_started_at < self.cooldown:
+            return False
+        circuit.probe_started_at = now
+        return True
+
+    def record(self, site_name: str, result: SiteSearchResult) -> None:
+        """Update a site's circuit with the outcome of its search."""
+        circuit = self._sites.setdefault(site_name, CircuitState())
+        circuit.probe_started_at = None
+
+        if not self.is_failure(result):
+            if circuit.state != CLOSED:
+                print(f"  [CIRCUIT] {site_name} recovered - circuit closed")
+            circuit.state = CLOSED
+            circuit.consecutive_failures = 0
+            return
+
+        circuit.consecutive_failures += 1
+        if circuit.state == HALF_OPEN or circuit.consecutive_failures >= self.failure_threshold:
+            if circuit.state != OPEN:
+                print(
+                    f"  [CIRCUIT] {site_name} opened after "
+                    f"{circuit.consecutive_failures} bad result(s)"
+                )
+            circuit.state = OPEN
+            circuit.opened_at = time.monotonic()
+
+    def retry_in(self, site_name: str) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        circuit = self._sites.get(site_name)
+        if circuit is None or circuit.state != OPEN:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - circuit.opened_at))
+
+    def stats(self) -> dict[str, dict]:
+        """Per-site circuit state and consecutive failure count."""
+        return {
+            site_name: {
+                "state": circuit.state,
+                "consecutive_failures": circuit.consecutive_failures,
+                "retry_in_seconds": self.retry_in(site_name),
+            }
+            for site_name, circuit in self._sites.items()
+        }
+
+    @staticmethod
+    def is_failure(result: SiteSearchResult) -> bool:
+        """Whether a site result counts against the site's circuit."""
+        if result.status in (AgentStatus.FAILED, AgentStatus.PARTIAL):
+            return True
+
+        error = (result.error_message or "").lower()
+        if any(marker in error for marker in BLOCKED_MARKERS):
+            return True
+
+        # Only the "check site directly" placeholder means nothing was readable
+        return not any(listing.price_per_ticket > 0 for listing in result.listings)
+
+
+_breaker: Optional[SiteCircuitBreaker] = None
+
+
+def get_circuit_breaker() -> SiteCircuitBreaker:
+    """Get the process-wide site circuit breaker."""
+    global _breaker
+    if _breaker is None:
+        _breaker = SiteCircuitBreaker()
+    return _breaker
@@ -4,8 +4,11 @@ Implements hybrid architecture: parallel site searches with sequential analysis.
 """
 
 import asyncio
+import os
+import time
+import uuid
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Callable, Optional
 
 from models import (
     SearchQuery,
@@ -13,19 +16,38 @@ from models import (
     VenueIntel,
     SiteSearchResult,
     OrchestratorResult,
+    SearchProgress,
     AgentStatus,
+    AgentStep,
 )
-from agents import ResearchAgent, SiteSearchAgent, VenueIntelAgent, ValueAnalyzerAgent
+from agents import ResearchAgent, SiteSearchAgent, VenueIntelAgent, ValueAnalyzerAgent, SharedBrowser
+from agents import IncrementalRanker
+from agents.instrumentation import instrument, summarize_timeline
+from .circuit_breaker import SiteCircuitBreaker, get_circuit_breaker
+from .latency import SiteLatencyTracker, get_latency_tracker
+from .scheduler import BrowserSlotScheduler, Priority, get_browser_scheduler
 
 
 # Sites to search in parallel
 DEFAULT_SITES = ["ticketmaster", "tickpick"]
 
 # Timeout for each site search (5 minutes - agents need time to extract pricing)
+# Used until a site has enough latency history for an adaptive timeout
 SITE_TIMEOUT = 500.0
 
-# Maximum concurrent browser sessions
-MAX_CONCURRENT = 4
+# Run the parallel phase in one Chromium process with a context per agent
+SHARED_BROWSER = os.environ.get("SHARED_BROWSER", "false").lower() == "true"
+
+# Start site searches from the query while research runs alongside them
+PIPELINED_SEARCH = os.environ.get("PIPELINED_SEARCH", "false").lower() == "true"
+
+# How a search deadline is split: research gets a share up front, analysis
+# keeps a share at the end, and site searches get everything in between
+RESEARCH_BUDGET_SHARE = 0.25
+ANALYSIS_BUDGET_SHARE = 0.05
+
+# Seats in each "best value so far" ranking streamed while sites are still searching
+BEST_SO_FAR_SEATS = int(os.environ.get("BEST_SO_FAR_SEATS", "20"))
 
 
 class TicketSearchOrchestrator:
@@ -36,68 +58,215 @@ class TicketSearchOrchestrator:
     1. ResearchAgent → Find event info (sequential)
     2. SiteSearchAgents + VenueIntelAgent → Search sites & gather venue intel (parallel)
     3. ValueAnalyzerAgent → Score and rank results (sequential)
+
+    In pipelined mode, steps 1 and 2 overlap: site searches start straight
+    from the query (they only need the artist and city), and only venue
+    intel waits for research to name the venue.
     """
 
     def __init__(
         self,
         sites: Optional[list[str]] = None,
         headless: bool = False,
+        shared_browser: bool = SHARED_BROWSER,
+        venue_store=None,
+        pipelined: bool = PIPELINED_SEARCH,
+        priority: Priority = Priority.INTERACTIVE,
+        scheduler: Optional[BrowserSlotScheduler] = None,
+        latency_tracker: Optional[SiteLatencyTracker] = None,
+        circuit_breaker: Optional[SiteCircuitBreaker] = None,
     ):
+        """
+        Args:
+            sites: Sites to search (default: DEFAULT_SITES)
+            headless: Run browsers without UI
+            shared_browser: Run site/venue agents as contexts in one Chromium process
+            venue_store: Optional durable VenueIntel store with async
+                get(venue_name, city) and put(intel); known venues skip the
+                VenueIntelAgent entirely
+            pipelined: Run research concurrently with the site searches
+                instead of before them
+            priority: Scheduling class for this search's browser slots
+            scheduler: Browser slot scheduler (default: the process-wide one,
+                which caps browsers across every concurrent search)
+            latency_tracker: Per-site latency history that sets each site's
+                timeout (default: the process-wide, persisted one)
+            circuit_breaker: Per-site breaker that skips sites which keep
+                failing or blocking us (default: the process-wide one)
+        """
         self.sites = sites or DEFAULT_SITES
         self.headless = headless
-        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT)
-
-    async def search(self, query: str, location: str = "") -> OrchestratorResult:
+        self.shared_browser = shared_browser
+        self.venue_store = venue_store
+        self.pipelined = pipelined
+        self.priority = priority
+        self.scheduler = scheduler or get_browser_scheduler()
+        self.latency_tracker = latency_tracker or get_latency_tracker()
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker()
+        # Fairness key: the scheduler round-robins slots between orchestrators
+        self.request_id = uuid.uuid4().hex
+        # Phase and research/venue agent steps of the current search
+        self.timeline: list[AgentStep] = []
+
+    async def search(
+        self,
+        query: str,
+        location: str = "",
+        deadline: Optional[float] = None,
+        enough_listings: Optional[int] = None,
+    ) -> OrchestratorResult:
         """
         Execute a full ticket search.
 
         Args:
             query: Artist or event name
             location: City or location
+            deadline: Overall time budget in seconds (default: no deadline)
+            enough_listings: Stop searching once this many priced listings are found
 
         Returns:
             OrchestratorResult with all findings
         """
+        result = None
+        async for progress in self.search_stream(query, location, deadline, enough_listings):
+            if progress.kind == "complete":
+                result = progress.data
+        return result
+
+    async def search_stream(
+        self,
+        query: str,
+        location: str = "",
+        deadline: Optional[float] = None,
+        enough_listings: Optional[int] = None,
+    ) -> AsyncIterator[SearchProgress]:
+        """
+        Execute a full ticket search, yielding progress as each piece lands.
+
+        Yields SearchProgress events in this order:
+            research     - EventInfo from the ResearchAgent
+            site_result  - one SiteSearchResult per site, as each finishes
+            best_so_far  - top BEST_SO_FAR_SEATS Seats from the sites in so far,
+                           after each site_result with listings (and venue_intel)
+            venue_intel  - VenueIntel for the event's venue
+            ranked       - ranked Seat list from the ValueAnalyzerAgent
+            complete     - the final OrchestratorResult (always sent)
+
+        In pipelined mode, research arrives whenever it finishes, so it may
+        come after some site_result events (but always before venue_intel).
+
+        With a deadline, research may use RESEARCH_BUDGET_SHARE of it (falling
+        back to the query alone), and site searches still running when the
+        search budget runs out - or once enough_listings are in - are
+        cancelled and reported as cut off, and result.cut_off records why.
+        Analysis runs on whatever was found.
+
+        Args:
+            query: Artist or event name
+            location: City or location
+            deadline: Overall time budget in seconds (default: no deadline)
+            enough_listings: Stop searching once this many priced listings are found
+        """
         search_query = SearchQuery(query=query, location=location)
+        research_budget = None
+        search_deadline_at = None
+        if deadline:
+            research_budget = deadline * RESEARCH_BUDGET_SHARE
+            search_deadline_at = (
+                asyncio.get_running_loop().time() + deadline * (1 - ANALYSIS_BUDGET_SHARE)
+            )
         result = OrchestratorResult(
             query=search_query,
             started_at=datetime.now(),
         )
+        self.timeline = result.timeline
 
         print(f"\n{'='*60}")
         print(f"TICKET SEARCH: {query}")
         print(f"Location: {location}")
         print(f"Sites: {', '.join(self.sites)}")
+        if deadline:
+            print(f"Deadline: {deadline:.0f}s")
         print(f"{'='*60}\n")
 
         try:
-            # PHASE 1: Research (Sequential)
-            print("[PHASE 1] Researching event information...")
-            result.event_info = await self._run_research(search_query)
-            print(f"  Found: {result.event_info.event_name}")
-            print(f"  Venues: {', '.join(result.event_info.venues)}")
-
-            # PHASE 2: Parallel Search + Venue Intel
-            print("\n[PHASE 2] Searching sites in parallel...")
-            result.search_results, result.venue_intel = await self._run_parallel_phase(
-                result.event_info
-            )
+            research_task = None
+            if self.pipelined:
+                # PHASE 1+2: Research runs alongside the site searches, which
+                # start from the query right away
+                print("[PHASE 1+2] Researching event and searching sites in parallel...")
+                result.event_info = self._event_info_from_query(search_query)
+                research_task = asyncio.create_task(
+                    self._run_research_within(search_query, research_budget)
+                )
+            else:
+                # PHASE 1: Research (Sequential)
+                print("[PHASE 1] Researching event information...")
+                result.event_info = await self._run_research_within(search_query, research_budget)
+                print(f"  Found: {result.event_info.event_name}")
+                print(f"  Venues: {', '.join(result.event_info.venues)}")
+                yield SearchProgress(kind="research", data=result.event_info)
+
+                # PHASE 2: Parallel Search + Venue Intel (streamed as tasks finish)
+                print("\n[PHASE 2] Searching sites in parallel...")
+
+            progress_queue: asyncio.Queue = asyncio.Queue()
+
+            async def run_phase():
+                try:
+                    with self._instrument_phase("search"):
+                        return await self._run_parallel_phase(
+                            result.event_info,
+                            on_progress=progress_queue.put_nowait,
+                            research=research_task,
+                            deadline_at=search_deadline_at,
+                            enough_listings=enough_listings,
+                        )
+                finally:
+                    progress_queue.put_nowait(None)  # End-of-phase sentinel
+
+            phase_task = asyncio.create_task(run_phase())
+            ranker = IncrementalRanker(top_k=BEST_SO_FAR_SEATS)
+            try:
+                while (progress := await progress_queue.get()) is not None:
+                    if progress.kind == "research":
+                        result.event_info = progress.data
+                    yield progress
+
+                    # Re-rank as each site lands, not just after the slowest one
+                    if progress.kind == "site_result" and progress.data.listings:
+                        ranker.add(progress.data)
+                    elif progress.kind == "venue_intel" and progress.data:
+                        ranker.set_venue_intel(progress.data)
+                    else:
+                        continue
+                    if BEST_SO_FAR_SEATS > 0 and len(ranker):
+                        yield SearchProgress(kind="best_so_far", data=ranker.snapshot())
+                result.search_results, result.venue_intel, result.cut_off = await phase_task
+            finally:
+                # Consumer went away mid-phase - don't leave agents running
+                if not phase_task.done():
+                    phase_task.cancel()
+                if research_task and not research_task.done():
+                    research_task.cancel()
 
             # Report search results
             for site_name, site_result in result.search_results.items():
-                status = "✓" if site_result.status == AgentStatus.SUCCESS else "✗"
+                status = {AgentStatus.SUCCESS: "✓", AgentStatus.SKIPPED: "-"}.get(site_result.status, "✗")
                 count = len(site_result.listings)
                 print(f"  {status} {site_name}: {count} listings")
 
             # PHASE 3: Analysis (Sequential)
             print("\n[PHASE 3] Analyzing value scores...")
             analyzer = ValueAnalyzerAgent()
-            result.ranked_seats, result.events = analyzer.analyze(
-                result.search_results,
-                result.venue_intel,
-                result.event_info,
-            )
+            with self._instrument_phase("analysis"):
+                result.ranked_seats, result.events = analyzer.analyze(
+                    result.search_results,
+                    result.venue_intel,
+                    result.event_info,
+                )
             print(f"  Analyzed {len(result.ranked_seats)} seats")
+            yield SearchProgress(kind="ranked", data=result.ranked_seats)
 
         except Exception as e:
             result.errors.append(f"Orchestration error: {str(e)}")
@@ -107,94 +276,314 @@ class TicketSearchOrchestrator:
         duration = (result.completed_at - result.started_at).total_seconds()
         print(f"\n{'='*60}")
         print(f"Search completed in {duration:.1f}s")
+        self._print_time_breakdown(result)
         print(f"{'='*60}\n")
 
-        return result
+        yield SearchProgress(kind="complete", data=result)
 
     async def _run_research(self, query: SearchQuery) -> EventInfo:
         """Run the research agent to gather event info."""
         agent = ResearchAgent(headless=self.headless)
-        return await agent.run(query)
+        try:
+            return await agent.run(query)
+        finally:
+            self.timeline.extend(agent.timeline)
+
+    def _instrument_phase(self, phase: str):
+        """Time an orchestrator phase as a step on the search timeline."""
+        return instrument(self.timeline, "Orchestrator", f"{phase}_phase")
+
+    @staticmethod
+    def _print_time_breakdown(result: OrchestratorResult) -> None:
+        """Print where the search's time went, by step kind."""
+        summary = summarize_timeline(result.all_steps())
+        if not summary:
+            return
+        print("Time breakdown (summed across agents):")
+        for kind, entry in sorted(summary.items(), key=lambda item: -item[1]["total_seconds"]):
+            print(f"  {kind:<15} {entry['total_seconds']:7.1f}s  x{entry['count']}")
+
+    async def _run_research_within(
+        self, query: SearchQuery, budget: Optional[float]
+    ) -> EventInfo:
+        """Run research, falling back to query-only event info past its budget."""
+        try:
+            with self._instrument_phase("research"):
+                if budget is None:
+                    return await self._run_research_in_slot(query)
+                return await asyncio.wait_for(self._run_research_in_slot(query), timeout=budget)
+        except asyncio.TimeoutError:
+            print(f"  [WARN] Research cut off after {budget:.1f}s")
+            event_info = self._event_info_from_query(query)
+            event_info.notes = f"Research cut off after {budget:.1f}s"
+            return event_info
+
+    async def _run_research_in_slot(self, query: SearchQuery) -> EventInfo:
+        """Run research once the scheduler grants a browser slot."""
+        async with self.scheduler.slot(self.request_id, self.priority):
+            return await self._run_research(query)
+
+    @staticmethod
+    def _event_info_from_query(query: SearchQuery) -> EventInfo:
+        """Provisional EventInfo from the query alone (all a site search needs)."""
+        return EventInfo(
+            artist_name=query.query,
+            event_name=query.query,
+            city=query.location,
+        )
 
     async def _run_parallel_phase(
-        self, event_info: EventInfo
-    ) -> tuple[dict[str, SiteSearchResult], VenueIntel]:
+        self,
+        event_info: EventInfo,
+        on_progress: Optional[Callable[[SearchProgress], None]] = None,
+        research: Optional[asyncio.Task] = None,
+        deadline_at: Optional[float] = None,
+        enough_listings: Optional[int] = None,
+    ) -> tuple[dict[str, SiteSearchResult], VenueIntel, Optional[str]]:
         """
         Run site searches and venue intel in parallel.
 
         Uses asyncio.TaskGroup for clean exception handling.
-        Each site gets its own browser session.
+        Each site gets its own browser session - or, in shared-browser mode,
+        its own isolated context inside a single Chromium process.
+
+        on_progress (if given) is called with a site_result event as each site
+        finishes and a venue_intel event once venue intel is ready.
+
+        research (pipelined mode) is the still-running research task: site
+        searches use the provisional event_info, venue intel waits for the
+        researched one, and a research event is reported when it lands.
+
+        deadline_at (event loop time) and enough_listings cut the phase short:
+        unfinished site searches are cancelled and reported as cut off, and
+        unfinished venue intel falls back to empty intel. Returns the site
+        results, venue intel and the cut-off reason (None if nothing was cut off).
         """
+        shared = SharedBrowser(headless=self.headless) if self.shared_browser else None
+        if shared:
+            await shared.start()
+
+        try:
+            return await self._run_parallel_tasks(
+                event_info, shared, on_progress, research, deadline_at, enough_listings
+            )
+        finally:
+            if shared:
+                await shared.close()
+
+    async def _run_parallel_tasks(
+        self,
+        event_info: EventInfo,
+        shared: Optional[SharedBrowser],
+        on_progress: Optional[Callable[[SearchProgress], None]] = None,
+        research: Optional[asyncio.Task] = None,
+        deadline_at: Optional[float] = None,
+        enough_listings: Optional[int] = None,
+    ) -> tuple[dict[str, SiteSearchResult], VenueIntel, Optional[str]]:
+        """Launch the site search and venue intel tasks and collect their results."""
         search_results = {}
         venue_intel = None
 
-        async def search_site(site_name: str) -> tuple[str, SiteSearchResult]:
-            """Search a single site with timeout."""
-            async with self.semaphore:
+        async def search_site(site_name: str) -> SiteSearchResult:
+            """Search a single site with its adaptive timeout."""
+            async with self.scheduler.slot(self.request_id, self.priority):
+                timeout = self.latency_tracker.timeout_for(site_name, default=SITE_TIMEOUT)
+                started = time.monotonic()
+                with instrument(self.timeline, "Orchestrator", "site_search", site=site_name) as step:
+                    try:
+                        result = await asyncio.wait_for(
+                            self._run_site_search(site_name, event_info, shared),
+                            timeout=timeout,
+                        )
+                        # Only completed searches feed the timeout (failures are censored)
+                        if result.status != AgentStatus.FAILED:
+                            self.latency_tracker.record(site_name, time.monotonic() - started)
+                    except asyncio.TimeoutError:
+                        # Timeouts count at the timeout, so a slowed site's timeout can grow
+                        self.latency_tracker.record_timeout(site_name, timeout)
+                        result = SiteSearchResult(
+                            site_name=site_name,
+                            status=AgentStatus.FAILED,
+                            error_message=f"Search timed out after {timeout:.0f}s",
+                        )
+                    except Exception as e:
+                        result = SiteSearchResult(
+                            site_name=site_name,
+                            status=AgentStatus.FAILED,
+                            error_message=str(e),
+                        )
+                    step.attributes["status"] = result.status.value
+                    step.attributes["listings"] = len(result.listings)
+
+            self.circuit_breaker.record(site_name, result)
+            search_results[site_name] = result
+            if on_progress:
+                on_progress(SearchProgress(kind="site_result", data=result))
+            return result
+
+        async def resolve_event_info() -> EventInfo:
+            """Wait for pipelined research (if any) and report it."""
+            if research is None:
+                return event_info
+
+            try:
+                info = await research
+                print(f"  Found: {info.event_name}")
+                print(f"  Venues: {', '.join(info.venues)}")
+            except Exception as e:
+                print(f"  [ERROR] Research failed: {e}")
+                info = event_info
+
+            if on_progress:
+                on_progress(SearchProgress(kind="research", data=info))
+            return info
+
+        async def research_venue(event_info: EventInfo) -> VenueIntel:
+            """Get venue intelligence (from the venue store when already known)."""
+            venue_name = event_info.venues[0] if event_info.venues else "Unknown Venue"
+
+            if self.venue_store:
                 try:
-                    result = await asyncio.wait_for(
-                        self._run_site_search(site_name, event_info),
-                        timeout=SITE_TIMEOUT,
-                    )
-                    return site_name, result
-                except asyncio.TimeoutError:
-                    return site_name, SiteSearchResult(
-                        site_name=site_name,
-                        status=AgentStatus.FAILED,
-                        error_message="Search timed out",
-                    )
+                    stored = await self.venue_store.get(venue_name, event_info.city)
                 except Exception as e:
-                    return site_name, SiteSearchResult(
-                        site_name=site_name,
-                        status=AgentStatus.FAILED,
-                        error_message=str(e),
-                    )
+                    print(f"  [WARN] Venue store lookup failed: {e}")
+                    stored = None
+                if stored:
+                    print(f"  Venue intel for {venue_name} loaded from store")
+                    return stored
+
+            async with self.scheduler.slot(self.request_id, self.priority):
+                agent = VenueIntelAgent(headless=self.headless, shared_browser=shared)
+                try:
+                    intel = await agent.run(venue_name, event_info.city)
+                finally:
+                    self.timeline.extend(agent.timeline)
 
-        async def get_venue_intel() -> VenueIntel:
-            """Get venue intelligence."""
-            async with self.semaphore:
-                venue_name = event_info.venues[0] if event_info.venues else "Unknown Venue"
-                agent = VenueIntelAgent(headless=self.headless)
-                return await agent.run(venue_name, event_info.city)
+            # Only persist intel from a completed research run (not defaults)
+            if self.venue_store and agent.status == AgentStatus.SUCCESS:
+                try:
+                    await self.venue_store.put(intel)
+                except Exception as e:
+                    print(f"  [WARN] Venue store write failed: {e}")
 
-        # Run all tasks in parallel
-        tasks = []
+            return intel
 
-        # Site search tasks
-        for site_name in self.sites:
-            tasks.append(asyncio.create_task(search_site(site_name)))
+        async def get_venue_intel() -> VenueIntel:
+            """Get venue intelligence, falling back to empty intel on failure."""
+            event_info = await resolve_event_info()
+            try:
+                intel = await research_venue(event_info)
+            except Exception as e:
+                print(f"  [ERROR] Venue intel failed: {e}")
+                intel = VenueIntel(
+                    venue_name="Unknown",
+                    city=event_info.city,
+                )
+
+            if on_progress:
+                on_progress(SearchProgress(kind="venue_intel", data=intel))
+            return intel
+
+        def found_enough() -> bool:
+            if enough_listings is None:
+                return False
+            # The price-0 "check site directly" placeholder is not a found listing
+            priced = sum(
+                1 for r in search_results.values() for listing in r.listings if listing.price_per_ticket > 0
+            )
+            return priced >= enough_listings
 
-        # Venue intel task
+        # Skip sites whose circuit is open (they keep failing or blocking us)
+        for site_name in self.sites:
+            if not self.circuit_breaker.allow(site_name):
+                retry_in = self.circuit_breaker.retry_in(site_name)
+                print(f"  Skipping {site_name}: circuit open (retry in {retry_in:.0f}s)")
+                skipped = SiteSearchResult(
+                    site_name=site_name,
+                    status=AgentStatus.SKIPPED,
+                    error_message=f"Skipped: site keeps failing (retry in {retry_in:.0f}s)",
+                )
+                search_results[site_name] = skipped
+                if on_progress:
+                    on_progress(SearchProgress(kind="site_result", data=skipped))
+
+        # Run all tasks in parallel: site search tasks plus the venue intel task
+        site_tasks = {
+            site_name: asyncio.create_task(search_site(site_name))
+            for site_name in self.sites
+            if site_name not in search_results
+        }
         venue_task = asyncio.create_task(get_venue_intel())
 
-        # Wait for all site searches
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        for result in results:
-            if isinstance(result, tuple):
-                site_name, site_result = result
-                search_results[site_name] = site_result
-            elif isinstance(result, Exception):
-                print(f"  [ERROR] Task failed: {result}")
-
-        # Wait for venue intel
+        # Wait for everything, or until the deadline / enough listings
+        loop = asyncio.get_running_loop()
+        pending = {*site_tasks.values(), venue_task}
         try:
-            venue_intel = await venue_task
-        except Exception as e:
-            print(f"  [ERROR] Venue intel failed: {e}")
-            venue_intel = VenueIntel(
-                venue_name="Unknown",
-                city=event_info.city,
-            )
+            while pending and not found_enough():
+                timeout = None if deadline_at is None else deadline_at - loop.time()
+                if timeout is not None and timeout <= 0:
+                    break
+                _, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+        except asyncio.CancelledError:
+            # The whole phase was cancelled - take every agent down with it
+            for task in pending:
+                task.cancel()
+            raise
+
+        # Cancel the stragglers and let their browsers shut down
+        reason = None
+        if pending:
+            reason = "enough listings found" if found_enough() else "search deadline reached"
+            print(f"  Cutting off {len(pending)} unfinished task(s): {reason}")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-        return search_results, venue_intel
+        # Process results
+        for site_name, task in site_tasks.items():
+            if site_name in search_results:
+                continue
+            if task.cancelled():
+                site_result = SiteSearchResult(
+                    site_name=site_name,
+                    status=AgentStatus.FAILED,
+                    error_message=f"Search cut off ({reason})",
+                )
+            else:
+                print(f"  [ERROR] Task failed: {task.exception()}")
+                site_result = SiteSearchResult(
+                    site_name=site_name,
+                    status=AgentStatus.FAILED,
+                    error_message=str(task.exception()),
+                )
+            search_results[site_name] = site_result
+            if on_progress:
+                on_progress(SearchProgress(kind="site_result", data=site_result))
+
+        # Collect venue intel (empty intel if it was cut off)
+        if venue_task.cancelled():
+            venue_intel = VenueIntel(venue_name="Unknown", city=event_info.city)
+            if on_progress:
+                on_progress(SearchProgress(kind="venue_intel", data=venue_intel))
+        else:
+            venue_intel = venue_task.result()
+
+        return search_results, venue_intel, reason
 
     async def _run_site_search(
-        self, site_name: str, event_info: EventInfo
+        self,
+        site_name: str,
+        event_info: EventInfo,
+        shared: Optional[SharedBrowser] = None,
     ) -> SiteSearchResult:
         """Run a single site search agent."""
-        agent = SiteSearchAgent(site_name=site_name, headless=self.headless)
+        agent = SiteSearchAgent(
+            site_name=site_name,
+            headless=self.headless,
+            shared_browser=shared,
+        )
         return await agent.run(event_info)
 
 
@@ -203,6 +592,12 @@ async def run_ticket_search(
     location: str = "",
     sites: Optional[list[str]] = None,
     headless: bool = False,
+    shared_browser: bool = SHARED_BROWSER,
+    venue_store=None,
+    pipelined: bool = PIPELINED_SEARCH,
+    priority: Priority = Priority.INTERACTIVE,
+    deadline: Optional[float] = None,
+    enough_listings: Optional[int] = None,
 ) -> OrchestratorResult:
     """
     Convenience function to run a ticket search.
@@ -212,9 +607,54 @@ async def run_ticket_search(
         location: City or location
         sites: List of sites to search (default: all)
         headless: Run browsers without UI (default: False)
+        shared_browser: Run site/venue agents as contexts in one Chromium process
+        venue_store: Optional durable VenueIntel store consulted before venue research
+        pipelined: Run research concurrently with the site searches
+        priority: Scheduling class for browser slots (interactive or batch)
+        deadline: Overall time budget in seconds; stragglers are cut off
+        enough_listings: Return early once this many priced listings are found
 
     Returns:
         OrchestratorResult with all findings
     """
-    orchestrator = TicketSearchOrchestrator(sites=sites, headless=headless)
-    return await orchestrator.search(query, location)
+    orchestrator = TicketSearchOrchestrator(
+        sites=sites,
+        headless=headless,
+        shared_browser=shared_browser,
+        venue_store=venue_store,
+        pipelined=pipelined,
+        priority=priority,
+    )
+    return await orchestrator.search(query, location, deadline, enough_listings)
+
+
+async def stream_ticket_search(
+    query: str,
+    location: str = "",
+    sites: Optional[list[str]] = None,
+    headless: bool = False,
+    shared_browser: bool = SHARED_BROWSER,
+    venue_store=None,
+    pipelined: bool = PIPELINED_SEARCH,
+    priority: Priority = Priority.INTERACTIVE,
+    deadline: Optional[float] = None,
+    enough_listings: Optional[int] = None,
+) -> AsyncIterator[SearchProgress]:
+    """
+    Convenience function to run a ticket search as a stream of progress events.
+
+    Takes the same arguments as run_ticket_search; see
+    TicketSearchOrchestrator.search_stream for the events yielded.
+    """
+    orchestrator = TicketSearchOrchestrator(
+        sites=sites,
+        headless=headless,
+        shared_browser=shared_browser,
+        venue_store=venue_store,
+        pipelined=pipelined,
+        priority=priority,
+    )
+    async for progress in orchestrator.search_stream(
+        query, location, deadline, enough_listings
+    ):
+        yield progress
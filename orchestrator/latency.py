@@ -0,0 +1,150 @@
+"""
+Site Latency Tracker: Adaptive per-site timeouts from observed search latency.
+
+Records how long each site's search takes when it completes and derives the
+site's timeout from a rolling percentile of those latencies, clamped to a
+floor and ceiling. A search that times out is recorded at its timeout (the
+latency was at least that), so a site that has slowed down pushes its
+percentile - and its timeout - up instead of timing out forever. Fast sites then fail fast when they hang, while slow sites
+(popups, many steps) keep the time they actually need. History is persisted
+to a small JSON file so timeouts survive restarts.
+"""
+
+import json
+import math
+import os
+from collections import deque
+from typing import Optional
+
+
+# Where latency history is kept between runs
+SITE_LATENCY_PATH = os.environ.get("SITE_LATENCY_PATH", "data/site_latency.json")
+
+# Rolling window of completed searches kept per site
+LATENCY_WINDOW = 50
+
+# Samples needed before a site gets an adaptive timeout
+LATENCY_MIN_SAMPLES = 5
+
+# Timeout = percentile latency x headroom, clamped to [floor, ceiling]
+LATENCY_PERCENTILE = 0.95
+LATENCY_HEADROOM = 1.5
+SITE_TIMEOUT_FLOOR = float(os.environ.get("SITE_TIMEOUT_FLOOR", "60"))
+SITE_TIMEOUT_CEILING = float(os.environ.get("SITE_TIMEOUT_CEILING", "600"))
+
+
+class SiteLatencyTracker:
+    """
+    Rolling per-site latency history with percentile-based timeouts.
+
+    Usage:
+        tracker = SiteLatencyTracker("data/site_latency.json")
+        timeout = tracker.timeout_for("ticketmaster", default=SITE_TIMEOUT)
+        ...
+        tracker.record("ticketmaster", elapsed)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = SITE_LATENCY_PATH,
+        window: int = LATENCY_WINDOW,
+        min_samples: int = LATENCY_MIN_SAMPLES,
+        percentile: float = LATENCY_PERCENTILE,
+        headroom: float = LATENCY_HEADROOM,
+        floor: float = SITE_TIMEOUT_FLOOR,
+        ceiling: float = SITE_TIMEOUT_CEILING,
+    ):
+        """
+        Args:
+            path: JSON file to persist history to (None keeps it in memory)
+            window: Latencies kept per site
+            min_samples: Samples needed before the default timeout is replaced
+            percentile: Latency percentile the timeout is based on (0-1)
+            headroom: Multiplier applied to the percentile latency
+            floor: Shortest timeout ever given to a site
+            ceiling: Longest timeout ever given to a site
+        """
+        self.path = path
+        self.window = window
+        self.min_samples = min_samples
+        self.percentile = percentile
+        self.headroom = headroom
+        self.floor = floor
+        self.ceiling = ceiling
+        self._samples: dict[str, deque[float]] = {}
+        self._load()
+
+    def record(self, site_name: str, seconds: float) -> None:
+        """Record the latency of a site search that completed."""
+        samples = self._samples.setdefault(site_name, deque(maxlen=self.window))
+        samples.append(round(seconds, 3))
+        self._save()
+
+    def record_timeout(self, site_name: str, timeout: float) -> None:
+        """Record a site search cut off by its timeout (a lower bound on its latency)."""
+        self.record(site_name, timeout)
+
+    def timeout_for(self, site_name: str, default: float) -> float:
+        """Timeout for a site's next search (default until enough history)."""
+        samples = self._samples.get(site_name)
+        if not samples or len(samples) < self.min_samples:
+            return default
+
+        latency = self._percentile(sorted(samples), self.percentile)
+        return min(self.ceiling, max(self.floor, latency * self.headroom))
+
+    def stats(self) -> dict[str, dict]:
+        """Per-site sample count, median and percentile latency."""
+        stats = {}
+        for site_name, samples in self._samples.items():
+            ordered = sorted(samples)
+            stats[site_name] = {
+                "samples": len(ordered),
+                "p50_seconds": self._percentile(ordered, 0.5),
+                "percentile_seconds": self._percentile(ordered, self.percentile),
+            }
+        return stats
+
+    @staticmethod
+    def _percentile(ordered: list[float], fraction: float) -> float:
+        """Nearest-rank percentile of an already sorted list."""
+        rank = max(1, math.ceil(fraction * len(ordered)))
+        return ordered[rank - 1]
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                history = json.load(f)
+            for site_name, samples in history.items():
+                self._samples[site_name] = deque(
+                    (float(s) for s in samples), maxlen=self.window
+                )
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"[SiteLatencyTracker] Ignoring unreadable history {self.path}: {e}")
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            # Write-then-rename so a crash never leaves a half-written file
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({site: list(s) for site, s in self._samples.items()}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[SiteLatencyTracker] Could not save history: {e}")
+
+
+_tracker: Optional[SiteLatencyTracker] = None
+
+
+def get_latency_tracker() -> SiteLatencyTracker:
+    """Get the process-wide site latency tracker."""
+    global _tracker
+    if _tracker is None:
+        _tracker = SiteLatencyTracker(SITE_LATENCY_PATH)
+    return _tracker
@@ -0,0 +1,166 @@
+"""
+Browser Slot Scheduler: Process-wide cap on concurrent browser sessions.
+
+Every orchestrator in the process takes a slot here before launching a
+browser, so the total browser count stays bounded no matter how many
+searches run at once. Waiting agents are served by priority class first
+(interactive before batch) and round-robin across requests within a class,
+so one large search cannot starve the others.
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, Optional
+
+
+# Browser sessions allowed at once across every search in the process
+MAX_BROWSER_SLOTS = int(os.environ.get("MAX_BROWSER_SLOTS", "4"))
+
+
+class Priority(IntEnum):
+    """Scheduling class of a search (lower value is served first)."""
+    INTERACTIVE = 0  # A user is waiting on the response
+    BATCH = 1  # Background jobs and prefetches
+
+
+class BrowserSlotScheduler:
+    """
+    Fair, priority-aware counting semaphore for browser sessions.
+
+    Usage:
+        async with scheduler.slot(request_id, Priority.INTERACTIVE):
+            ...  # launch and drive one browser
+    """
+
+    def __init__(self, capacity: int = MAX_BROWSER_SLOTS):
+        self.capacity = max(1, capacity)
+        self.in_use = 0
+        # priority -> request_id -> waiters, in round-robin order
+        self._waiting: dict[Priority, OrderedDict[str, deque[asyncio.Future]]] = {
+            priority: OrderedDict() for priority in Priority
+        }
+        self.granted = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @asynccontextmanager
+    async def slot(
+        self, request_id: str, priority: Priority = Priority.INTERACTIVE
+    ) -> AsyncIterator[None]:
+        """Hold one browser slot for the duration of the block."""
+        await self.acquire(request_id, priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(
+        self, request_id: str, priority: Priority = Priority.INTERACTIVE
+    ) -> None:
+        """Wait for a browser slot (call release() when done)."""
+        started = time.monotonic()
+
+        if self.in_use < self.capacity and not self.queue_depth():
+            self.in_use += 1
+            self._record_wait(started)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiting[priority].setdefault(request_id, deque()).append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted and cancelled at the same time - hand the slot on
+                self.release()
+            else:
+                self._remove_waiter(priority, request_id, waiter)
+            raise
+
+        self._record_wait(started)
+
+    def release(self) -> None:
+        """Return a slot and wake the next waiter."""
+        self.in_use -= 1
+        self._grant_next()
+
+    def queue_depth(self) -> int:
+        """Number of agents waiting for a slot."""
+        return sum(
+            len(waiters)
+            for requests in self._waiting.values()
+            for waiters in requests.values()
+        )
+
+    def stats(self) -> dict:
+        """Snapshot of slot usage, queue depth and wait times."""
+        return {
+            "capacity": self.capacity,
+            "in_use": self.in_use,
+            "queue_depth": self.queue_depth(),
+            "queued_by_priority": {
+                priority.name.lower(): sum(len(w) for w in requests.values())
+                for priority, requests in self._waiting.items()
+            },
+            "waiting_requests": sum(len(requests) for requests in self._waiting.values()),
+            "granted": self.granted,
+            "avg_wait_seconds": self.total_wait / self.granted if self.granted else 0.0,
+            "max_wait_seconds": self.max_wait,
+        }
+
+    def _grant_next(self) -> None:
+        """Hand free slots to waiters: best priority, then next request in turn."""
+        while self.in_use < self.capacity:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            self.in_use += 1
+            waiter.set_result(None)
+
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        for priority in Priority:
+            requests = self._waiting[priority]
+            while requests:
+                request_id, waiters = next(iter(requests.items()))
+                waiter = waiters.popleft()
+                # Rotate the request to the back of the line
+                del requests[request_id]
+                if waiters:
+                    requests[request_id] = waiters
+                if not waiter.done():
+                    return waiter
+        return None
+
+    def _remove_waiter(
+        self, priority: Priority, request_id: str, waiter: asyncio.Future
+    ) -> None:
+        waiters = self._waiting[priority].get(request_id)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            pass
+        if not waiters:
+            del self._waiting[priority][request_id]
+
+    def _record_wait(self, started: float) -> None:
+        waited = time.monotonic() - started
+        self.granted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+
+_scheduler: Optional[BrowserSlotScheduler] = None
+
+
+def get_browser_scheduler() -> BrowserSlotScheduler:
+    """Get the process-wide browser slot scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = BrowserSlotScheduler(MAX_BROWSER_SLOTS)
+    return _scheduler
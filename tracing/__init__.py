@@ -0,0 +1,23 @@
+from .spans import (
+    Span,
+    Tracer,
+    AgentStepTracer,
+    current_span,
+    get_tracer,
+    start_span,
+    trace_agent_steps,
+)
+from .exporters import SpanExporter, JsonlFileExporter, OtlpHttpExporter
+
+__all__ = [
+    "Span",
+    "Tracer",
+    "AgentStepTracer",
+    "current_span",
+    "get_tracer",
+    "start_span",
+    "trace_agent_steps",
+    "SpanExporter",
+    "JsonlFileExporter",
+    "OtlpHttpExporter",
+]
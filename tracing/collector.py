@@ -0,0 +1,119 @@
+"""
+Local stand-in for an OTLP collector.
+
+Accepts OTLP/HTTP JSON trace exports on /v1/traces and appends every span
+to a JSON-lines file, so traces can be inspected without running Jaeger or
+an OpenTelemetry Collector.
+
+Usage:
+    python -m tracing.collector                          # :4318 -> data/collected_traces.jsonl
+    python -m tracing.collector --port 4318 --out traces.jsonl
+
+Then point the app at it:
+    OTEL_EXPORTER_OTLP_ENDPOINT=http://localhost:4318
+"""
+
+import argparse
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _attribute_value(value: dict):
+    """Decode an OTLP AnyValue."""
+    if "intValue" in value:
+        return int(value["intValue"])
+    for key in ("stringValue", "boolValue", "doubleValue"):
+        if key in value:
+            return value[key]
+    return value
+
+
+def flatten_otlp_request(body: dict) -> list[dict]:
+    """Turn an OTLP ExportTraceServiceRequest into one flat dict per span."""
+    spans = []
+    for resource_spans in body.get("resourceSpans", []):
+        resource = {
+            a["key"]: _attribute_value(a["value"])
+            for a in resource_spans.get("resource", {}).get("attributes", [])
+        }
+        for scope_spans in resource_spans.get("scopeSpans", []):
+            for span in scope_spans.get("spans", []):
+                start = int(span.get("startTimeUnixNano", 0)) / 1e9
+                end = int(span.get("endTimeUnixNano", 0)) / 1e9
+                attributes = {
+                    a["key"]: _attribute_value(a["value"])
+                    for a in span.get("attributes", [])
+                }
+                spans.append({
+                    "service": resource.get("service.name", ""),
+                    "name": span.get("name", ""),
+                    "trace_id": span.get("traceId"),
+                    "span_id": span.get("spanId"),
+                    "parent_id": span.get("parentSpanId"),
+                    "correlation_id": attributes.pop("correlation_id", ""),
+                    "start_time": start,
+                    "end_time": end,
+                    "duration": round(end - start, 6),
+                    "attributes": attributes,
+                    "error": span.get("status", {}).get("message"),
+                })
+    return spans
+
+
+def make_handler(out_path: str):
+    """Request handler class writing received spans to out_path."""
+    lock = threading.Lock()
+
+    class CollectorHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path.rstrip("/") != "/v1/traces":
+                self.send_error(404)
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                spans = flatten_otlp_request(json.loads(self.rfile.read(length)))
+            except (ValueError, KeyError, TypeError) as e:
+                self.send_error(400, str(e))
+                return
+
+            with lock, open(out_path, "a") as f:
+                for span in spans:
+                    f.write(json.dumps(span) + "\n")
+            print(f"[collector] {len(spans)} spans -> {out_path}")
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, format, *args):
+            pass  # One line per batch above is enough
+
+    return CollectorHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OTLP/HTTP JSON trace collector")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4318)
+    parser.add_argument("--out", default="data/collected_traces.jsonl")
+    args = parser.parse_args()
+
+    directory = os.path.dirname(args.out)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.out))
+    print(f"[collector] Listening on http://{args.host}:{args.port}/v1/traces, writing {args.out}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
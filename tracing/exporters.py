@@ -0,0 +1,158 @@
+"""
+Span exporters: A local JSON-lines file and an OTLP/HTTP (JSON) collector.
+
+Exporters receive each span as it ends. The OTLP exporter batches spans on a
+background thread so a slow or missing collector never blocks a search.
+"""
+
+import json
+import os
+import queue
+import threading
+import urllib.request
+from typing import Any
+
+
+class SpanExporter:
+    """Receives finished spans."""
+
+    def export(self, span) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Flush anything buffered."""
+
+
+class JsonlFileExporter(SpanExporter):
+    """Appends each finished span to a file as one JSON line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock, open(self.path, "a") as f:
+            f.write(line + "\n")
+
+
+def _otlp_value(value: Any) -> dict:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, str):
+        return {"stringValue": value}
+    return {"stringValue": json.dumps(value, default=str)}
+
+
+def to_otlp_span(span) -> dict:
+    """Encode a span in the OTLP/JSON trace format."""
+    attributes = dict(span.attributes)
+    if span.correlation_id:
+        attributes["correlation_id"] = span.correlation_id
+    encoded = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(int(span.start_time * 1e9)),
+        "endTimeUnixNano": str(int((span.end_time or span.start_time) * 1e9)),
+        "attributes": [
+            {"key": key, "value": _otlp_value(value)}
+            for key, value in attributes.items()
+            if value is not None
+        ],
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+    }
+    if span.parent_id:
+        encoded["parentSpanId"] = span.parent_id
+    return encoded
+
+
+def to_otlp_request(spans: list, service_name: str = "showme") -> dict:
+    """Wrap spans in an OTLP ExportTraceServiceRequest body."""
+    return {
+        "resourceSpans": [{
+            "resource": {
+                "attributes": [{"key": "service.name", "value": {"stringValue": service_name}}],
+            },
+            "scopeSpans": [{
+                "scope": {"name": "showme.tracing"},
+                "spans": [to_otlp_span(span) for span in spans],
+            }],
+        }],
+    }
+
+
+class OtlpHttpExporter(SpanExporter):
+    """
+    Sends spans to an OTLP/HTTP collector as JSON (POST {endpoint}/v1/traces).
+
+    Spans are queued and sent in batches from a daemon thread. When the
+    queue is full (collector down for a long time) new spans are dropped.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str = "showme",
+        batch_size: int = 256,
+        flush_interval: float = 2.0,
+        max_queue: int = 10000,
+        timeout: float = 5.0,
+    ):
+        endpoint = endpoint.rstrip("/")
+        self.url = endpoint if endpoint.endswith("/v1/traces") else f"{endpoint}/v1/traces"
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=self.timeout + self.flush_interval)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+                while item is not None:
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    item = self._queue.get_nowait()
+                stopping = item is None
+            except queue.Empty:
+                pass
+            if batch:
+                self._send(batch)
+
+    def _send(self, spans: list) -> None:
+        body = json.dumps(to_otlp_request(spans, self.service_name), default=str).encode()
+        request = urllib.request.Request(
+            self.url, data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except Exception as e:
+            print(f"[tracing] Dropped {len(spans)} spans - OTLP export to {self.url} failed: {e}")
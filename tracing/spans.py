@@ -0,0 +1,205 @@
+"""
+Lightweight tracing: Spans with parent/child links, start/end and attributes.
+
+The current span lives in a context variable, so spans opened in a request
+handler are inherited by the orchestrator tasks and agents it starts. Agent
+and orchestrator steps (agents.instrumentation) become spans through an
+AgentHook, without agent code knowing about tracing. Every span carries the
+correlation id of the request that started its trace.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from agents.instrumentation import AgentHook, add_agent_hook
+from models import AgentStep
+
+from .exporters import JsonlFileExporter, OtlpHttpExporter, SpanExporter
+
+
+# Finished spans are appended here as JSON lines (optional)
+TRACE_FILE = os.environ.get("TRACE_FILE", "")
+
+# OTLP/HTTP collector to send spans to, e.g. http://localhost:4318 (optional)
+OTLP_ENDPOINT = os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", "")
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    correlation_id: str = ""
+    start_time: float = 0.0  # Unix seconds
+    end_time: Optional[float] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds from start to end (0 while the span is open)."""
+        return (self.end_time - self.start_time) if self.end_time else 0.0
+
+    def to_dict(self) -> dict:
+        """JSON-ready representation (one line of a trace file)."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "correlation_id": self.correlation_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": round(self.duration, 6),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    """The innermost open span in this context, if any."""
+    return _current_span.get()
+
+
+def _new_id(n_bytes: int) -> str:
+    return os.urandom(n_bytes).hex()
+
+
+class Tracer:
+    """Creates spans and hands finished ones to its exporters."""
+
+    def __init__(self, exporters: Optional[list[SpanExporter]] = None):
+        self.exporters = list(exporters or [])
+
+    def start(
+        self,
+        name: str,
+        parent: Optional[Span] = None,
+        correlation_id: Optional[str] = None,
+        start_time: Optional[float] = None,
+        **attributes: Any,
+    ) -> Span:
+        """
+        Open a span under parent (default: the current span).
+
+        A span without a parent starts a new trace. The correlation id is
+        inherited from the parent unless given.
+        """
+        if parent is None:
+            parent = _current_span.get()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else _new_id(16),
+            span_id=_new_id(8),
+            parent_id=parent.span_id if parent else None,
+            correlation_id=correlation_id if correlation_id is not None else (
+                parent.correlation_id if parent else ""
+            ),
+            start_time=start_time if start_time is not None else time.time(),
+            attributes=dict(attributes),
+        )
+
+    def end(self, span: Span, end_time: Optional[float] = None) -> None:
+        """Close a span and export it."""
+        span.end_time = end_time if end_time is not None else time.time()
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception as e:
+                print(f"[tracing] {type(exporter).__name__} failed: {e}")
+
+    @contextmanager
+    def span(self, name: str, correlation_id: Optional[str] = None, **attributes: Any) -> Iterator[Span]:
+        """
+        Open a span as the current span for the duration of a block.
+
+        Usage:
+            with get_tracer().span("search", query=query) as span:
+                ...
+                span.attributes["listings"] = 12
+        """
+        span = self.start(name, correlation_id=correlation_id, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except GeneratorExit:
+            raise  # A streaming consumer stopped early - not an error
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"[:200]
+            raise
+        finally:
+            _reset(token)
+            self.end(span)
+
+    def shutdown(self) -> None:
+        """Flush and close all exporters."""
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+
+def _reset(token) -> None:
+    """Restore the previous current span (async generators may resume in another context)."""
+    try:
+        _current_span.reset(token)
+    except ValueError:
+        pass
+
+
+class AgentStepTracer(AgentHook):
+    """Turns every instrumented agent and orchestrator step into a span."""
+
+    def __init__(self, tracer: Tracer):
+        self.tracer = tracer
+        self._open: dict[int, tuple[Span, Any]] = {}
+
+    def on_step_start(self, step: AgentStep) -> None:
+        span = self.tracer.start(f"{step.agent}.{step.kind}", start_time=step.started_at)
+        span.attributes.update(step.attributes, agent=step.agent)
+        self._open[id(step)] = (span, _current_span.set(span))
+
+    def on_step_end(self, step: AgentStep) -> None:
+        opened = self._open.pop(id(step), None)
+        if opened is None:
+            return
+        span, token = opened
+        _reset(token)
+        span.attributes.update(step.attributes)
+        span.error = step.attributes.get("error")
+        self.tracer.end(span, end_time=step.started_at + step.duration)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer, exporting to TRACE_FILE and/or OTEL_EXPORTER_OTLP_ENDPOINT."""
+    global _tracer
+    if _tracer is None:
+        exporters: list[SpanExporter] = []
+        if TRACE_FILE:
+            exporters.append(JsonlFileExporter(TRACE_FILE))
+        if OTLP_ENDPOINT:
+            exporters.append(OtlpHttpExporter(OTLP_ENDPOINT))
+        _tracer = Tracer(exporters)
+    return _tracer
+
+
+def trace_agent_steps(tracer: Optional[Tracer] = None) -> AgentStepTracer:
+    """Start tracing agent and orchestrator steps (returns the hook to remove later)."""
+    hook = AgentStepTracer(tracer or get_tracer())
+    add_agent_hook(hook)
+    return hook
+
+
+def start_span(name: str, correlation_id: Optional[str] = None, **attributes: Any):
+    """Open a span on the process-wide tracer (context manager)."""
+    return get_tracer().span(name, correlation_id=correlation_id, **attributes)